@@ -8,6 +8,7 @@ ImageDocumentオブジェクトの生成とディレクトリ内の一括読み
 import base64
 import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -259,16 +260,21 @@ class ImageProcessor:
         recursive: bool = False,
         auto_caption: Optional[bool] = None,
         include_base64: bool = False,
-        tags: Optional[list[str]] = None
+        tags: Optional[list[str]] = None,
+        max_workers: int = 1
     ) -> list[ImageDocument]:
         """ディレクトリ内の画像ファイルを一括読み込み
 
+        キャプション生成は画像ごとに独立したOllama呼び出しのため、
+        max_workersに2以上を指定すると複数の画像を並列に読み込みます。
+
         Args:
             dir_path: 読み込むディレクトリのパス
             recursive: サブディレクトリも再帰的に探索するか
             auto_caption: キャプションを自動生成するか（Noneの場合は設定値を使用）
             include_base64: Base64エンコードした画像データを含めるか
             tags: すべての画像に付与するタグのリスト
+            max_workers: 並列に読み込む画像数の上限（1の場合は逐次読み込み）
 
         Returns:
             list[ImageDocument]: 読み込んだ画像ドキュメントのリスト
@@ -313,23 +319,33 @@ class ImageProcessor:
         image_files = list(set(image_files))
         logger.info(f"Found {len(image_files)} image files")
 
-        # 各画像を読み込み
-        image_documents = []
-        failed_files = []
-
-        for i, image_file in enumerate(image_files, 1):
+        def load(i: int, image_file: Path) -> Optional[ImageDocument]:
             try:
                 logger.debug(f"Processing image {i}/{len(image_files)}: {image_file.name}")
-                image_doc = self.load_image(
+                return self.load_image(
                     image_file,
                     auto_caption=auto_caption,
                     include_base64=include_base64,
                     tags=tags
                 )
-                image_documents.append(image_doc)
             except Exception as e:
                 logger.error(f"Failed to load image '{image_file}': {e}")
-                failed_files.append(str(image_file))
+                return None
+
+        # 各画像を読み込み（結果は探索順を保持）
+        indices = range(1, len(image_files) + 1)
+        if max_workers > 1 and len(image_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(image_files))) as executor:
+                results = list(executor.map(load, indices, image_files))
+        else:
+            results = [load(i, image_file) for i, image_file in zip(indices, image_files)]
+
+        image_documents = [doc for doc in results if doc is not None]
+        failed_files = [
+            str(image_file)
+            for image_file, doc in zip(image_files, results)
+            if doc is None
+        ]
 
         # 結果のサマリー
         logger.info(
@@ -8,6 +8,7 @@ import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
+from uuid import uuid4
 
 import chromadb
 from chromadb.api.models.Collection import Collection
@@ -24,55 +25,80 @@ class ChromaVectorStore(BaseVectorStore):
     """ChromaDBベクトルストアの管理クラス
 
     PersistentClientを使用してデータの永続化を行います。
+    in_memoryを指定した場合（または設定のCHROMA_IN_MEMORYが有効な場合）は
+    EphemeralClientを使用し、データをメモリ上にのみ保持します。
+    メモリ上のクライアントは同一プロセス内で状態を共有するため、インスタンスごとに
+    専用のデータベースを作成し、同名のコレクションでも他のインスタンスと分離します。
     ドキュメントチャンクの追加、検索、削除、一覧取得などの操作を提供します。
 
     Attributes:
         config: アプリケーション設定
-        client: ChromaDB永続化クライアント
+        client: ChromaDBクライアント
         collection: 現在のChromaDBコレクション
         collection_name: コレクション名
+        in_memory: 永続化せずメモリ上のみで動作するか
     """
 
     def __init__(
         self,
         config: Config,
-        collection_name: str = "documents"
+        collection_name: str = "documents",
+        in_memory: bool = False
     ):
         """ChromaVectorStoreの初期化
 
         Args:
             config: アプリケーション設定
             collection_name: コレクション名（デフォルト: "documents"）
+            in_memory: Trueの場合は永続化ディレクトリを使わずメモリ上のみで動作する
+                （テストなど一時的な用途向け。config.chroma_in_memoryが有効な場合も同様）
         """
         super().__init__(config, collection_name)
-        self.client: Optional[chromadb.PersistentClient] = None
+        self.client: Optional[chromadb.ClientAPI] = None
         self.collection: Optional[Collection] = None
+        self.in_memory = in_memory or config.chroma_in_memory
+        # in_memoryの場合にこのインスタンス専用に作成したデータベース名
+        self._database: Optional[str] = None
 
     def initialize(self) -> None:
         """ChromaDBクライアントとコレクションの初期化
 
         永続化ディレクトリが存在しない場合は作成し、
         ChromaDBクライアントとコレクションを初期化します。
+        in_memoryの場合はディレクトリを作成せず、メモリ上のクライアントを使用します。
 
         Raises:
             VectorStoreError: 初期化に失敗した場合
         """
         try:
-            # ChromaDBディレクトリの作成
-            self.config.ensure_chroma_directory()
-            chroma_path = self.config.get_chroma_path()
-
-            logger.info(f"ChromaDBを初期化中: {chroma_path}")
-
-            # PersistentClientの作成
-            self.client = chromadb.PersistentClient(
-                path=str(chroma_path),
-                settings=Settings(
-                    anonymized_telemetry=False,
-                    allow_reset=True
-                )
+            settings = Settings(
+                anonymized_telemetry=False,
+                allow_reset=True
             )
 
+            if self.in_memory:
+                # インスタンス専用のデータベースを作成し、他のインスタンスと分離
+                database = f"rag_{uuid4().hex}"
+                logger.info(f"ChromaDBをメモリ上に初期化中 (データベース: {database})")
+                chromadb.AdminClient(settings).create_database(database)
+                self._database = database
+                self.client = chromadb.EphemeralClient(
+                    settings=settings,
+                    database=database
+                )
+            else:
+                # ChromaDBディレクトリの作成
+                self.config.ensure_chroma_directory()
+                chroma_path = self.config.get_chroma_path()
+
+                logger.info(f"ChromaDBを初期化中: {chroma_path}")
+
+                # PersistentClientの作成
+                self.client = chromadb.PersistentClient(
+                    path=str(chroma_path),
+                    settings=settings
+                )
+
             # コレクションの取得または作成
             self.collection = self.client.get_or_create_collection(
                 name=self.collection_name,
@@ -490,7 +516,9 @@ class ChromaVectorStore(BaseVectorStore):
                 'collection_name': self.collection_name,
                 'total_chunks': self.collection.count(),
                 'unique_documents': len(documents),
-                'persist_directory': str(self.config.get_chroma_path()),
+                'persist_directory': (
+                    None if self.in_memory else str(self.config.get_chroma_path())
+                ),
                 'metadata': self.collection.metadata
             }
 
@@ -976,8 +1004,16 @@ class ChromaVectorStore(BaseVectorStore):
         """ChromaDBクライアントを閉じる
 
         明示的なリソース解放が必要な場合に使用します。
+        in_memoryの場合は、このインスタンス専用のデータベースをコレクションごと削除します
+        （他のインスタンスのデータベースには影響しません）。
         """
         logger.info("ChromaDBクライアントをクローズしています...")
+        if self._database is not None:
+            try:
+                chromadb.AdminClient(self.client.get_settings()).delete_database(self._database)
+            except Exception as e:
+                logger.debug(f"データベース '{self._database}' の削除をスキップしました: {e}")
+            self._database = None
         self.collection = None
         self.client = None
 
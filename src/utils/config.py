@@ -4,10 +4,24 @@
 環境変数の読み込み、デフォルト設定の定義、設定値のバリデーションを行います。
 """
 
+import math
 import os
+import re
+from collections import ChainMap
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from dotenv import load_dotenv
+from dotenv import find_dotenv, load_dotenv
+
+# OLLAMA_BASE_URLのスキーム判定用パターン（モジュール読み込み時に一度だけコンパイル）
+_HTTP_URL_PATTERN = re.compile(r"https?://")
+
+# デフォルトで読み込む.envファイルのパス（モジュール読み込み時に一度だけ探索、見つからなければ空文字）
+_DOTENV_PATH = find_dotenv()
+
+# 真として扱う真偽値フラグの文字列（小文字・前後空白除去後に比較）
+_TRUTHY = frozenset({"1", "true", "yes", "on", "t", "y"})
 
 
 class ConfigError(Exception):
@@ -29,6 +43,7 @@ class Config:
     DEFAULT_OLLAMA_MULTIMODAL_LLM_MODEL = "gemma3"
     DEFAULT_OLLAMA_VISION_MODEL = "llava"
     DEFAULT_CHROMA_PERSIST_DIRECTORY = "./chroma_db"
+    DEFAULT_CHROMA_IN_MEMORY = False
     DEFAULT_CHUNK_SIZE = 1000
     DEFAULT_CHUNK_OVERLAP = 200
     DEFAULT_LOG_LEVEL = "INFO"
@@ -55,181 +70,253 @@ class Config:
     # Weaviate設定
     DEFAULT_WEAVIATE_URL = "http://localhost:8080"
 
+    # 設定項目のスキーマ（属性名, 型, デフォルト値）
+    # 環境変数名は属性名を大文字にしたもの。型がboolの項目は_coerce_boolで解釈する
+    _SCHEMA = (
+        # Ollama設定
+        ("ollama_base_url", str, DEFAULT_OLLAMA_BASE_URL),
+        ("ollama_llm_model", str, DEFAULT_OLLAMA_LLM_MODEL),
+        ("ollama_embedding_model", str, DEFAULT_OLLAMA_EMBEDDING_MODEL),
+        ("ollama_multimodal_llm_model", str, DEFAULT_OLLAMA_MULTIMODAL_LLM_MODEL),
+        ("ollama_vision_model", str, DEFAULT_OLLAMA_VISION_MODEL),
+        # ChromaDB設定
+        ("chroma_persist_directory", str, DEFAULT_CHROMA_PERSIST_DIRECTORY),
+        ("chroma_in_memory", bool, DEFAULT_CHROMA_IN_MEMORY),
+        # チャンク設定
+        ("chunk_size", int, DEFAULT_CHUNK_SIZE),
+        ("chunk_overlap", int, DEFAULT_CHUNK_OVERLAP),
+        # ログ設定
+        ("log_level", str, DEFAULT_LOG_LEVEL),
+        # 画像処理設定
+        ("image_caption_auto_generate", bool, DEFAULT_IMAGE_CAPTION_AUTO_GENERATE),
+        ("max_image_size_mb", float, DEFAULT_MAX_IMAGE_SIZE_MB),
+        ("image_resize_enabled", bool, DEFAULT_IMAGE_RESIZE_ENABLED),
+        ("image_resize_max_width", int, DEFAULT_IMAGE_RESIZE_MAX_WIDTH),
+        ("image_resize_max_height", int, DEFAULT_IMAGE_RESIZE_MAX_HEIGHT),
+        # マルチモーダル検索設定
+        ("multimodal_search_text_weight", float, DEFAULT_MULTIMODAL_SEARCH_TEXT_WEIGHT),
+        ("multimodal_search_image_weight", float, DEFAULT_MULTIMODAL_SEARCH_IMAGE_WEIGHT),
+        # ベクトルDB設定
+        ("vector_db_type", str, DEFAULT_VECTOR_DB_TYPE),
+        # Qdrant設定
+        ("qdrant_host", str, DEFAULT_QDRANT_HOST),
+        ("qdrant_port", int, DEFAULT_QDRANT_PORT),
+        ("qdrant_grpc_port", int, DEFAULT_QDRANT_GRPC_PORT),
+        ("qdrant_api_key", str, None),
+        # Milvus設定
+        ("milvus_host", str, DEFAULT_MILVUS_HOST),
+        ("milvus_port", int, DEFAULT_MILVUS_PORT),
+        ("milvus_user", str, None),
+        ("milvus_password", str, None),
+        # Weaviate設定
+        ("weaviate_url", str, DEFAULT_WEAVIATE_URL),
+        ("weaviate_api_key", str, None),
+    )
+
+    # to_dictで値をマスクする項目
+    _SECRET_FIELDS = frozenset({"qdrant_api_key", "milvus_password", "weaviate_api_key"})
+
+    # インスタンス属性（__dict__を持たせずメモリ使用量を抑える）
+    __slots__ = tuple(name for name, _, _ in _SCHEMA) + (
+        "_chroma_path",
+        "_chroma_path_source",
+        "_chroma_dir_ensured",
+    )
+
     # バリデーション用の定数
-    VALID_LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+    VALID_LOG_LEVELS_DISPLAY = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+    VALID_LOG_LEVELS = frozenset(VALID_LOG_LEVELS_DISPLAY)
     MIN_CHUNK_SIZE = 100
     MAX_CHUNK_SIZE = 10000
     MIN_CHUNK_OVERLAP = 0
+    VALID_VECTOR_DB_TYPES = ("chroma", "qdrant", "milvus", "weaviate")
 
-    def __init__(self, env_file: Optional[str] = None):
+    # バリデーションルール（対象項目, 条件, エラーメッセージ）の一覧
+    # メッセージは違反時にのみ str.format(c=設定インスタンス) で展開する
+    # 対象項目が複数のルールは項目間の組み合わせを検証する（validate_fieldでは実行しない）
+    _VALIDATORS = (
+        # URLバリデーション
+        (("ollama_base_url",),
+         lambda c: _HTTP_URL_PATTERN.match(c.ollama_base_url) is not None,
+         "OLLAMA_BASE_URL must start with http:// or https://, got: {c.ollama_base_url}"),
+        # モデル名バリデーション（空文字チェック）
+        (("ollama_llm_model",),
+         lambda c: bool(c.ollama_llm_model.strip()),
+         "OLLAMA_LLM_MODEL cannot be empty"),
+        (("ollama_embedding_model",),
+         lambda c: bool(c.ollama_embedding_model.strip()),
+         "OLLAMA_EMBEDDING_MODEL cannot be empty"),
+        # チャンクサイズバリデーション
+        (("chunk_size",),
+         lambda c: c.MIN_CHUNK_SIZE <= c.chunk_size <= c.MAX_CHUNK_SIZE,
+         "CHUNK_SIZE must be between {c.MIN_CHUNK_SIZE} and {c.MAX_CHUNK_SIZE}, "
+         "got: {c.chunk_size}"),
+        # チャンクオーバーラップバリデーション
+        (("chunk_overlap",),
+         lambda c: c.chunk_overlap >= c.MIN_CHUNK_OVERLAP,
+         "CHUNK_OVERLAP must be >= {c.MIN_CHUNK_OVERLAP}, got: {c.chunk_overlap}"),
+        (("chunk_overlap", "chunk_size"),
+         lambda c: c.chunk_overlap < c.chunk_size,
+         "CHUNK_OVERLAP ({c.chunk_overlap}) must be less than CHUNK_SIZE ({c.chunk_size})"),
+        # ログレベルバリデーション
+        (("log_level",),
+         lambda c: c.log_level in c.VALID_LOG_LEVELS,
+         f"LOG_LEVEL must be one of {list(VALID_LOG_LEVELS_DISPLAY)}, "
+         "got: {c.log_level}"),
+        # 画像サイズバリデーション
+        (("max_image_size_mb",),
+         lambda c: c.max_image_size_mb > 0,
+         "MAX_IMAGE_SIZE_MB must be greater than 0, got: {c.max_image_size_mb}"),
+        # 画像リサイズ設定バリデーション
+        (("image_resize_max_width",),
+         lambda c: c.image_resize_max_width > 0,
+         "IMAGE_RESIZE_MAX_WIDTH must be greater than 0, got: {c.image_resize_max_width}"),
+        (("image_resize_max_height",),
+         lambda c: c.image_resize_max_height > 0,
+         "IMAGE_RESIZE_MAX_HEIGHT must be greater than 0, got: {c.image_resize_max_height}"),
+        # マルチモーダル検索の重みバリデーション（範囲と合計）
+        (("multimodal_search_text_weight",),
+         lambda c: 0.0 <= c.multimodal_search_text_weight <= 1.0,
+         "MULTIMODAL_SEARCH_TEXT_WEIGHT must be between 0.0 and 1.0, "
+         "got: {c.multimodal_search_text_weight}"),
+        (("multimodal_search_image_weight",),
+         lambda c: 0.0 <= c.multimodal_search_image_weight <= 1.0,
+         "MULTIMODAL_SEARCH_IMAGE_WEIGHT must be between 0.0 and 1.0, "
+         "got: {c.multimodal_search_image_weight}"),
+        (("multimodal_search_text_weight", "multimodal_search_image_weight"),
+         lambda c: math.isclose(
+            c.multimodal_search_text_weight + c.multimodal_search_image_weight,
+            1.0, abs_tol=1e-6
+         ),
+         "MULTIMODAL_SEARCH_TEXT_WEIGHT + MULTIMODAL_SEARCH_IMAGE_WEIGHT must equal 1.0, "
+         "got: {c.multimodal_search_text_weight} + {c.multimodal_search_image_weight}"),
+        # ベクトルDB種別のバリデーション
+        (("vector_db_type",),
+         lambda c: c.vector_db_type in c.VALID_VECTOR_DB_TYPES,
+         f"VECTOR_DB_TYPE must be one of {list(VALID_VECTOR_DB_TYPES)}, "
+         "got: {c.vector_db_type}"),
+    )
+
+    def __init__(
+        self,
+        env_file: Optional[str] = None,
+        overrides: Optional[Mapping[str, str]] = None
+    ):
         """設定の初期化
 
         Args:
-            env_file: .envファイルのパス（省略時は.envを探索）
+            env_file: .envファイルのパス（省略時は探索済みの.envを使用）
+            overrides: 環境変数より優先する設定値（環境変数名をキーとする辞書）。
+                指定した場合は.envファイルを読み込まない
         """
-        # .envファイルの読み込み
-        if env_file:
-            load_dotenv(env_file)
+        if overrides is not None:
+            # .envファイルを読み込まず、指定値を環境変数より優先して参照
+            env: Mapping[str, str] = ChainMap(dict(overrides), os.environ)
         else:
-            # プロジェクトルートの.envを探索
-            load_dotenv()
+            # .envファイルの読み込み
+            if env_file:
+                load_dotenv(env_file)
+            elif _DOTENV_PATH:
+                # 探索済みのプロジェクトルートの.envを読み込み
+                load_dotenv(_DOTENV_PATH)
+            env = os.environ
+
+        # ChromaDBパスのキャッシュ（get_chroma_pathで遅延解決）
+        self._chroma_path: Optional[Path] = None
+        self._chroma_path_source: Optional[str] = None
+        self._chroma_dir_ensured = False
 
         # 設定値の読み込みとバリデーション
-        self._load_and_validate()
+        self._load_and_validate(env)
 
-    def _load_and_validate(self):
-        """環境変数から設定値を読み込み、バリデーションを実行"""
+    def _load_and_validate(self, env: Mapping[str, str]):
+        """環境変数から設定値を読み込み、バリデーションを実行
 
-        # Ollama設定
-        self.ollama_base_url = os.getenv(
-            "OLLAMA_BASE_URL",
-            self.DEFAULT_OLLAMA_BASE_URL
-        )
-        self.ollama_llm_model = os.getenv(
-            "OLLAMA_LLM_MODEL",
-            self.DEFAULT_OLLAMA_LLM_MODEL
-        )
-        self.ollama_embedding_model = os.getenv(
-            "OLLAMA_EMBEDDING_MODEL",
-            self.DEFAULT_OLLAMA_EMBEDDING_MODEL
-        )
-        self.ollama_multimodal_llm_model = os.getenv(
-            "OLLAMA_MULTIMODAL_LLM_MODEL",
-            self.DEFAULT_OLLAMA_MULTIMODAL_LLM_MODEL
-        )
-        self.ollama_vision_model = os.getenv(
-            "OLLAMA_VISION_MODEL",
-            self.DEFAULT_OLLAMA_VISION_MODEL
-        )
+        Args:
+            env: 設定値の参照元（通常はos.environ）
+        """
 
-        # ChromaDB設定
-        self.chroma_persist_directory = os.getenv(
-            "CHROMA_PERSIST_DIRECTORY",
-            self.DEFAULT_CHROMA_PERSIST_DIRECTORY
-        )
+        for name, typ, default in self._SCHEMA:
+            setattr(self, name, self._read(env, name, typ, default))
 
-        # チャンク設定
-        try:
-            self.chunk_size = int(os.getenv("CHUNK_SIZE", self.DEFAULT_CHUNK_SIZE))
-        except ValueError:
-            raise ConfigError(
-                f"CHUNK_SIZE must be an integer, got: {os.getenv('CHUNK_SIZE')}"
-            )
+        # バリデーション実行
+        self._validate()
 
-        try:
-            self.chunk_overlap = int(os.getenv("CHUNK_OVERLAP", self.DEFAULT_CHUNK_OVERLAP))
-        except ValueError:
-            raise ConfigError(
-                f"CHUNK_OVERLAP must be an integer, got: {os.getenv('CHUNK_OVERLAP')}"
-            )
+    @classmethod
+    def _read(cls, env: Mapping[str, str], name: str, typ: type, default):
+        """設定項目を1つ読み込み、型変換と大文字小文字の正規化を行う
 
-        # ログ設定
-        self.log_level = os.getenv("LOG_LEVEL", self.DEFAULT_LOG_LEVEL).upper()
+        Args:
+            env: 設定値の参照元
+            name: 設定項目の属性名（環境変数名は大文字にしたもの）
+            typ: 設定値の型
+            default: 環境変数が未設定の場合のデフォルト値
 
-        # 画像処理設定
-        self.image_caption_auto_generate = os.getenv(
-            "IMAGE_CAPTION_AUTO_GENERATE",
-            str(self.DEFAULT_IMAGE_CAPTION_AUTO_GENERATE)
-        ).lower() == "true"
+        Returns:
+            変換後の値
 
-        try:
-            self.max_image_size_mb = float(os.getenv(
-                "MAX_IMAGE_SIZE_MB",
-                str(self.DEFAULT_MAX_IMAGE_SIZE_MB)
-            ))
-        except ValueError:
-            raise ConfigError(
-                f"MAX_IMAGE_SIZE_MB must be a number, got: {os.getenv('MAX_IMAGE_SIZE_MB')}"
-            )
+        Raises:
+            ConfigError: 値を指定の型に変換できない場合
+        """
+        key = name.upper()
+        if typ is str:
+            value = env.get(key, default)
+        elif typ is bool:
+            value = cls._coerce_bool(env, key, default)
+        else:
+            value = cls._coerce(env, key, default, typ)
 
-        self.image_resize_enabled = os.getenv(
-            "IMAGE_RESIZE_ENABLED",
-            str(self.DEFAULT_IMAGE_RESIZE_ENABLED)
-        ).lower() == "true"
+        # 大文字小文字の正規化
+        if name == "log_level":
+            value = value.upper()
+        elif name == "vector_db_type":
+            value = value.lower()
+        return value
 
-        try:
-            self.image_resize_max_width = int(os.getenv(
-                "IMAGE_RESIZE_MAX_WIDTH",
-                str(self.DEFAULT_IMAGE_RESIZE_MAX_WIDTH)
-            ))
-        except ValueError:
-            raise ConfigError(
-                f"IMAGE_RESIZE_MAX_WIDTH must be an integer, got: {os.getenv('IMAGE_RESIZE_MAX_WIDTH')}"
-            )
+    @staticmethod
+    def _coerce(env: Mapping[str, str], key: str, default, typ: type):
+        """環境変数を指定の型に変換して取得
 
-        try:
-            self.image_resize_max_height = int(os.getenv(
-                "IMAGE_RESIZE_MAX_HEIGHT",
-                str(self.DEFAULT_IMAGE_RESIZE_MAX_HEIGHT)
-            ))
-        except ValueError:
-            raise ConfigError(
-                f"IMAGE_RESIZE_MAX_HEIGHT must be an integer, got: {os.getenv('IMAGE_RESIZE_MAX_HEIGHT')}"
-            )
+        Args:
+            env: 設定値の参照元
+            key: 環境変数名
+            default: 環境変数が未設定の場合のデフォルト値
+            typ: 変換先の型（intまたはfloat）
 
-        # マルチモーダル検索設定
-        try:
-            self.multimodal_search_text_weight = float(os.getenv(
-                "MULTIMODAL_SEARCH_TEXT_WEIGHT",
-                str(self.DEFAULT_MULTIMODAL_SEARCH_TEXT_WEIGHT)
-            ))
-        except ValueError:
-            raise ConfigError(
-                f"MULTIMODAL_SEARCH_TEXT_WEIGHT must be a number, got: {os.getenv('MULTIMODAL_SEARCH_TEXT_WEIGHT')}"
-            )
+        Returns:
+            変換後の値（未設定の場合はdefault）
 
+        Raises:
+            ConfigError: 値を指定の型に変換できない場合
+        """
+        raw = env.get(key)
+        if raw is None:
+            return typ(default)
         try:
-            self.multimodal_search_image_weight = float(os.getenv(
-                "MULTIMODAL_SEARCH_IMAGE_WEIGHT",
-                str(self.DEFAULT_MULTIMODAL_SEARCH_IMAGE_WEIGHT)
-            ))
+            return typ(raw)
         except ValueError:
-            raise ConfigError(
-                f"MULTIMODAL_SEARCH_IMAGE_WEIGHT must be a number, got: {os.getenv('MULTIMODAL_SEARCH_IMAGE_WEIGHT')}"
-            )
+            expected = "an integer" if typ is int else "a number"
+            raise ConfigError(f"{key} must be {expected}, got: {raw}")
 
-        # ベクトルDB種別
-        self.vector_db_type = os.getenv(
-            "VECTOR_DB_TYPE",
-            self.DEFAULT_VECTOR_DB_TYPE
-        ).lower()
+    @staticmethod
+    def _coerce_bool(env: Mapping[str, str], key: str, default: bool) -> bool:
+        """環境変数を真偽値として取得
 
-        # Qdrant設定
-        self.qdrant_host = os.getenv("QDRANT_HOST", self.DEFAULT_QDRANT_HOST)
-        try:
-            self.qdrant_port = int(os.getenv("QDRANT_PORT", str(self.DEFAULT_QDRANT_PORT)))
-        except ValueError:
-            raise ConfigError(
-                f"QDRANT_PORT must be an integer, got: {os.getenv('QDRANT_PORT')}"
-            )
-        try:
-            self.qdrant_grpc_port = int(os.getenv(
-                "QDRANT_GRPC_PORT",
-                str(self.DEFAULT_QDRANT_GRPC_PORT)
-            ))
-        except ValueError:
-            raise ConfigError(
-                f"QDRANT_GRPC_PORT must be an integer, got: {os.getenv('QDRANT_GRPC_PORT')}"
-            )
-        self.qdrant_api_key = os.getenv("QDRANT_API_KEY")
-
-        # Milvus設定
-        self.milvus_host = os.getenv("MILVUS_HOST", self.DEFAULT_MILVUS_HOST)
-        try:
-            self.milvus_port = int(os.getenv("MILVUS_PORT", str(self.DEFAULT_MILVUS_PORT)))
-        except ValueError:
-            raise ConfigError(
-                f"MILVUS_PORT must be an integer, got: {os.getenv('MILVUS_PORT')}"
-            )
-        self.milvus_user = os.getenv("MILVUS_USER")
-        self.milvus_password = os.getenv("MILVUS_PASSWORD")
+        前後の空白を除去し大文字小文字を区別せずに判定します。
+        "1", "true", "yes", "on", "t", "y" を真、それ以外を偽とみなします。
 
-        # Weaviate設定
-        self.weaviate_url = os.getenv("WEAVIATE_URL", self.DEFAULT_WEAVIATE_URL)
-        self.weaviate_api_key = os.getenv("WEAVIATE_API_KEY")
+        Args:
+            env: 設定値の参照元
+            key: 環境変数名
+            default: 環境変数が未設定の場合のデフォルト値
 
-        # バリデーション実行
-        self._validate()
+        Returns:
+            bool: 変換後の値
+        """
+        raw = env.get(key)
+        if raw is None:
+            return default
+        return raw.strip().lower() in _TRUTHY
 
     def _validate(self):
         """設定値のバリデーション
@@ -237,100 +324,62 @@ class Config:
         Raises:
             ConfigError: 設定値が不正な場合
         """
-        # URLバリデーション
-        if not self.ollama_base_url.startswith(("http://", "https://")):
-            raise ConfigError(
-                f"OLLAMA_BASE_URL must start with http:// or https://, "
-                f"got: {self.ollama_base_url}"
-            )
+        for _, is_valid, message in self._VALIDATORS:
+            if not is_valid(self):
+                raise ConfigError(message.format(c=self))
 
-        # モデル名バリデーション（空文字チェック）
-        if not self.ollama_llm_model.strip():
-            raise ConfigError("OLLAMA_LLM_MODEL cannot be empty")
+    @classmethod
+    def validate_field(cls, name: str, value) -> None:
+        """単一の設定項目を検証
 
-        if not self.ollama_embedding_model.strip():
-            raise ConfigError("OLLAMA_EMBEDDING_MODEL cannot be empty")
-
-        # チャンクサイズバリデーション
-        if self.chunk_size < self.MIN_CHUNK_SIZE or self.chunk_size > self.MAX_CHUNK_SIZE:
-            raise ConfigError(
-                f"CHUNK_SIZE must be between {self.MIN_CHUNK_SIZE} and {self.MAX_CHUNK_SIZE}, "
-                f"got: {self.chunk_size}"
-            )
-
-        # チャンクオーバーラップバリデーション
-        if self.chunk_overlap < self.MIN_CHUNK_OVERLAP:
-            raise ConfigError(
-                f"CHUNK_OVERLAP must be >= {self.MIN_CHUNK_OVERLAP}, "
-                f"got: {self.chunk_overlap}"
-            )
-
-        if self.chunk_overlap >= self.chunk_size:
-            raise ConfigError(
-                f"CHUNK_OVERLAP ({self.chunk_overlap}) must be less than "
-                f"CHUNK_SIZE ({self.chunk_size})"
-            )
-
-        # ログレベルバリデーション
-        if self.log_level not in self.VALID_LOG_LEVELS:
-            raise ConfigError(
-                f"LOG_LEVEL must be one of {self.VALID_LOG_LEVELS}, "
-                f"got: {self.log_level}"
-            )
+        .envファイルや環境変数は読み込まず、環境変数からの読み込みと同じ型変換を行い、
+        その項目だけを対象とするバリデーションルールを実行します。
+        他の項目との組み合わせを検証するルール（CHUNK_OVERLAPとCHUNK_SIZEの大小、
+        マルチモーダル検索の重みの合計）は、Configの作成時にのみ検証されます。
 
-        # 画像サイズバリデーション
-        if self.max_image_size_mb <= 0:
-            raise ConfigError(
-                f"MAX_IMAGE_SIZE_MB must be greater than 0, "
-                f"got: {self.max_image_size_mb}"
-            )
+        Args:
+            name: 設定項目の属性名（例: "chunk_size"）
+            value: 検証する値（環境変数と同様に文字列として解釈）
 
-        # 画像リサイズ設定バリデーション
-        if self.image_resize_max_width <= 0:
-            raise ConfigError(
-                f"IMAGE_RESIZE_MAX_WIDTH must be greater than 0, "
-                f"got: {self.image_resize_max_width}"
-            )
-
-        if self.image_resize_max_height <= 0:
-            raise ConfigError(
-                f"IMAGE_RESIZE_MAX_HEIGHT must be greater than 0, "
-                f"got: {self.image_resize_max_height}"
-            )
-
-        # マルチモーダル検索の重みバリデーション
-        if not (0.0 <= self.multimodal_search_text_weight <= 1.0):
-            raise ConfigError(
-                f"MULTIMODAL_SEARCH_TEXT_WEIGHT must be between 0.0 and 1.0, "
-                f"got: {self.multimodal_search_text_weight}"
-            )
-
-        if not (0.0 <= self.multimodal_search_image_weight <= 1.0):
-            raise ConfigError(
-                f"MULTIMODAL_SEARCH_IMAGE_WEIGHT must be between 0.0 and 1.0, "
-                f"got: {self.multimodal_search_image_weight}"
-            )
+        Raises:
+            ConfigError: 値が不正な場合、または存在しない設定項目の場合
+        """
+        for field, typ, default in cls._SCHEMA:
+            if field == name:
+                break
+        else:
+            raise ConfigError(f"Unknown config field: {name}")
 
-        # ベクトルDB種別のバリデーション
-        valid_db_types = ["chroma", "qdrant", "milvus", "weaviate"]
-        if self.vector_db_type not in valid_db_types:
-            raise ConfigError(
-                f"VECTOR_DB_TYPE must be one of {valid_db_types}, "
-                f"got: {self.vector_db_type}"
-            )
+        view = _FieldView(name, cls._read({name.upper(): str(value)}, name, typ, default))
+        for fields, is_valid, message in cls._VALIDATORS:
+            if fields == (name,) and not is_valid(view):
+                raise ConfigError(message.format(c=view))
 
     def get_chroma_path(self) -> Path:
         """ChromaDBの永続化ディレクトリパスを取得
 
+        解決済みのパスはchroma_persist_directoryの値ごとにキャッシュされ、
+        値が変更された場合のみ再解決します。
+
         Returns:
             Path: ChromaDBディレクトリのPathオブジェクト
         """
-        return Path(self.chroma_persist_directory).resolve()
+        if self._chroma_path_source != self.chroma_persist_directory:
+            self._chroma_path = Path(self.chroma_persist_directory).resolve()
+            self._chroma_path_source = self.chroma_persist_directory
+            self._chroma_dir_ensured = False
+        return self._chroma_path
 
     def ensure_chroma_directory(self):
-        """ChromaDBディレクトリが存在しない場合は作成"""
+        """ChromaDBディレクトリが存在しない場合は作成
+
+        同じパスに対しては初回呼び出し時のみmkdirを実行します。
+        """
         chroma_path = self.get_chroma_path()
+        if self._chroma_dir_ensured:
+            return
         chroma_path.mkdir(parents=True, exist_ok=True)
+        self._chroma_dir_ensured = True
 
     def to_dict(self) -> dict:
         """設定値を辞書形式で取得
@@ -338,43 +387,19 @@ class Config:
         Returns:
             dict: 全設定値
         """
-        return {
-            "ollama_base_url": self.ollama_base_url,
-            "ollama_llm_model": self.ollama_llm_model,
-            "ollama_embedding_model": self.ollama_embedding_model,
-            "ollama_multimodal_llm_model": self.ollama_multimodal_llm_model,
-            "ollama_vision_model": self.ollama_vision_model,
-            "chroma_persist_directory": self.chroma_persist_directory,
-            "chunk_size": self.chunk_size,
-            "chunk_overlap": self.chunk_overlap,
-            "log_level": self.log_level,
-            "image_caption_auto_generate": self.image_caption_auto_generate,
-            "max_image_size_mb": self.max_image_size_mb,
-            "image_resize_enabled": self.image_resize_enabled,
-            "image_resize_max_width": self.image_resize_max_width,
-            "image_resize_max_height": self.image_resize_max_height,
-            "multimodal_search_text_weight": self.multimodal_search_text_weight,
-            "multimodal_search_image_weight": self.multimodal_search_image_weight,
-
-            # ベクトルDB設定
-            "vector_db_type": self.vector_db_type,
-
-            # Qdrant設定
-            "qdrant_host": self.qdrant_host,
-            "qdrant_port": self.qdrant_port,
-            "qdrant_grpc_port": self.qdrant_grpc_port,
-            "qdrant_api_key": "***" if self.qdrant_api_key else None,
-
-            # Milvus設定
-            "milvus_host": self.milvus_host,
-            "milvus_port": self.milvus_port,
-            "milvus_user": self.milvus_user,
-            "milvus_password": "***" if self.milvus_password else None,
-
-            # Weaviate設定
-            "weaviate_url": self.weaviate_url,
-            "weaviate_api_key": "***" if self.weaviate_api_key else None,
-        }
+        result = {}
+        for name, _, _ in self._SCHEMA:
+            value = getattr(self, name)
+            if name in self._SECRET_FIELDS:
+                # 機密情報はマスクして出力
+                value = "***" if value else None
+            result[name] = value
+        return result
+
+    def __str__(self) -> str:
+        """設定の1行形式の文字列表現（ログ出力向け）"""
+        config_str = ", ".join(f"{k}={v}" for k, v in self.to_dict().items())
+        return f"Config({config_str})"
 
     def __repr__(self) -> str:
         """設定の文字列表現"""
@@ -383,23 +408,51 @@ class Config:
         return f"Config(\n{config_str}\n)"
 
 
-# グローバル設定インスタンス（シングルトンパターン）
-_config_instance: Optional[Config] = None
+class _FieldView:
+    """単一項目のバリデーション用ビュー
+
+    指定した項目の値を返し、それ以外の属性（MIN_CHUNK_SIZEなどの定数）は
+    Configのクラス属性を参照します。
+    """
+
+    __slots__ = ("_name", "_value")
+
+    def __init__(self, name: str, value):
+        self._name = name
+        self._value = value
+
+    def __getattr__(self, attr: str):
+        if attr == self._name:
+            return self._value
+        return getattr(Config, attr)
+
+
+@lru_cache(maxsize=4)
+def _build_config(env_file: Optional[str]) -> Config:
+    """env_fileごとに設定インスタンスを生成してキャッシュ
+
+    Args:
+        env_file: .envファイルのパス（Noneの場合は探索済みの.envを使用）
+
+    Returns:
+        Config: 設定インスタンス
+    """
+    return Config(env_file)
 
 
 def get_config(env_file: Optional[str] = None, reload: bool = False) -> Config:
     """設定インスタンスを取得
 
+    同じenv_fileに対しては同一のインスタンスを返します（シングルトンパターン）。
+
     Args:
-        env_file: .envファイルのパス（省略時は.envを探索）
-        reload: Trueの場合、設定を再読み込み
+        env_file: .envファイルのパス（省略時は探索済みの.envを使用）
+        reload: Trueの場合、キャッシュを破棄して設定を再読み込み
 
     Returns:
         Config: 設定インスタンス
     """
-    global _config_instance
-
-    if _config_instance is None or reload:
-        _config_instance = Config(env_file)
+    if reload:
+        _build_config.cache_clear()
 
-    return _config_instance
+    return _build_config(env_file)
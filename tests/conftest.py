@@ -3,49 +3,113 @@
 ユニットテストと統合テストで共有されるfixtureを定義します。
 """
 
+import logging
+import os
+import shutil
+import struct
+import subprocess
+import time
+import zlib
 import pytest
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 from unittest.mock import Mock
-import tempfile
-import shutil
 
 from src.utils.config import Config
 from src.models.document import Document, Chunk, ImageDocument
 
+logger = logging.getLogger(__name__)
 
-@pytest.fixture
-def sample_config(tmp_path):
+
+# 統合テスト用サンプルテキスト（UTF-8エンコードはインポート時に一度だけ実施）
+_SAMPLE_TEXT_FILES = {
+    # サンプルファイル1: Python について
+    "python": ("python_intro.txt", """Pythonは、1991年にGuido van Rossumによって開発されたプログラミング言語です。
+Pythonはシンプルで読みやすい構文が特徴で、初心者にも学びやすい言語として人気があります。
+データサイエンス、機械学習、Web開発など、幅広い分野で使用されています。
+""".encode("utf-8")),
+    # サンプルファイル2: RAGについて
+    "rag": ("rag_overview.txt", """RAG（Retrieval-Augmented Generation）は、検索と生成を組み合わせたAI技術です。
+大規模言語モデルに外部知識を組み込むことで、より正確で最新の情報を提供できます。
+RAGシステムは、ベクトルデータベースを使用してドキュメントを検索し、その結果を基に回答を生成します。
+""".encode("utf-8")),
+    # サンプルファイル3: LLMについて
+    "llm": ("llm_basics.txt", """LLM（Large Language Model）は、大量のテキストデータで訓練された大規模な言語モデルです。
+GPT、Claude、Llama などが代表的なLLMです。
+LLMは自然言語理解、文章生成、翻訳、要約など、様々なタスクに利用できます。
+""".encode("utf-8")),
+}
+
+
+# モック埋め込みベクトル（不変のタプルとして全fixtureで共有）
+_EMBEDDING_768_A = (0.1,) * 768
+_EMBEDDING_768_B = (0.2,) * 768
+_EMBEDDING_512_A = (0.1,) * 512
+_EMBEDDING_512_B = (0.2,) * 512
+
+
+# テスト用の設定値（CHROMA_PERSIST_DIRECTORYはfixtureごとに設定）
+_SAMPLE_ENV = {
+    "OLLAMA_BASE_URL": "http://localhost:11434",
+    "OLLAMA_LLM_MODEL": "llama3.2",
+    "OLLAMA_EMBEDDING_MODEL": "nomic-embed-text",
+    "CHUNK_SIZE": "1000",
+    "CHUNK_OVERLAP": "200",
+    "LOG_LEVEL": "INFO",
+}
+
+# 統合テスト用の設定値（CHROMA_PERSIST_DIRECTORYはfixtureごとに設定）
+_INTEGRATION_ENV = {
+    "OLLAMA_BASE_URL": "http://localhost:11434",
+    "OLLAMA_LLM_MODEL": "gpt-oss:latest",
+    "OLLAMA_EMBEDDING_MODEL": "nomic-embed-text",
+    "CHUNK_SIZE": "500",
+    "CHUNK_OVERLAP": "100",
+    "LOG_LEVEL": "DEBUG",
+}
+
+
+@pytest.fixture(scope="session")
+def sample_config(tmp_path_factory):
     """テスト用設定
 
+    セッションごとに一度だけ生成し、全テストで同一インスタンスを共有します。
+    テスト内で変更しないこと（変更が必要な場合はcopy.copyで複製する）。
+
     Args:
-        tmp_path: pytestが提供する一時ディレクトリ
+        tmp_path_factory: pytestが提供する一時ディレクトリファクトリ
 
     Returns:
         Config: テスト用のConfig オブジェクト
     """
-    # 一時的なChromaDBディレクトリを作成
-    chroma_dir = tmp_path / "test_chroma_db"
-    chroma_dir.mkdir(exist_ok=True)
+    return _make_config(_SAMPLE_ENV, tmp_path_factory.mktemp("test_chroma_db"))
+
 
-    # 環境変数をオーバーライドするために、テスト用の.envファイルを作成
-    env_file = tmp_path / "test.env"
-    env_file.write_text(f"""
-OLLAMA_BASE_URL=http://localhost:11434
-OLLAMA_LLM_MODEL=llama3.2
-OLLAMA_EMBEDDING_MODEL=nomic-embed-text
-CHROMA_PERSIST_DIRECTORY={chroma_dir}
-CHUNK_SIZE=1000
-CHUNK_OVERLAP=200
-LOG_LEVEL=INFO
-""")
+@pytest.fixture(scope="session")
+def empty_env_file(tmp_path_factory):
+    """セッションで一度だけ作成する空の.envファイル
 
-    return Config(env_file=str(env_file))
+    Configに渡すことで、プロジェクトの.envが読み込まれないようにします。
 
+    Args:
+        tmp_path_factory: pytestが提供する一時ディレクトリファクトリ
 
-@pytest.fixture
+    Returns:
+        str: 空の.envファイルのパス
+    """
+    env_file = tmp_path_factory.mktemp("cfg") / "empty.env"
+    env_file.write_text("")
+    return str(env_file)
+
+
+@pytest.fixture(scope="session")
 def sample_document():
     """テスト用Documentオブジェクト
 
+    セッション全体で同一インスタンスを共有するため、テスト内で変更しないこと。
+
     Returns:
         Document: サンプルのDocumentオブジェクト
     """
@@ -57,10 +121,12 @@ def sample_document():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_chunks():
     """テスト用Chunkリスト
 
+    セッション全体で同一インスタンスを共有するため、テスト内で変更しないこと。
+
     Returns:
         list[Chunk]: サンプルのChunkオブジェクトのリスト
     """
@@ -97,9 +163,9 @@ def mock_embeddings(mocker):
     """
     mock = mocker.Mock()
     # embed_query は単一のベクトルを返す
-    mock.embed_query.return_value = [0.1] * 768
+    mock.embed_query.return_value = _EMBEDDING_768_A
     # embed_documents は複数のベクトルを返す
-    mock.embed_documents.return_value = [[0.1] * 768, [0.2] * 768]
+    mock.embed_documents.return_value = [_EMBEDDING_768_A, _EMBEDDING_768_B]
     # get_embedding_dimension は次元数を返す
     mock.get_embedding_dimension.return_value = 768
     return mock
@@ -127,31 +193,77 @@ def mock_vector_store(mocker):
     return mock
 
 
+@pytest.fixture(scope="session")
+def pypdf2_module():
+    """PyPDF2モジュール（セッションで一度だけインポート）
+
+    Returns:
+        module: PyPDF2モジュール
+    """
+    import PyPDF2
+    return PyPDF2
+
+
+@pytest.fixture
+def mock_pdf_reader(pypdf2_module, monkeypatch):
+    """PyPDF2.PdfReaderをモックに差し替えるファクトリ
+
+    差し替えはmonkeypatchによりテスト終了時に自動で元に戻ります。
+
+    Args:
+        pypdf2_module: PyPDF2モジュール
+        monkeypatch: pytestのMonkeyPatch
+
+    Returns:
+        Callable[[str, int], Mock]: ページのテキストとページ数を受け取り、
+            PdfReaderが返すモックのリーダーを返す関数
+    """
+    def _make(text_per_page: str, n_pages: int = 1) -> Mock:
+        page = Mock()
+        page.extract_text.return_value = text_per_page
+        reader = Mock()
+        reader.pages = [page] * n_pages
+        monkeypatch.setattr(pypdf2_module, "PdfReader", lambda *args, **kwargs: reader)
+        return reader
+
+    return _make
+
+
 @pytest.fixture
 def temp_chroma_db(tmp_path):
     """一時的なChromaDBディレクトリ
 
     統合テストで実際のChromaDBを使用する際に利用します。
-    テスト終了後に自動的にクリーンアップされます。
+    削除はpytestのtmp_pathの保持ポリシーに任せます。
 
     Args:
         tmp_path: pytestが提供する一時ディレクトリ
 
-    Yields:
+    Returns:
         Path: ChromaDBの永続化ディレクトリパス
     """
     chroma_path = tmp_path / "integration_test_chroma_db"
     chroma_path.mkdir(exist_ok=True)
+    return chroma_path
+
 
-    yield chroma_path
+def _make_config(env: dict[str, str], chroma_dir: Path) -> Config:
+    """指定した設定値でConfigを生成する
+
+    .envファイルの読み込みやos.environの変更は行いません。
+
+    Args:
+        env: 環境変数名と値の辞書
+        chroma_dir: ChromaDBの永続化ディレクトリ
 
-    # クリーンアップ
-    if chroma_path.exists():
-        shutil.rmtree(chroma_path)
+    Returns:
+        Config: 生成したConfigオブジェクト
+    """
+    return Config(overrides={**env, "CHROMA_PERSIST_DIRECTORY": str(chroma_dir)})
 
 
 @pytest.fixture
-def integration_config(temp_chroma_db, tmp_path, monkeypatch):
+def integration_config(temp_chroma_db):
     """統合テスト用の設定
 
     実際のChromaDBを使用するための設定を作成します。
@@ -159,78 +271,403 @@ def integration_config(temp_chroma_db, tmp_path, monkeypatch):
 
     Args:
         temp_chroma_db: 一時的なChromaDBディレクトリ
-        tmp_path: pytestが提供する一時ディレクトリ
-        monkeypatch: 環境変数を上書きするためのfixture
 
     Returns:
         Config: 統合テスト用のConfigオブジェクト
     """
-    # 環境変数を直接設定して、既存の設定をオーバーライド
-    monkeypatch.setenv("OLLAMA_BASE_URL", "http://localhost:11434")
-    monkeypatch.setenv("OLLAMA_LLM_MODEL", "gpt-oss:latest")
-    monkeypatch.setenv("OLLAMA_EMBEDDING_MODEL", "nomic-embed-text")
-    monkeypatch.setenv("CHROMA_PERSIST_DIRECTORY", str(temp_chroma_db))
-    monkeypatch.setenv("CHUNK_SIZE", "500")
-    monkeypatch.setenv("CHUNK_OVERLAP", "100")
-    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
-
-    env_file = tmp_path / "integration_test.env"
-    env_file.write_text(f"""
-OLLAMA_BASE_URL=http://localhost:11434
-OLLAMA_LLM_MODEL=gpt-oss:latest
-OLLAMA_EMBEDDING_MODEL=nomic-embed-text
-CHROMA_PERSIST_DIRECTORY={temp_chroma_db}
-CHUNK_SIZE=500
-CHUNK_OVERLAP=100
-LOG_LEVEL=DEBUG
-""")
-
-    return Config(env_file=str(env_file))
+    return _make_config(_INTEGRATION_ENV, temp_chroma_db)
+
+
+@pytest.fixture(scope="session")
+def integration_session_config(tmp_path_factory):
+    """セッション共有の統合テスト用設定
+
+    integration_configと同じ設定値を持つConfigをセッションごとに一度だけ生成します。
+    ドキュメント処理や埋め込み生成など、ベクトルストアを使わない前処理の共有に使用します。
+    セッション全体で同一インスタンスを共有するため、テスト内で変更しないこと。
+
+    Args:
+        tmp_path_factory: pytestが提供する一時ディレクトリファクトリ
+
+    Returns:
+        Config: 統合テスト用のConfigオブジェクト
+    """
+    return _make_config(_INTEGRATION_ENV, tmp_path_factory.mktemp("session_chroma_db"))
+
+
+@pytest.fixture(scope="session")
+def embedding_generator(integration_session_config):
+    """セッション共有の埋め込み生成器
+
+    Args:
+        integration_session_config: セッション共有の統合テスト用設定
+
+    Returns:
+        EmbeddingGenerator: 統合テスト用の埋め込み生成器
+    """
+    from src.rag.embeddings import EmbeddingGenerator
+
+    return EmbeddingGenerator(integration_session_config)
+
+
+@pytest.fixture(scope="session")
+def embed_query(embedding_generator):
+    """セッション内で結果をキャッシュするクエリ埋め込み関数
+
+    同じモデルに対するクエリの埋め込みは決定的なため、同じクエリは一度だけ生成します。
+    返されるベクトルはテスト間で共有されるため、テスト内で変更しないこと。
+
+    Args:
+        embedding_generator: セッション共有の埋め込み生成器
+
+    Returns:
+        Callable[[str], list[float]]: クエリの埋め込みを返す関数
+    """
+    return lru_cache(maxsize=128)(embedding_generator.embed_query)
+
+
+@pytest.fixture(scope="session")
+def document_processor(integration_session_config):
+    """セッション共有のドキュメントプロセッサ
+
+    Args:
+        integration_session_config: セッション共有の統合テスト用設定
+
+    Returns:
+        DocumentProcessor: 統合テスト用のドキュメントプロセッサ
+    """
+    from src.rag.document_processor import DocumentProcessor
+
+    return DocumentProcessor(integration_session_config)
+
+
+@pytest.fixture(scope="session")
+def processed_files(sample_text_files, document_processor):
+    """サンプルテキストファイルのドキュメント処理結果
+
+    チャンク分割は決定的なため、セッションごとに一度だけ実行します。
+    セッション全体で同一インスタンスを共有するため、テスト内で変更しないこと。
+
+    Args:
+        sample_text_files: サンプルテキストファイルの辞書
+        document_processor: セッション共有のドキュメントプロセッサ
+
+    Returns:
+        dict[str, tuple[Document, list[Chunk]]]: キーごとの(ドキュメント, チャンクリスト)
+    """
+    return {
+        key: document_processor.process_document(str(file_path))
+        for key, file_path in sample_text_files.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def chroma_template(tmp_path_factory):
+    """初期化済みの空のChromaDBディレクトリ（テンプレート）
+
+    セッションごとに一度だけChromaDBを初期化し、各テストはfresh_chroma_dirで
+    このディレクトリを複製して使用します。
+
+    Args:
+        tmp_path_factory: pytestが提供する一時ディレクトリファクトリ
+
+    Returns:
+        Path: 初期化済みChromaDBディレクトリのパス
+    """
+    from src.rag.vector_store import create_vector_store
+
+    template_dir = tmp_path_factory.mktemp("chroma_template")
+    vector_store = create_vector_store(_make_config(_INTEGRATION_ENV, template_dir))
+    vector_store.initialize()
+    vector_store.close()
+    return template_dir
 
 
 @pytest.fixture
-def sample_text_files(tmp_path):
+def fresh_chroma_dir(tmp_path, chroma_template, integration_config, monkeypatch):
+    """テンプレートを複製した空のChromaDBディレクトリ
+
+    integration_configのchroma_persist_directoryを複製先に差し替えます。
+    テスト後のデータ削除はtmp_pathのクリーンアップに任せます。
+
+    Args:
+        tmp_path: pytestが提供する一時ディレクトリ
+        chroma_template: 初期化済みChromaDBディレクトリ
+        integration_config: 統合テスト用の設定
+        monkeypatch: 設定値を上書きするためのfixture
+
+    Returns:
+        Path: 複製したChromaDBディレクトリのパス
+    """
+    chroma_dir = tmp_path / "chroma"
+    shutil.copytree(chroma_template, chroma_dir, dirs_exist_ok=True)
+    monkeypatch.setattr(integration_config, "chroma_persist_directory", str(chroma_dir))
+    return chroma_dir
+
+
+@lru_cache(maxsize=1)
+def _ollama_session():
+    """Ollamaへの問い合わせに使うHTTPセッションを返す
+
+    接続をプールして再利用し、一時的な接続エラーは短い間隔で再試行します。
+
+    Returns:
+        requests.Session: 共有HTTPセッション
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def _probe_ollama(base_url: str) -> tuple[Optional[tuple[str, ...]], str]:
+    """Ollamaの/api/tagsに問い合わせ、結果をベースURLごとにキャッシュする
+
+    Args:
+        base_url: OllamaのベースURL
+
+    Returns:
+        tuple: (インストール済みモデル名のタプル, 利用不可の理由)
+            利用できない場合はモデル名の代わりにNoneを返す
+    """
+    try:
+        response = _ollama_session().get(f"{base_url}/api/tags", timeout=5)
+    except Exception as e:
+        return None, f"Ollama service is not available: {e}"
+
+    if response.status_code != 200:
+        return None, "Ollama service is not responding correctly"
+
+    models = response.json().get("models", [])
+    return tuple(model.get("name", "") for model in models), ""
+
+
+# Ollama起動チェック結果をpytestキャッシュに保持する期間（秒）
+_OLLAMA_CHECK_CACHE_TTL = 60.0
+
+
+@pytest.fixture(scope="session")
+def check_ollama(request):
+    """Ollamaサービスが起動しているかチェックする
+
+    問い合わせはセッションごとに一度だけ行い、成功した結果は
+    pytestキャッシュ（.pytest_cache）に保存して直近の実行でも再利用します。
+    環境変数RAG_SKIP_OLLAMA_CHECKが設定されている場合はチェックを省略します。
+    Ollamaが利用できない場合、このfixtureを使用するテストはスキップされます。
+
+    Args:
+        request: pytestのFixtureRequest
+
+    Returns:
+        Optional[tuple[str, ...]]: インストール済みのモデル名（チェック省略時はNone）
+    """
+    if os.getenv("RAG_SKIP_OLLAMA_CHECK"):
+        return None
+
+    base_url = _INTEGRATION_ENV["OLLAMA_BASE_URL"]
+    cache = getattr(request.config, "cache", None)
+    cache_key = "rag_sample/ollama_models"
+
+    if cache is not None:
+        cached = cache.get(cache_key, None)
+        if (
+            cached is not None
+            and cached.get("base_url") == base_url
+            and time.time() - cached.get("ts", 0) < _OLLAMA_CHECK_CACHE_TTL
+        ):
+            return tuple(cached["models"])
+
+    models, reason = _probe_ollama(base_url)
+    if models is None:
+        pytest.skip(reason)
+
+    if cache is not None:
+        cache.set(cache_key, {"base_url": base_url, "models": list(models), "ts": time.time()})
+    return models
+
+
+# マルチモーダルテストの前提となるOllamaモデル（タグを除いたモデル名）
+_MULTIMODAL_REQUIRED_MODELS = frozenset({
+    Config.DEFAULT_OLLAMA_VISION_MODEL,
+    Config.DEFAULT_OLLAMA_MULTIMODAL_LLM_MODEL,
+    Config.DEFAULT_OLLAMA_EMBEDDING_MODEL,
+})
+
+
+@pytest.fixture(scope="session")
+def check_ollama_service(check_ollama):
+    """Ollamaサービスが起動しているかチェックする
+
+    問い合わせ結果はセッション共有のcheck_ollamaを再利用します。
+
+    Args:
+        check_ollama: Ollama起動チェック（インストール済みのモデル名、チェック省略時はNone）
+
+    Returns:
+        bool: Ollamaが起動している場合True
+    """
+    return True
+
+
+@pytest.fixture(scope="session")
+def check_ollama_vision(check_ollama):
+    """Ollamaサービスとマルチモーダルテストに必要なモデルが利用可能かチェックする
+
+    check_ollamaの結果を使うため、必要なモデルが増えてもOllamaへの再問い合わせは行いません。
+    必要なモデルが一つでもインストールされていない場合、このfixtureを使用するテストはスキップされます。
+
+    Args:
+        check_ollama: Ollama起動チェック（インストール済みのモデル名、チェック省略時はNone）
+
+    Returns:
+        Optional[tuple[str, ...]]: インストール済みのビジョンモデル名（チェックを省略した場合はNone）
+    """
+    # チェックが省略された場合はモデルの有無も確認しない
+    if check_ollama is None:
+        return None
+
+    installed = {name.split(":")[0].lower() for name in check_ollama}
+    missing = _MULTIMODAL_REQUIRED_MODELS - installed
+    if missing:
+        pulls = ", ".join(f"ollama pull {model}" for model in sorted(missing))
+        pytest.skip(f"Required Ollama models are not installed. Run: {pulls}")
+
+    return tuple(
+        name for name in check_ollama
+        if name.split(":")[0].lower() == Config.DEFAULT_OLLAMA_VISION_MODEL
+    )
+
+
+# ウォームアップしたモデルをメモリに保持させる期間（Ollamaのkeep_alive形式）
+_OLLAMA_WARMUP_KEEP_ALIVE = "1h"
+
+
+@pytest.fixture(scope="session")
+def warm_ollama_models(check_ollama_vision):
+    """マルチモーダルテストで使用するOllamaモデルを事前にメモリへ読み込む
+
+    初回呼び出し時のモデル読み込み時間がパフォーマンステストの計測に含まれないよう、
+    セッションごとに一度だけ各モデルを読み込み、keep_aliveで常駐させます。
+    ウォームアップの失敗はテスト結果に影響させず、ログに記録するのみとします。
+
+    Args:
+        check_ollama_vision: Ollamaとマルチモーダルテスト用モデルのチェック
+    """
+    base_url = _MULTIMODAL_ENV["OLLAMA_BASE_URL"]
+    session = _ollama_session()
+
+    for model in sorted(_MULTIMODAL_REQUIRED_MODELS):
+        # 埋め込みモデルは生成APIに対応しないため埋め込みAPIで読み込む
+        if model == Config.DEFAULT_OLLAMA_EMBEDDING_MODEL:
+            url = f"{base_url}/api/embed"
+            payload = {"model": model, "input": "warmup"}
+        else:
+            # 空のプロンプトを送るとモデルの読み込みのみが行われる
+            url = f"{base_url}/api/generate"
+            payload = {"model": model, "prompt": ""}
+        payload["keep_alive"] = _OLLAMA_WARMUP_KEEP_ALIVE
+
+        try:
+            session.post(url, json=payload, timeout=120).raise_for_status()
+        except Exception as e:
+            logger.debug("Ollama model warmup failed for %s: %s", model, e)
+
+
+@pytest.fixture(scope="session")
+def sample_text_files(tmp_path_factory):
     """統合テスト用のサンプルテキストファイル
 
     複数のテキストファイルを作成して、エンドツーエンドテストで使用します。
+    ファイルはセッションごとに一度だけ書き出されるため、テスト内で変更しないこと。
 
     Args:
-        tmp_path: pytestが提供する一時ディレクトリ
+        tmp_path_factory: pytestが提供する一時ディレクトリファクトリ
 
     Returns:
         dict[str, Path]: ファイル名とパスの辞書
     """
+    base = tmp_path_factory.mktemp("samples")
     files = {}
 
-    # サンプルファイル1: Python について
-    file1 = tmp_path / "python_intro.txt"
-    file1.write_text("""Pythonは、1991年にGuido van Rossumによって開発されたプログラミング言語です。
-Pythonはシンプルで読みやすい構文が特徴で、初心者にも学びやすい言語として人気があります。
-データサイエンス、機械学習、Web開発など、幅広い分野で使用されています。
-""", encoding="utf-8")
-    files["python"] = file1
-
-    # サンプルファイル2: RAGについて
-    file2 = tmp_path / "rag_overview.txt"
-    file2.write_text("""RAG（Retrieval-Augmented Generation）は、検索と生成を組み合わせたAI技術です。
-大規模言語モデルに外部知識を組み込むことで、より正確で最新の情報を提供できます。
-RAGシステムは、ベクトルデータベースを使用してドキュメントを検索し、その結果を基に回答を生成します。
-""", encoding="utf-8")
-    files["rag"] = file2
-
-    # サンプルファイル3: LLMについて
-    file3 = tmp_path / "llm_basics.txt"
-    file3.write_text("""LLM（Large Language Model）は、大量のテキストデータで訓練された大規模な言語モデルです。
-GPT、Claude、Llama などが代表的なLLMです。
-LLMは自然言語理解、文章生成、翻訳、要約など、様々なタスクに利用できます。
-""", encoding="utf-8")
-    files["llm"] = file3
+    for key, (file_name, content) in _SAMPLE_TEXT_FILES.items():
+        file_path = base / file_name
+        file_path.write_bytes(content)
+        files[key] = file_path
 
     return files
 
 
 # ==================== マルチモーダルRAG用のfixture ====================
 
+# マルチモーダルテスト用の設定値（CHROMA_PERSIST_DIRECTORYはfixtureごとに設定）
+_MULTIMODAL_ENV = {
+    "OLLAMA_BASE_URL": "http://localhost:11434",
+    "OLLAMA_LLM_MODEL": "gpt-oss",
+    "OLLAMA_EMBEDDING_MODEL": "nomic-embed-text",
+    "OLLAMA_MULTIMODAL_LLM_MODEL": "gemma3",
+    "OLLAMA_VISION_MODEL": "llava",
+    "CHUNK_SIZE": "1000",
+    "CHUNK_OVERLAP": "200",
+    "LOG_LEVEL": "INFO",
+    "IMAGE_CAPTION_AUTO_GENERATE": "true",
+    "MAX_IMAGE_SIZE_MB": "10",
+    "IMAGE_RESIZE_ENABLED": "false",
+    "IMAGE_RESIZE_MAX_WIDTH": "1024",
+    "IMAGE_RESIZE_MAX_HEIGHT": "1024",
+    "MULTIMODAL_SEARCH_TEXT_WEIGHT": "0.5",
+    "MULTIMODAL_SEARCH_IMAGE_WEIGHT": "0.5",
+}
+
+
+@lru_cache(maxsize=None)
+def _solid_color_png(rgb: tuple[int, int, int], size: int = 100) -> bytes:
+    """単色のPNG画像データを生成する（PILによるエンコードを経由しない）
+
+    Args:
+        rgb: 画像の色（R, G, B）
+        size: 画像の幅と高さ（ピクセル）
+
+    Returns:
+        bytes: PNGファイルの内容
+    """
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data)) + tag + data
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+        )
+
+    # 各行はフィルタ種別（0: なし）に続けてRGBのピクセル列
+    scanline = b"\x00" + bytes(rgb) * size
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(scanline * size))
+        + chunk(b"IEND", b"")
+    )
+
+
+@pytest.fixture(scope="session")
+def solid_color_png():
+    """単色PNG画像データの生成関数
+
+    同じ色とサイズの画像データはキャッシュされ、一度だけ生成されます。
+
+    Returns:
+        Callable[[tuple[int, int, int], int], bytes]: PNGファイルの内容を返す関数
+    """
+    return _solid_color_png
+
+
 @pytest.fixture
 def sample_image_files():
     """テスト用の画像ファイルパス
@@ -256,8 +693,6 @@ def sample_image_document(sample_image_files):
     Returns:
         ImageDocument: サンプルのImageDocumentオブジェクト
     """
-    from datetime import datetime
-
     return ImageDocument(
         id="test_img_001",
         file_path=sample_image_files["sample1"],
@@ -282,9 +717,9 @@ def mock_vision_embeddings(mocker):
     """
     mock = mocker.Mock()
     # embed_image は単一のベクトルを返す
-    mock.embed_image.return_value = [0.1] * 512
+    mock.embed_image.return_value = _EMBEDDING_512_A
     # embed_images は複数のベクトルを返す
-    mock.embed_images.return_value = [[0.1] * 512, [0.2] * 512]
+    mock.embed_images.return_value = [_EMBEDDING_512_A, _EMBEDDING_512_B]
     # generate_caption はキャプションを返す
     mock.generate_caption.return_value = "テスト画像の説明"
     # model_name属性
@@ -292,56 +727,60 @@ def mock_vision_embeddings(mocker):
     return mock
 
 
-@pytest.fixture
-def multimodal_config(tmp_path):
+@pytest.fixture(scope="session")
+def multimodal_config(tmp_path_factory):
     """マルチモーダルRAG用のテスト設定
 
+    セッションごとに一度だけ生成し、全テストで同一インスタンスを共有します。
+    テスト内で変更しないこと（変更が必要な場合はcopy.copyで複製する）。
+
     Args:
-        tmp_path: pytestが提供する一時ディレクトリ
+        tmp_path_factory: pytestが提供する一時ディレクトリファクトリ
 
     Returns:
         Config: マルチモーダル対応のConfigオブジェクト
     """
-    # 一時的なChromaDBディレクトリを作成
-    chroma_dir = tmp_path / "test_multimodal_chroma_db"
-    chroma_dir.mkdir(exist_ok=True)
-
-    # マルチモーダル設定を含む.envファイルを作成
-    env_file = tmp_path / "multimodal_test.env"
-    env_file.write_text(f"""
-OLLAMA_BASE_URL=http://localhost:11434
-OLLAMA_LLM_MODEL=gpt-oss
-OLLAMA_EMBEDDING_MODEL=nomic-embed-text
-OLLAMA_MULTIMODAL_LLM_MODEL=gemma3
-OLLAMA_VISION_MODEL=llava
-CHROMA_PERSIST_DIRECTORY={chroma_dir}
-CHUNK_SIZE=1000
-CHUNK_OVERLAP=200
-LOG_LEVEL=INFO
-IMAGE_CAPTION_AUTO_GENERATE=true
-MAX_IMAGE_SIZE_MB=10
-IMAGE_RESIZE_ENABLED=false
-IMAGE_RESIZE_MAX_WIDTH=1024
-IMAGE_RESIZE_MAX_HEIGHT=1024
-MULTIMODAL_SEARCH_TEXT_WEIGHT=0.5
-MULTIMODAL_SEARCH_IMAGE_WEIGHT=0.5
-""")
-
-    return Config(env_file=str(env_file))
+    return _make_config(
+        _MULTIMODAL_ENV, tmp_path_factory.mktemp("test_multimodal_chroma_db")
+    )
 
 
 # ==================== ベクトルストア統合テスト用のfixture ====================
 
+# Dockerサービスごとのヘルスチェック用URL（docker-compose.ymlのhealthcheckと同じエンドポイント）
+_DOCKER_HEALTH_URLS = {
+    "qdrant": "http://localhost:6333/readyz",
+    "milvus": "http://localhost:9091/healthz",
+    "weaviate": "http://localhost:8080/v1/.well-known/ready",
+}
+
+# サービス起動待機の上限（秒）
+_DOCKER_READY_TIMEOUT = 60.0
+
+
+def _service_ready(service: str) -> bool:
+    """Dockerサービスがリクエストを受け付けられる状態か確認する
+
+    Args:
+        service: サービス名（qdrant, milvus, weaviate）
+
+    Returns:
+        bool: ヘルスチェックが成功した場合True
+    """
+    import requests
+
+    try:
+        return requests.get(_DOCKER_HEALTH_URLS[service], timeout=0.5).ok
+    except requests.RequestException:
+        return False
+
+
 @pytest.fixture(scope="session")
 def docker_services():
     """Dockerサービスの起動・停止管理
 
     テスト実行時に必要なDockerサービスを自動で起動・停止します。
     """
-    import subprocess
-    import time
-    import os
-
     # 起動が必要なサービスのリスト
     services_to_start = []
 
@@ -352,22 +791,35 @@ def docker_services():
         if db_type in ["qdrant", "milvus", "weaviate"]:
             services_to_start.append(db_type)
 
-    # Dockerサービスの起動
+    # Dockerサービスの起動（既に起動済みのサービスはdocker compose upを省略）
     for service in services_to_start:
+        if _service_ready(service):
+            print(f"{service} service is already running")
+            continue
         try:
             subprocess.run(
                 ["docker", "compose", "--profile", service, "up", "-d"],
                 check=True,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True
             )
             print(f"Started {service} service")
         except subprocess.CalledProcessError as e:
-            print(f"Failed to start {service}: {e}")
+            print(f"Failed to start {service}: {e}\n{e.stderr}")
 
-    # サービスの起動待機
-    if services_to_start:
+    # サービスの起動待機（ヘルスチェックを指数バックオフでポーリング）
+    pending = [service for service in services_to_start if not _service_ready(service)]
+    if pending:
         print("Waiting for services to be ready...")
-        time.sleep(10)
+        delay = 0.5
+        deadline = time.monotonic() + _DOCKER_READY_TIMEOUT
+        while pending and time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 2, 5.0)
+            pending = [service for service in pending if not _service_ready(service)]
+        if pending:
+            print(f"Services not ready after {_DOCKER_READY_TIMEOUT:.0f}s: {pending}")
 
     yield
 
@@ -379,11 +831,13 @@ def docker_services():
                 subprocess.run(
                     ["docker", "compose", "--profile", service, "down"],
                     check=True,
-                    capture_output=True
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True
                 )
                 print(f"Stopped {service} service")
             except subprocess.CalledProcessError as e:
-                print(f"Failed to stop {service}: {e}")
+                print(f"Failed to stop {service}: {e}\n{e.stderr}")
 
 
 @pytest.fixture
@@ -406,10 +860,11 @@ def vector_store_factory(docker_services):
 
     yield factory
 
-    # クリーンアップ
+    # クリーンアップ（初期化されていないストアはclearを省略）
     for store in created_stores:
         try:
-            store.clear()
+            if getattr(store, "client", None) is not None:
+                store.clear()
             store.close()
-        except:
-            pass
+        except Exception as e:
+            logger.debug("store cleanup failed: %s", e)
@@ -7,66 +7,111 @@
 Ollamaが起動していない場合、テストはスキップされます。
 """
 
+import copy
+import shutil
+
 import pytest
-from pathlib import Path
-import chromadb
 
 from src.rag.vector_store import BaseVectorStore, create_vector_store
 from src.rag.embeddings import EmbeddingGenerator
-from src.rag.document_processor import DocumentProcessor
 from src.rag.engine import RAGEngine
 from src.utils.config import Config
 
 
-# Ollamaの起動チェック用のfixture
 @pytest.fixture(scope="module")
-def check_ollama():
-    """Ollamaサービスが起動しているかチェックする
+def precomputed_corpus(processed_files, embedding_generator, check_ollama):
+    """サンプルファイルの埋め込み生成をモジュールで一度だけ実行する
+
+    各テストはベクトルストアへの追加のみを行い、同じ入力に対する
+    Ollamaへの埋め込みリクエストを繰り返さないようにします。
+    モジュール全体で同一インスタンスを共有するため、テスト内で変更しないこと。
+
+    Args:
+        processed_files: サンプルファイルのドキュメント処理結果
+        embedding_generator: セッション共有の埋め込み生成器
+        check_ollama: Ollama起動チェック
+
+    Returns:
+        dict[str, tuple]: キーごとの(ドキュメント, チャンクリスト, 埋め込みリスト)
+    """
+    corpus = {}
+    for key, (document, chunks) in processed_files.items():
+        embeddings = embedding_generator.embed_documents(
+            [chunk.content for chunk in chunks]
+        )
+        corpus[key] = (document, chunks, embeddings)
+    return corpus
+
+
+@pytest.fixture(scope="class")
+def populated_store(
+    integration_session_config,
+    chroma_template,
+    precomputed_corpus,
+    tmp_path_factory
+):
+    """すべてのサンプルドキュメントを追加済みのベクトルストア
+
+    クラス内の検索テストで共有するため、テスト内でデータを変更しないこと。
+
+    Args:
+        integration_session_config: セッション共有の統合テスト用設定
+        chroma_template: 初期化済みChromaDBディレクトリ
+        precomputed_corpus: 処理済みドキュメントと埋め込みの辞書
+        tmp_path_factory: pytestが提供する一時ディレクトリファクトリ
 
     Yields:
-        bool: Ollamaが起動している場合True
+        BaseVectorStore: ドキュメント追加済みのベクトルストア
     """
-    import requests
+    chroma_dir = tmp_path_factory.mktemp("populated_chroma")
+    shutil.copytree(chroma_template, chroma_dir, dirs_exist_ok=True)
+
+    # 共有設定は変更せず、複製したものに永続化ディレクトリを設定
+    config = copy.copy(integration_session_config)
+    config.chroma_persist_directory = str(chroma_dir)
+
+    vector_store = create_vector_store(config)
+    vector_store.initialize()
 
-    try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
-        if response.status_code == 200:
-            yield True
-        else:
-            pytest.skip("Ollama service is not responding correctly")
-    except Exception as e:
-        pytest.skip(f"Ollama service is not available: {e}")
+    all_chunks = []
+    all_embeddings = []
+    for document, chunks, embeddings in precomputed_corpus.values():
+        all_chunks.extend(chunks)
+        all_embeddings.extend(embeddings)
+    vector_store.add_documents(all_chunks, all_embeddings)
+
+    yield vector_store
+
+    vector_store.close()
 
 
 @pytest.mark.integration
+@pytest.mark.usefixtures("fresh_chroma_dir")
 class TestFullRAGFlow:
     """エンドツーエンドフロー（実際のChromaDB使用）のテスト"""
 
     def test_complete_rag_flow_single_document(
         self,
         integration_config: Config,
-        sample_text_files: dict[str, Path],
-        check_ollama
+        embedding_generator: EmbeddingGenerator,
+        precomputed_corpus: dict[str, tuple]
     ):
         """ドキュメント追加 → 検索 → 回答生成の完全フロー（単一ドキュメント）
 
         Args:
             integration_config: 統合テスト用の設定
-            sample_text_files: サンプルテキストファイルの辞書
-            check_ollama: Ollama起動チェック
+            embedding_generator: セッション共有の埋め込み生成器
+            precomputed_corpus: 処理済みドキュメントと埋め込みの辞書
         """
         # コンポーネントの初期化
         vector_store = create_vector_store(integration_config)
-        embedding_generator = EmbeddingGenerator(integration_config)
-        document_processor = DocumentProcessor(integration_config)
 
         try:
             # 1. ベクトルストアの初期化
             vector_store.initialize()
 
-            # 2. ドキュメントの処理
-            python_file = sample_text_files["python"]
-            document, chunks = document_processor.process_document(str(python_file))
+            # 2. 処理済みドキュメントの取得
+            document, chunks, embeddings = precomputed_corpus["python"]
 
             assert document is not None
             assert len(chunks) > 0
@@ -74,10 +119,7 @@ class TestFullRAGFlow:
             document_id = chunks[0].document_id if chunks else "unknown"
             print(f"Processed document: {document_id} with {len(chunks)} chunks")
 
-            # 3. 埋め込みの生成とベクトルストアへの追加
-            chunk_texts = [chunk.content for chunk in chunks]
-            embeddings = embedding_generator.embed_documents(chunk_texts)
-
+            # 3. 埋め込みの確認とベクトルストアへの追加
             assert len(embeddings) == len(chunks)
             assert all(len(emb) > 0 for emb in embeddings)
 
@@ -98,9 +140,9 @@ class TestFullRAGFlow:
             print(f"Search returned {len(search_results)} results")
 
             # 最も類似度の高い結果を確認
-            top_result = search_results[0]
-            assert "Python" in top_result.chunk.content or "python" in top_result.chunk.content.lower()
-            print(f"Top result content: {top_result.chunk.content[:100]}...")
+            top_content = search_results[0].chunk.content
+            assert "python" in top_content.lower()
+            print(f"Top result content: {top_content[:100]}...")
 
             # 5. RAGEngineを使った回答生成
             rag_engine = RAGEngine(
@@ -118,119 +160,38 @@ class TestFullRAGFlow:
             print(f"Generated answer: {answer['answer'][:200]}...")
 
         finally:
-            # クリーンアップ
-            vector_store.clear()
-            vector_store.close()
-
-    def test_complete_rag_flow_multiple_documents(
-        self,
-        integration_config: Config,
-        sample_text_files: dict[str, Path],
-        check_ollama
-    ):
-        """複数ドキュメントの追加と検索のフロー
-
-        Args:
-            integration_config: 統合テスト用の設定
-            sample_text_files: サンプルテキストファイルの辞書
-            check_ollama: Ollama起動チェック
-        """
-        # コンポーネントの初期化
-        vector_store = create_vector_store(integration_config)
-        embedding_generator = EmbeddingGenerator(integration_config)
-        document_processor = DocumentProcessor(integration_config)
-
-        try:
-            # ベクトルストアの初期化
-            vector_store.initialize()
-
-            # すべてのサンプルファイルを処理して追加
-            all_documents = []
-            all_chunks = []
-
-            for file_name, file_path in sample_text_files.items():
-                document, chunks = document_processor.process_document(str(file_path))
-                all_documents.append(document)
-                all_chunks.extend(chunks)
-
-                # 埋め込みの生成と追加
-                chunk_texts = [chunk.content for chunk in chunks]
-                embeddings = embedding_generator.embed_documents(chunk_texts)
-                vector_store.add_documents(chunks, embeddings)
-
-            print(f"Added {len(all_documents)} documents with {len(all_chunks)} total chunks")
-
-            # ドキュメント数の確認
-            doc_count = vector_store.get_document_count()
-            assert doc_count == len(all_chunks)
-
-            # 複数のクエリでテスト
-            queries = [
-                ("Pythonについて教えて", "Python"),
-                ("RAGとは何ですか？", "RAG"),
-                ("LLMの用途は？", "LLM")
-            ]
-
-            for query, expected_keyword in queries:
-                query_embedding = embedding_generator.embed_query(query)
-                search_results = vector_store.search(query_embedding, n_results=3)
-
-                assert len(search_results) > 0
-                # 検索結果に期待されるキーワードが含まれているか確認
-                found = any(
-                    expected_keyword.lower() in result.chunk.content.lower()
-                    for result in search_results
-                )
-                assert found, f"Expected keyword '{expected_keyword}' not found in search results for query '{query}'"
-                print(f"Query '{query}' found relevant content with keyword '{expected_keyword}'")
-
-            # ドキュメント一覧の取得
-            doc_list = vector_store.list_documents()
-            assert len(doc_list) == len(all_documents)
-
-        finally:
-            # クリーンアップ
-            vector_store.clear()
+            # クリーンアップ（データはtmp_pathとともに削除される）
             vector_store.close()
 
     def test_document_deletion_and_research(
         self,
         integration_config: Config,
-        sample_text_files: dict[str, Path],
-        check_ollama
+        embedding_generator: EmbeddingGenerator,
+        precomputed_corpus: dict[str, tuple]
     ):
         """ドキュメント削除と再検索のフロー
 
         Args:
             integration_config: 統合テスト用の設定
-            sample_text_files: サンプルテキストファイルの辞書
-            check_ollama: Ollama起動チェック
+            embedding_generator: セッション共有の埋め込み生成器
+            precomputed_corpus: 処理済みドキュメントと埋め込みの辞書
         """
         # コンポーネントの初期化
         vector_store = create_vector_store(integration_config)
-        embedding_generator = EmbeddingGenerator(integration_config)
-        document_processor = DocumentProcessor(integration_config)
 
         try:
             # ベクトルストアの初期化
             vector_store.initialize()
 
             # 2つのドキュメントを追加
-            python_file = sample_text_files["python"]
-            rag_file = sample_text_files["rag"]
-
-            python_doc, python_chunks = document_processor.process_document(str(python_file))
-            rag_doc, rag_chunks = document_processor.process_document(str(rag_file))
+            python_doc, python_chunks, python_embeddings = precomputed_corpus["python"]
+            rag_doc, rag_chunks, rag_embeddings = precomputed_corpus["rag"]
 
             # Python ドキュメントを追加
-            chunk_texts = [chunk.content for chunk in python_chunks]
-            embeddings = embedding_generator.embed_documents(chunk_texts)
-            vector_store.add_documents(python_chunks, embeddings)
+            vector_store.add_documents(python_chunks, python_embeddings)
 
             # RAG ドキュメントを追加
-            chunk_texts = [chunk.content for chunk in rag_chunks]
-            embeddings = embedding_generator.embed_documents(chunk_texts)
-            vector_store.add_documents(rag_chunks, embeddings)
+            vector_store.add_documents(rag_chunks, rag_embeddings)
 
             # 初期のドキュメント数を確認
             initial_count = vector_store.get_document_count()
@@ -267,10 +228,10 @@ class TestFullRAGFlow:
             # （検索結果がない、またはRAGドキュメントのみが返される）
             if len(search_results_after) > 0:
                 # 結果があれば、それはRAGドキュメントのはず
+                contents_after = [result.chunk.content.lower() for result in search_results_after]
                 python_found_after = any(
-                    "python" in result.chunk.content.lower() and
-                    "rag" not in result.chunk.content.lower()
-                    for result in search_results_after
+                    "python" in content and "rag" not in content
+                    for content in contents_after
                 )
                 # Pure Pythonコンテンツは見つからないはず
                 # （RAGの説明にPythonが含まれる可能性があるため、厳密には判定しない）
@@ -291,38 +252,31 @@ class TestFullRAGFlow:
             assert rag_found, "RAG document should still be searchable"
 
         finally:
-            # クリーンアップ
-            vector_store.clear()
+            # クリーンアップ（データはtmp_pathとともに削除される）
             vector_store.close()
 
     def test_rag_engine_chat_flow(
         self,
         integration_config: Config,
-        sample_text_files: dict[str, Path],
-        check_ollama
+        embedding_generator: EmbeddingGenerator,
+        precomputed_corpus: dict[str, tuple]
     ):
         """RAGEngineのチャット機能を使ったフロー
 
         Args:
             integration_config: 統合テスト用の設定
-            sample_text_files: サンプルテキストファイルの辞書
-            check_ollama: Ollama起動チェック
+            embedding_generator: セッション共有の埋め込み生成器
+            precomputed_corpus: 処理済みドキュメントと埋め込みの辞書
         """
         # コンポーネントの初期化
         vector_store = create_vector_store(integration_config)
-        embedding_generator = EmbeddingGenerator(integration_config)
-        document_processor = DocumentProcessor(integration_config)
 
         try:
             # ベクトルストアの初期化
             vector_store.initialize()
 
             # LLMドキュメントを追加
-            llm_file = sample_text_files["llm"]
-            document, chunks = document_processor.process_document(str(llm_file))
-
-            chunk_texts = [chunk.content for chunk in chunks]
-            embeddings = embedding_generator.embed_documents(chunk_texts)
+            document, chunks, embeddings = precomputed_corpus["llm"]
             vector_store.add_documents(chunks, embeddings)
 
             # RAGEngineの作成
@@ -378,43 +332,91 @@ class TestFullRAGFlow:
             assert len(rag_engine.get_chat_history()) == 0
 
         finally:
-            # クリーンアップ
-            vector_store.clear()
+            # クリーンアップ（データはtmp_pathとともに削除される）
             vector_store.close()
 
 
 @pytest.mark.integration
+class TestMultipleDocumentsSearch:
+    """複数ドキュメントを追加したベクトルストアでの検索のテスト"""
+
+    def test_all_documents_added(
+        self,
+        populated_store: BaseVectorStore,
+        precomputed_corpus: dict[str, tuple]
+    ):
+        """すべてのドキュメントとチャンクが追加されていることを確認
+
+        Args:
+            populated_store: ドキュメント追加済みのベクトルストア
+            precomputed_corpus: 処理済みドキュメントと埋め込みの辞書
+        """
+        total_chunks = sum(len(chunks) for _, chunks, _ in precomputed_corpus.values())
+        print(f"Added {len(precomputed_corpus)} documents with {total_chunks} total chunks")
+
+        # ドキュメント数の確認
+        assert populated_store.get_document_count() == total_chunks
+
+        # ドキュメント一覧の取得
+        doc_list = populated_store.list_documents()
+        assert len(doc_list) == len(precomputed_corpus)
+
+    @pytest.mark.parametrize("query,expected_keyword", [
+        ("Pythonについて教えて", "Python"),
+        ("RAGとは何ですか？", "RAG"),
+        ("LLMの用途は？", "LLM"),
+    ])
+    def test_search_finds_relevant_document(
+        self,
+        populated_store: BaseVectorStore,
+        embedding_generator: EmbeddingGenerator,
+        query: str,
+        expected_keyword: str
+    ):
+        """クエリに対応するドキュメントが検索結果に含まれることを確認
+
+        Args:
+            populated_store: ドキュメント追加済みのベクトルストア
+            embedding_generator: セッション共有の埋め込み生成器
+            query: 検索クエリ
+            expected_keyword: 検索結果に含まれるべきキーワード
+        """
+        query_embedding = embedding_generator.embed_query(query)
+        search_results = populated_store.search(query_embedding, n_results=3)
+
+        assert len(search_results) > 0
+        # 検索結果に期待されるキーワードが含まれているか確認
+        keyword = expected_keyword.lower()
+        found = any(keyword in result.chunk.content.lower() for result in search_results)
+        assert found, f"Expected keyword '{expected_keyword}' not found in search results for query '{query}'"
+        print(f"Query '{query}' found relevant content with keyword '{expected_keyword}'")
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("fresh_chroma_dir")
 class TestChromaDBPersistence:
     """ChromaDBのデータ永続化のテスト"""
 
     def test_data_persistence_across_sessions(
         self,
         integration_config: Config,
-        sample_text_files: dict[str, Path],
-        check_ollama
+        precomputed_corpus: dict[str, tuple]
     ):
         """データが永続化され、再起動後も利用可能であることを確認
 
         Args:
             integration_config: 統合テスト用の設定
-            sample_text_files: サンプルテキストファイルの辞書
-            check_ollama: Ollama起動チェック
+            precomputed_corpus: 処理済みドキュメントと埋め込みの辞書
         """
         # 第1セッション: データの追加
         vector_store1 = create_vector_store(integration_config)
-        embedding_generator = EmbeddingGenerator(integration_config)
-        document_processor = DocumentProcessor(integration_config)
         vector_store2 = None
 
         try:
             vector_store1.initialize()
 
             # ドキュメントを追加
-            python_file = sample_text_files["python"]
-            document, chunks = document_processor.process_document(str(python_file))
-
-            chunk_texts = [chunk.content for chunk in chunks]
-            embeddings = embedding_generator.embed_documents(chunk_texts)
+            document, chunks, embeddings = precomputed_corpus["python"]
             vector_store1.add_documents(chunks, embeddings)
 
             # ドキュメント数を記録
@@ -433,15 +435,14 @@ class TestChromaDBPersistence:
             assert count2 == count1, f"Data not persisted: expected {count1}, got {count2}"
 
             # 検索が正常に動作することを確認
-            query = "Pythonの特徴"
-            query_embedding = embedding_generator.embed_query(query)
-            search_results = vector_store2.search(query_embedding, n_results=2)
+            # （埋め込みの再生成は不要なため、追加済みチャンクの埋め込みをクエリに使用）
+            search_results = vector_store2.search(embeddings[0], n_results=2)
 
             assert len(search_results) > 0
+            assert search_results[0].chunk.chunk_id == chunks[0].chunk_id
             print(f"Session 2: Search found {len(search_results)} results")
 
         finally:
-            # クリーンアップ
+            # クリーンアップ（データはtmp_pathとともに削除される）
             if vector_store2 is not None:
-                vector_store2.clear()
                 vector_store2.close()
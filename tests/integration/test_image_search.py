@@ -8,7 +8,9 @@ Ollamaが起動していない場合、またはビジョンモデルがイン
 テストはスキップされます。
 """
 
+import copy
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tempfile
 import shutil
@@ -18,52 +20,24 @@ from src.rag.vector_store import BaseVectorStore, create_vector_store
 from src.rag.vision_embeddings import VisionEmbeddings
 from src.rag.image_processor import ImageProcessor
 from src.rag.embeddings import EmbeddingGenerator
-from src.utils.config import Config
 
 
-# Ollamaとビジョンモデルの起動チェック用のfixture
 @pytest.fixture(scope="module")
-def check_ollama_vision():
-    """Ollamaサービスとビジョンモデルが利用可能かチェックする
-
-    Yields:
-        bool: Ollamaとビジョンモデルが利用可能な場合True
-    """
-    import requests
-
-    try:
-        # Ollamaサービスのチェック
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
-        if response.status_code != 200:
-            pytest.skip("Ollama service is not responding correctly")
-
-        # ビジョンモデルがインストールされているかチェック
-        models = response.json().get("models", [])
-        vision_model_installed = any(
-            "llava" in model.get("name", "").lower() for model in models
-        )
-
-        if not vision_model_installed:
-            pytest.skip("Vision model (llava) is not installed. Run: ollama pull llava")
-
-        yield True
-
-    except Exception as e:
-        pytest.skip(f"Ollama service is not available: {e}")
-
-
-@pytest.fixture
-def sample_images(tmp_path):
+def sample_images(tmp_path_factory, solid_color_png):
     """テスト用のサンプル画像を作成する
 
+    画像はモジュールごとに一度だけ作成するため、テスト内で変更しないこと。
+    PNG画像はPILを経由せずに生成したバイト列を書き込みます。
+    JPEG画像は拡張子ごとの処理を検証するためPILで保存します。
+
     Args:
-        tmp_path: pytest提供の一時ディレクトリ
+        tmp_path_factory: pytest提供の一時ディレクトリファクトリ
+        solid_color_png: 単色PNG画像データの生成関数
 
     Returns:
         dict[str, Path]: 画像名とパスのマッピング
     """
-    images_dir = tmp_path / "test_images"
-    images_dir.mkdir()
+    images_dir = tmp_path_factory.mktemp("test_images")
 
     # 異なる色のシンプルな画像を作成
     images = {}
@@ -75,9 +49,8 @@ def sample_images(tmp_path):
     images["red"] = red_path
 
     # 青い画像
-    blue_img = Image.new('RGB', (100, 100), color='blue')
     blue_path = images_dir / "blue_image.png"
-    blue_img.save(blue_path)
+    blue_path.write_bytes(solid_color_png((0, 0, 255)))
     images["blue"] = blue_path
 
     # 緑の画像
@@ -89,33 +62,112 @@ def sample_images(tmp_path):
     return images
 
 
+@pytest.fixture(scope="module")
+def vision_embeddings(integration_session_config, check_ollama_vision):
+    """モジュール共有のビジョン埋め込み生成器
+
+    Args:
+        integration_session_config: セッション共有の統合テスト用設定
+        check_ollama_vision: Ollamaビジョンモデルチェック
+
+    Returns:
+        VisionEmbeddings: ビジョン埋め込み生成器
+    """
+    return VisionEmbeddings(integration_session_config)
+
+
+@pytest.fixture(scope="module")
+def image_processor(vision_embeddings, integration_session_config):
+    """モジュール共有の画像プロセッサ
+
+    Args:
+        vision_embeddings: モジュール共有のビジョン埋め込み生成器
+        integration_session_config: セッション共有の統合テスト用設定
+
+    Returns:
+        ImageProcessor: 画像プロセッサ
+    """
+    return ImageProcessor(vision_embeddings, integration_session_config)
+
+
+@pytest.fixture(scope="module")
+def vector_store(integration_session_config, tmp_path_factory):
+    """モジュール共有のベクトルストア
+
+    各テストは終了時に_remove_images()で追加した画像を削除すること。
+
+    Args:
+        integration_session_config: セッション共有の統合テスト用設定
+        tmp_path_factory: pytest提供の一時ディレクトリファクトリ
+
+    Yields:
+        BaseVectorStore: 初期化済みのベクトルストア
+    """
+    # 共有設定は変更せず、複製したものに永続化ディレクトリを設定
+    config = copy.copy(integration_session_config)
+    config.chroma_persist_directory = str(tmp_path_factory.mktemp("image_search_chroma"))
+
+    store = create_vector_store(config)
+    store.initialize()
+    yield store
+    store.close()
+
+
+def _remove_images(vector_store: BaseVectorStore, image_ids: list[str]) -> None:
+    """テストで追加した画像をIDで削除する
+
+    コレクション全体を作り直すclear()の代わりに、追加した分だけを削除します。
+
+    Args:
+        vector_store: ベクトルストア
+        image_ids: 削除する画像IDのリスト
+    """
+    for image_id in image_ids:
+        vector_store.remove_image(image_id)
+
+
+@pytest.fixture(scope="module")
+def precomputed_image_embeddings(sample_images, vision_embeddings):
+    """サンプル画像の埋め込みをモジュールで一度だけ生成する
+
+    モジュール全体で同一インスタンスを共有するため、テスト内で変更しないこと。
+
+    Args:
+        sample_images: サンプル画像ファイルの辞書
+        vision_embeddings: モジュール共有のビジョン埋め込み生成器
+
+    Returns:
+        dict[str, list[float]]: 画像名と埋め込みベクトルのマッピング
+    """
+    names = list(sample_images)
+    embeddings = vision_embeddings.embed_images([sample_images[name] for name in names])
+    return dict(zip(names, embeddings))
+
+
 @pytest.mark.integration
 class TestImageSearch:
     """画像検索のエンドツーエンドテスト（実際のChromaDB使用）"""
 
     def test_add_and_list_images(
         self,
-        integration_config: Config,
+        vector_store: BaseVectorStore,
+        image_processor: ImageProcessor,
         sample_images: dict[str, Path],
+        precomputed_image_embeddings: dict[str, list[float]],
         check_ollama_vision
     ):
         """画像の追加と一覧表示のテスト
 
         Args:
-            integration_config: 統合テスト用の設定
+            vector_store: モジュール共有のベクトルストア
+            image_processor: モジュール共有の画像プロセッサ
             sample_images: サンプル画像ファイルの辞書
+            precomputed_image_embeddings: 生成済みのサンプル画像埋め込み
             check_ollama_vision: Ollamaビジョンモデルチェック
         """
-        # コンポーネントの初期化
-        vector_store = create_vector_store(integration_config)
-        vision_embeddings = VisionEmbeddings(integration_config)
-        image_processor = ImageProcessor(vision_embeddings, integration_config)
-
+        image_ids: list[str] = []
         try:
-            # 1. ベクトルストアの初期化
-            vector_store.initialize()
-
-            # 2. 画像の読み込み
+            # 1. 画像の読み込み
             red_image_path = str(sample_images["red"])
             image_doc = image_processor.load_image(red_image_path)
 
@@ -126,19 +178,19 @@ class TestImageSearch:
             print(f"Loaded image: {image_doc.file_name}")
             print(f"Caption: {image_doc.caption}")
 
-            # 3. 埋め込みの生成
-            embedding = vision_embeddings.embed_image(red_image_path)
+            # 2. 生成済みの埋め込みを取得
+            embedding = precomputed_image_embeddings["red"]
 
             assert len(embedding) > 0
             print(f"Generated embedding with dimension: {len(embedding)}")
 
-            # 4. ベクトルストアに追加
+            # 3. ベクトルストアに追加
             image_ids = vector_store.add_images([image_doc], [embedding])
 
             assert len(image_ids) == 1
             print(f"Added image with ID: {image_ids[0]}")
 
-            # 5. 画像一覧の取得
+            # 4. 画像一覧の取得
             images = vector_store.list_images()
 
             assert len(images) >= 1
@@ -146,43 +198,41 @@ class TestImageSearch:
             print(f"Total images in store: {len(images)}")
 
         finally:
-            # クリーンアップ
-            vector_store.clear()
+            # クリーンアップ（このテストで追加した画像のみ削除）
+            _remove_images(vector_store, image_ids)
 
     def test_search_images_by_text(
         self,
-        integration_config: Config,
+        vector_store: BaseVectorStore,
+        image_processor: ImageProcessor,
+        embedding_generator: EmbeddingGenerator,
         sample_images: dict[str, Path],
+        precomputed_image_embeddings: dict[str, list[float]],
         check_ollama_vision
     ):
         """テキストクエリによる画像検索のテスト
 
         Args:
-            integration_config: 統合テスト用の設定
+            vector_store: モジュール共有のベクトルストア
+            image_processor: モジュール共有の画像プロセッサ
+            embedding_generator: セッション共有の埋め込み生成器
             sample_images: サンプル画像ファイルの辞書
+            precomputed_image_embeddings: 生成済みのサンプル画像埋め込み
             check_ollama_vision: Ollamaビジョンモデルチェック
         """
-        # コンポーネントの初期化
-        vector_store = create_vector_store(integration_config)
-        vision_embeddings = VisionEmbeddings(integration_config)
-        image_processor = ImageProcessor(vision_embeddings, integration_config)
-        embedding_generator = EmbeddingGenerator(integration_config)
-
+        image_ids: list[str] = []
         try:
-            # 1. ベクトルストアの初期化
-            vector_store.initialize()
-
-            # 2. 複数の画像を追加
-            images = []
-            embeddings = []
-
-            for color, image_path in sample_images.items():
-                image_doc = image_processor.load_image(str(image_path))
-                images.append(image_doc)
-
-                embedding = vision_embeddings.embed_image(str(image_path))
-                embeddings.append(embedding)
-
+            # 1. 複数の画像を追加
+            # キャプション生成は画像ごとに独立したOllama呼び出しのため並列に実行
+            colors = list(sample_images)
+            with ThreadPoolExecutor(max_workers=len(colors)) as executor:
+                images = list(executor.map(
+                    lambda color: image_processor.load_image(str(sample_images[color])),
+                    colors
+                ))
+            embeddings = [precomputed_image_embeddings[color] for color in colors]
+
+            for color, image_doc in zip(colors, images):
                 print(f"Loaded {color} image: {image_doc.caption[:50]}...")
 
             # ベクトルストアに追加
@@ -190,7 +240,7 @@ class TestImageSearch:
             assert len(image_ids) == len(sample_images)
             print(f"Added {len(image_ids)} images to vector store")
 
-            # 3. テキストクエリで検索
+            # 2. テキストクエリで検索
             # キャプションベースの検索（テキスト埋め込みを使用）
             query = "red color"
             query_embedding = embedding_generator.embed_query(query)
@@ -217,35 +267,32 @@ class TestImageSearch:
             )
 
         finally:
-            # クリーンアップ
-            vector_store.clear()
+            # クリーンアップ（このテストで追加した画像のみ削除）
+            _remove_images(vector_store, image_ids)
 
     def test_remove_image(
         self,
-        integration_config: Config,
+        vector_store: BaseVectorStore,
+        image_processor: ImageProcessor,
         sample_images: dict[str, Path],
+        precomputed_image_embeddings: dict[str, list[float]],
         check_ollama_vision
     ):
         """画像の削除テスト
 
         Args:
-            integration_config: 統合テスト用の設定
+            vector_store: モジュール共有のベクトルストア
+            image_processor: モジュール共有の画像プロセッサ
             sample_images: サンプル画像ファイルの辞書
+            precomputed_image_embeddings: 生成済みのサンプル画像埋め込み
             check_ollama_vision: Ollamaビジョンモデルチェック
         """
-        # コンポーネントの初期化
-        vector_store = create_vector_store(integration_config)
-        vision_embeddings = VisionEmbeddings(integration_config)
-        image_processor = ImageProcessor(vision_embeddings, integration_config)
-
+        image_ids: list[str] = []
         try:
-            # 1. ベクトルストアの初期化
-            vector_store.initialize()
-
-            # 2. 画像を追加
+            # 1. 画像を追加
             image_path = str(sample_images["red"])
             image_doc = image_processor.load_image(image_path)
-            embedding = vision_embeddings.embed_image(image_path)
+            embedding = precomputed_image_embeddings["red"]
 
             image_ids = vector_store.add_images([image_doc], [embedding])
             image_id = image_ids[0]
@@ -255,13 +302,13 @@ class TestImageSearch:
             assert len(images) >= 1
             print(f"Added image with ID: {image_id}")
 
-            # 3. 画像を取得
+            # 2. 画像を取得
             retrieved_image = vector_store.get_image_by_id(image_id)
             assert retrieved_image is not None
             assert retrieved_image.id == image_id
             print(f"Retrieved image: {retrieved_image.file_name}")
 
-            # 4. 画像を削除
+            # 3. 画像を削除
             success = vector_store.remove_image(image_id)
             assert success is True
             print(f"Removed image: {image_id}")
@@ -274,36 +321,34 @@ class TestImageSearch:
             assert not any(img.id == image_id for img in images_after)
 
         finally:
-            # クリーンアップ
-            vector_store.clear()
+            # クリーンアップ（このテストで追加した画像のみ削除）
+            _remove_images(vector_store, image_ids)
 
     def test_load_images_from_directory(
         self,
-        integration_config: Config,
+        vector_store: BaseVectorStore,
+        image_processor: ImageProcessor,
         sample_images: dict[str, Path],
+        precomputed_image_embeddings: dict[str, list[float]],
         check_ollama_vision
     ):
         """ディレクトリから複数画像を読み込むテスト
 
         Args:
-            integration_config: 統合テスト用の設定
+            vector_store: モジュール共有のベクトルストア
+            image_processor: モジュール共有の画像プロセッサ
             sample_images: サンプル画像ファイルの辞書
+            precomputed_image_embeddings: 生成済みのサンプル画像埋め込み
             check_ollama_vision: Ollamaビジョンモデルチェック
         """
-        # コンポーネントの初期化
-        vector_store = create_vector_store(integration_config)
-        vision_embeddings = VisionEmbeddings(integration_config)
-        image_processor = ImageProcessor(vision_embeddings, integration_config)
-
+        image_ids: list[str] = []
         try:
-            # 1. ベクトルストアの初期化
-            vector_store.initialize()
-
-            # 2. ディレクトリから画像を一括読み込み
+            # 1. ディレクトリから画像を一括読み込み（キャプション生成を並列に実行）
             images_dir = sample_images["red"].parent
             loaded_images = image_processor.load_images_from_directory(
                 str(images_dir),
-                tags=["test", "sample"]
+                tags=["test", "sample"],
+                max_workers=len(sample_images)
             )
 
             assert len(loaded_images) == len(sample_images)
@@ -314,15 +359,18 @@ class TestImageSearch:
                 assert "test" in img.metadata.get("tags", [])
                 assert "sample" in img.metadata.get("tags", [])
 
-            # 3. 埋め込みを生成してベクトルストアに追加
-            image_paths = [img.file_path for img in loaded_images]
-            embeddings = vision_embeddings.embed_images(image_paths)
+            # 2. 生成済みの埋め込みを使用してベクトルストアに追加
+            embeddings_by_file_name = {
+                sample_images[name].name: embedding
+                for name, embedding in precomputed_image_embeddings.items()
+            }
+            embeddings = [embeddings_by_file_name[img.file_name] for img in loaded_images]
 
             image_ids = vector_store.add_images(loaded_images, embeddings)
             assert len(image_ids) == len(loaded_images)
             print(f"Added {len(image_ids)} images with batch processing")
 
-            # 4. 一覧表示で確認
+            # 3. 一覧表示で確認
             images = vector_store.list_images()
             assert len(images) >= len(sample_images)
 
@@ -334,5 +382,5 @@ class TestImageSearch:
             assert len(test_tagged_images) >= len(sample_images)
 
         finally:
-            # クリーンアップ
-            vector_store.clear()
+            # クリーンアップ（このテストで追加した画像のみ削除）
+            _remove_images(vector_store, image_ids)
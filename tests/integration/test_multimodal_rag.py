@@ -10,8 +10,10 @@
   - ollama pull nomic-embed-text (テキスト埋め込み)
 """
 
+import os
 import pytest
 import shutil
+import time
 from pathlib import Path
 
 from src.rag.multimodal_engine import MultimodalRAGEngine
@@ -23,6 +25,11 @@ from src.rag.document_processor import DocumentProcessor
 from src.utils.config import get_config
 
 
+# パフォーマンステストの許容時間（秒）。実行環境に合わせて環境変数で調整できる
+_SEARCH_BUDGET_S = float(os.getenv("RAG_SEARCH_BUDGET_S", "2.0"))
+_QUERY_BUDGET_S = float(os.getenv("RAG_QUERY_BUDGET_S", "30.0"))
+
+
 @pytest.fixture(scope="module")
 def test_chroma_dir(tmp_path_factory):
     """テスト用のChromaDB保存ディレクトリ"""
@@ -58,14 +65,81 @@ def text_embeddings(config):
 
 
 @pytest.fixture(scope="module")
-def vision_embeddings(config):
-    """ビジョン埋め込み生成器のインスタンスを作成"""
+def vision_embeddings(config, check_ollama_vision):
+    """ビジョン埋め込み生成器のインスタンスを作成（ビジョンモデルがない場合はスキップ）"""
     return VisionEmbeddings(config)
 
 
 @pytest.fixture(scope="module")
-def multimodal_engine(config, vector_store, text_embeddings, vision_embeddings):
-    """MultimodalRAGEngineのインスタンスを作成"""
+def doc_processor(config):
+    """ドキュメントプロセッサのインスタンスを作成"""
+    return DocumentProcessor(config)
+
+
+@pytest.fixture(scope="module")
+def image_processor(vision_embeddings, config):
+    """画像プロセッサのインスタンスを作成"""
+    return ImageProcessor(vision_embeddings, config)
+
+
+@pytest.fixture(scope="module")
+def populated_vector_store(
+    vector_store,
+    text_embeddings,
+    vision_embeddings,
+    doc_processor,
+    image_processor,
+    sample_documents,
+    sample_images
+):
+    """サンプルのテキストドキュメントと画像をモジュールで一度だけベクトルストアに追加
+
+    -kなどで一部のテストのみ実行した場合でも、検索対象のデータが存在するようにします。
+
+    Returns:
+        list[str]: 追加した画像のIDのリスト
+    """
+    # テキストドキュメントのチャンクをまとめて作成
+    all_chunks = []
+    for doc_path in sample_documents:
+        document = doc_processor.load_document(doc_path)
+        all_chunks.extend(doc_processor.create_chunks(document))
+
+    # 埋め込み生成とベクトルストアへの追加をそれぞれ一度で実行
+    all_embeddings = text_embeddings.embed_documents(
+        [chunk.content for chunk in all_chunks]
+    )
+    vector_store.add_documents(all_chunks, all_embeddings)
+
+    # 画像を追加
+    images = []
+    for img_path in sample_images:
+        # キャプションの品質は検証対象外のため、自動生成せず固定のキャプションを指定
+        image_doc = image_processor.load_image(
+            img_path,
+            auto_caption=False,
+            caption=f"solid {img_path.stem} color"
+        )
+        images.append(image_doc)
+
+    # 画像の埋め込みを生成
+    image_embeddings = vision_embeddings.embed_images(
+        [img.file_path for img in images]
+    )
+
+    # 画像をベクトルストアに追加
+    return vector_store.add_images(images, image_embeddings)
+
+
+@pytest.fixture(scope="module")
+def multimodal_engine(
+    config,
+    vector_store,
+    text_embeddings,
+    vision_embeddings,
+    populated_vector_store
+):
+    """MultimodalRAGEngineのインスタンスを作成（ベクトルストアはデータ追加済み）"""
     engine = MultimodalRAGEngine(
         config=config,
         vector_store=vector_store,
@@ -76,22 +150,18 @@ def multimodal_engine(config, vector_store, text_embeddings, vision_embeddings):
 
 
 @pytest.fixture(scope="module")
-def sample_images(tmp_path_factory):
+def sample_images(tmp_path_factory, solid_color_png):
     """テスト用のサンプル画像を作成"""
     images_dir = tmp_path_factory.mktemp("test_images")
 
-    # シンプルなPNG画像を作成（1x1ピクセルの赤い画像）
-    from PIL import Image
-
+    # シンプルな単色PNG画像を作成（PILを経由せずバイト列を直接書き込む）
     # 赤い画像
-    red_image = Image.new('RGB', (100, 100), color='red')
     red_path = images_dir / "red.png"
-    red_image.save(red_path)
+    red_path.write_bytes(solid_color_png((255, 0, 0)))
 
     # 青い画像
-    blue_image = Image.new('RGB', (100, 100), color='blue')
     blue_path = images_dir / "blue.png"
-    blue_image.save(blue_path)
+    blue_path.write_bytes(solid_color_png((0, 0, 255)))
 
     yield [red_path, blue_path]
 
@@ -134,48 +204,15 @@ class TestMultimodalRAGIntegration:
     def test_setup_documents_and_images(
         self,
         vector_store,
-        text_embeddings,
-        vision_embeddings,
-        sample_documents,
-        sample_images,
-        config
+        populated_vector_store,
+        sample_images
     ):
-        """テキストドキュメントと画像をベクトルストアに追加"""
-        # テキストドキュメントを追加
-        doc_processor = DocumentProcessor(config)
-
-        for doc_path in sample_documents:
-            document = doc_processor.load_document(doc_path)
-            chunks = doc_processor.create_chunks(document)
-            embeddings = text_embeddings.embed_documents(
-                [chunk.content for chunk in chunks]
-            )
-            vector_store.add_documents(chunks, embeddings)
-
+        """テキストドキュメントと画像がベクトルストアに追加されていることを確認"""
         # ドキュメント数を確認
         doc_count = vector_store.get_document_count()
         assert doc_count > 0, "テキストドキュメントが追加されていません"
 
-        # 画像を追加
-        image_processor = ImageProcessor(vision_embeddings)
-
-        images = []
-        for img_path in sample_images:
-            image_doc = image_processor.load_image(
-                img_path,
-                auto_caption=True  # キャプション自動生成
-            )
-            images.append(image_doc)
-
-        # 画像の埋め込みを生成
-        image_embeddings = vision_embeddings.embed_images(
-            [img.file_path for img in images]
-        )
-
-        # 画像をベクトルストアに追加
-        image_ids = vector_store.add_images(images, image_embeddings)
-
-        assert len(image_ids) == len(sample_images), "画像が正しく追加されていません"
+        assert len(populated_vector_store) == len(sample_images), "画像が正しく追加されていません"
 
     def test_search_images_with_text_query(self, multimodal_engine):
         """テキストクエリで画像を検索"""
@@ -320,34 +357,31 @@ class TestMultimodalRAGErrorHandling:
 @pytest.mark.integration
 @pytest.mark.multimodal
 @pytest.mark.performance
+@pytest.mark.usefixtures("warm_ollama_models")
 class TestMultimodalRAGPerformance:
     """マルチモーダルRAG パフォーマンステスト"""
 
     def test_search_performance(self, multimodal_engine):
         """検索のパフォーマンス確認"""
-        import time
-
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = multimodal_engine.search_multimodal(
             query="test query",
             top_k=10
         )
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
 
-        # 検索は2秒以内に完了すること
-        assert elapsed_time < 2.0, f"検索が遅すぎます: {elapsed_time:.2f}秒"
+        # 検索は許容時間（デフォルト2秒）以内に完了すること
+        assert elapsed_time < _SEARCH_BUDGET_S, f"検索が遅すぎます: {elapsed_time:.2f}秒"
 
     def test_query_with_images_performance(self, multimodal_engine, sample_images):
         """画像付き質問応答のパフォーマンス確認"""
-        import time
-
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = multimodal_engine.query_with_images(
             query="この画像の色は？",
             image_paths=[str(sample_images[0])],
             n_results=3
         )
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
 
-        # LLM応答を含めて30秒以内に完了すること（マルチモーダルモデルは処理に時間がかかる）
-        assert elapsed_time < 30.0, f"質問応答が遅すぎます: {elapsed_time:.2f}秒"
+        # LLM応答を含めて許容時間（デフォルト30秒）以内に完了すること（マルチモーダルモデルは処理に時間がかかる）
+        assert elapsed_time < _QUERY_BUDGET_S, f"質問応答が遅すぎます: {elapsed_time:.2f}秒"
@@ -6,43 +6,41 @@
 
 import logging
 import pytest
+from datetime import datetime
 from pathlib import Path
 
 from src.models.document import Chunk, ImageDocument
-from src.rag.vector_store import BaseVectorStore, create_vector_store
-from src.rag.embeddings import EmbeddingGenerator
+from src.rag.vector_store import BaseVectorStore
+from src.rag.vector_store.chroma_store import ChromaVectorStore
 from src.utils.config import get_config
 
 logger = logging.getLogger(__name__)
 
 
-@pytest.fixture
-def multimodal_vector_store(tmp_path):
-    """マルチモーダルテスト用のベクトルストア"""
-    config = get_config()
-    # テスト用の一時ディレクトリを使用
-    config.chroma_persist_directory = str(tmp_path / "test_chroma_multimodal")
+@pytest.fixture(scope="class")
+def multimodal_vector_store():
+    """マルチモーダルテスト用のベクトルストア
 
-    vector_store = create_vector_store(config)
+    数件のデータしか扱わないため、ファイルに永続化せずメモリ上のChromaDBを使用します。
+    データの追加はテストクラスごとに一度だけ行うため、格納するデータの種類
+    （テキストのみ、画像のみ、両方、なし）ごとにテストクラスを分けること。
+    """
+    vector_store = ChromaVectorStore(get_config(), in_memory=True)
     vector_store.initialize()
 
     yield vector_store
 
-    # クリーンアップ
+    # クリーンアップ（メモリ上のデータも破棄される）
     vector_store.close()
 
 
-@pytest.fixture
-def embedding_generator():
-    """埋め込み生成器フィクスチャ"""
-    config = get_config()
-    return EmbeddingGenerator(config)
-
+@pytest.fixture(scope="module")
+def text_chunks():
+    """サンプルテキストドキュメントのチャンク
 
-@pytest.fixture
-def sample_text_documents(embedding_generator, multimodal_vector_store):
-    """サンプルテキストドキュメントを追加"""
-    chunks = [
+    モジュール全体で同一インスタンスを共有するため、テスト内で変更しないこと。
+    """
+    return [
         Chunk(
             content="Pythonは汎用プログラミング言語です。機械学習やデータ分析でよく使用されます。",
             chunk_id="chunk_text_1",
@@ -77,21 +75,14 @@ def sample_text_documents(embedding_generator, multimodal_vector_store):
         ),
     ]
 
-    # テキストの埋め込みを生成
-    embeddings = embedding_generator.embed_documents([c.content for c in chunks])
 
-    # ベクトルストアに追加
-    multimodal_vector_store.add_documents(chunks, embeddings)
-
-    return chunks
-
-
-@pytest.fixture
-def sample_images(embedding_generator, multimodal_vector_store):
-    """サンプル画像ドキュメントを追加"""
-    from datetime import datetime
+@pytest.fixture(scope="module")
+def image_documents():
+    """サンプル画像ドキュメント
 
-    images = [
+    モジュール全体で同一インスタンスを共有するため、テスト内で変更しないこと。
+    """
+    return [
         ImageDocument(
             id="img_1",
             file_path=Path("/test/dog.jpg"),
@@ -114,81 +105,52 @@ def sample_images(embedding_generator, multimodal_vector_store):
         ),
     ]
 
-    # 画像のキャプションから埋め込みを生成
-    embeddings = embedding_generator.embed_documents([img.caption for img in images])
-
-    # ベクトルストアに追加
-    multimodal_vector_store.add_images(images, embeddings, collection_name="images")
-
-    return images
 
+@pytest.fixture(scope="module")
+def sample_embeddings(embedding_generator, text_chunks, image_documents):
+    """テキストチャンクと画像キャプションの埋め込みをまとめて一度だけ生成する
 
-class TestMultimodalSearch:
-    """マルチモーダル検索のテストクラス"""
-
-    def test_multimodal_search_text_only(
-        self,
-        multimodal_vector_store,
-        embedding_generator,
-        sample_text_documents
-    ):
-        """テキストのみ存在する場合のマルチモーダル検索"""
-        # クエリの埋め込みを生成
-        query = "Pythonについて"
-        query_embedding = embedding_generator.embed_query(query)
+    Returns:
+        dict[str, list[list[float]]]: "text"と"image"それぞれの埋め込みリスト
+    """
+    texts = [chunk.content for chunk in text_chunks]
+    captions = [img.caption for img in image_documents]
 
-        # マルチモーダル検索を実行
-        results = multimodal_vector_store.search_multimodal(
-            query_embedding=query_embedding,
-            top_k=5,
-            text_weight=0.5,
-            image_weight=0.5
-        )
+    # テキストとキャプションを一つのリクエストで埋め込み、結果を分割する
+    embeddings = embedding_generator.embed_documents(texts + captions)
+    return {"text": embeddings[:len(texts)], "image": embeddings[len(texts):]}
 
-        # テキスト結果のみが返されることを確認
-        assert len(results) > 0
-        assert all(r.result_type == 'text' for r in results)
 
-        # 最も関連性の高い結果がPythonに関するものであることを確認
-        assert "Python" in results[0].chunk.content
+@pytest.fixture(scope="class")
+def sample_text_documents(text_chunks, sample_embeddings, multimodal_vector_store):
+    """サンプルテキストドキュメントを追加"""
+    multimodal_vector_store.add_documents(text_chunks, sample_embeddings["text"])
+    return text_chunks
 
-    def test_multimodal_search_image_only(
-        self,
-        multimodal_vector_store,
-        embedding_generator,
-        sample_images
-    ):
-        """画像のみ存在する場合のマルチモーダル検索"""
-        # クエリの埋め込みを生成
-        query = "犬の写真"
-        query_embedding = embedding_generator.embed_query(query)
 
-        # マルチモーダル検索を実行
-        results = multimodal_vector_store.search_multimodal(
-            query_embedding=query_embedding,
-            top_k=5,
-            text_weight=0.5,
-            image_weight=0.5
-        )
+@pytest.fixture(scope="class")
+def sample_images(image_documents, sample_embeddings, multimodal_vector_store):
+    """サンプル画像ドキュメントを追加"""
+    multimodal_vector_store.add_images(
+        image_documents, sample_embeddings["image"], collection_name="images"
+    )
+    return image_documents
 
-        # 画像結果のみが返されることを確認
-        assert len(results) > 0
-        assert all(r.result_type == 'image' for r in results)
 
-        # 最も関連性の高い結果が犬に関するものであることを確認
-        assert "犬" in results[0].caption
+class TestMultimodalSearch:
+    """テキストと画像の両方を格納したストアでのマルチモーダル検索のテストクラス"""
 
     def test_multimodal_search_both(
         self,
         multimodal_vector_store,
-        embedding_generator,
+        embed_query,
         sample_text_documents,
         sample_images
     ):
         """テキストと画像の両方が存在する場合のマルチモーダル検索"""
         # クエリの埋め込みを生成
         query = "Python"
-        query_embedding = embedding_generator.embed_query(query)
+        query_embedding = embed_query(query)
 
         # マルチモーダル検索を実行
         results = multimodal_vector_store.search_multimodal(
@@ -206,7 +168,7 @@ class TestMultimodalSearch:
 
         # スコアが降順にソートされていることを確認
         scores = [r.score for r in results]
-        assert scores == sorted(scores, reverse=True)
+        assert all(a >= b for a, b in zip(scores, scores[1:]))
 
         # Pythonに関連するテキスト結果があることを確認
         python_texts = [r for r in results if r.result_type == 'text' and
@@ -216,13 +178,13 @@ class TestMultimodalSearch:
     def test_multimodal_search_weight_adjustment(
         self,
         multimodal_vector_store,
-        embedding_generator,
+        embed_query,
         sample_text_documents,
         sample_images
     ):
         """検索重みの調整が機能することを確認"""
         query = "Python"
-        query_embedding = embedding_generator.embed_query(query)
+        query_embedding = embed_query(query)
 
         # テキスト重視の検索
         text_heavy_results = multimodal_vector_store.search_multimodal(
@@ -251,7 +213,7 @@ class TestMultimodalSearch:
     def test_multimodal_search_empty_query(
         self,
         multimodal_vector_store,
-        embedding_generator,
+        embed_query,
         sample_text_documents,
         sample_images
     ):
@@ -261,37 +223,18 @@ class TestMultimodalSearch:
 
         query = "   "
         with pytest.raises((EmbeddingError, ValueError)):
-            query_embedding = embedding_generator.embed_query(query)
-
-    def test_multimodal_search_no_results(
-        self,
-        multimodal_vector_store,
-        embedding_generator
-    ):
-        """ドキュメントや画像がない場合の検索"""
-        query = "存在しない内容"
-        query_embedding = embedding_generator.embed_query(query)
-
-        # マルチモーダル検索を実行
-        results = multimodal_vector_store.search_multimodal(
-            query_embedding=query_embedding,
-            top_k=5
-        )
-
-        # 空の結果が返されることを確認
-        assert isinstance(results, list)
-        assert len(results) == 0
+            query_embedding = embed_query(query)
 
     def test_multimodal_search_top_k_limit(
         self,
         multimodal_vector_store,
-        embedding_generator,
+        embed_query,
         sample_text_documents,
         sample_images
     ):
         """top_k制限が正しく機能することを確認"""
         query = "Python"
-        query_embedding = embedding_generator.embed_query(query)
+        query_embedding = embed_query(query)
 
         # top_k=2で検索
         results = multimodal_vector_store.search_multimodal(
@@ -318,13 +261,13 @@ class TestMultimodalSearch:
     def test_multimodal_search_metadata(
         self,
         multimodal_vector_store,
-        embedding_generator,
+        embed_query,
         sample_text_documents,
         sample_images
     ):
         """検索結果にメタデータが含まれることを確認"""
         query = "Python"
-        query_embedding = embedding_generator.embed_query(query)
+        query_embedding = embed_query(query)
 
         # マルチモーダル検索を実行
         results = multimodal_vector_store.search_multimodal(
@@ -346,23 +289,87 @@ class TestMultimodalSearch:
                 assert result.metadata['search_type'] in ['text', 'image']
 
 
-@pytest.fixture(scope="module")
-def check_ollama_service():
-    """Ollamaサービスが起動しているかチェックする
+class TestMultimodalSearchTextOnly:
+    """テキストのみ格納したストアでのマルチモーダル検索のテストクラス"""
 
-    Yields:
-        bool: Ollamaが起動している場合True
-    """
-    import requests
+    def test_multimodal_search_text_only(
+        self,
+        multimodal_vector_store,
+        embed_query,
+        sample_text_documents
+    ):
+        """テキストのみ存在する場合のマルチモーダル検索"""
+        # クエリの埋め込みを生成
+        query = "Pythonについて"
+        query_embedding = embed_query(query)
 
-    try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
-        if response.status_code == 200:
-            yield True
-        else:
-            pytest.skip("Ollama service is not responding correctly")
-    except Exception as e:
-        pytest.skip(f"Ollama service is not available: {e}")
+        # マルチモーダル検索を実行
+        results = multimodal_vector_store.search_multimodal(
+            query_embedding=query_embedding,
+            top_k=5,
+            text_weight=0.5,
+            image_weight=0.5
+        )
+
+        # テキスト結果のみが返されることを確認
+        assert len(results) > 0
+        assert all(r.result_type == 'text' for r in results)
+
+        # 最も関連性の高い結果がPythonに関するものであることを確認
+        assert "Python" in results[0].chunk.content
+
+
+class TestMultimodalSearchImageOnly:
+    """画像のみ格納したストアでのマルチモーダル検索のテストクラス"""
+
+    def test_multimodal_search_image_only(
+        self,
+        multimodal_vector_store,
+        embed_query,
+        sample_images
+    ):
+        """画像のみ存在する場合のマルチモーダル検索"""
+        # クエリの埋め込みを生成
+        query = "犬の写真"
+        query_embedding = embed_query(query)
+
+        # マルチモーダル検索を実行
+        results = multimodal_vector_store.search_multimodal(
+            query_embedding=query_embedding,
+            top_k=5,
+            text_weight=0.5,
+            image_weight=0.5
+        )
+
+        # 画像結果のみが返されることを確認
+        assert len(results) > 0
+        assert all(r.result_type == 'image' for r in results)
+
+        # 最も関連性の高い結果が犬に関するものであることを確認
+        assert "犬" in results[0].caption
+
+
+class TestMultimodalSearchEmptyStore:
+    """空のストアでのマルチモーダル検索のテストクラス"""
+
+    def test_multimodal_search_no_results(
+        self,
+        multimodal_vector_store,
+        embed_query
+    ):
+        """ドキュメントや画像がない場合の検索"""
+        query = "存在しない内容"
+        query_embedding = embed_query(query)
+
+        # マルチモーダル検索を実行
+        results = multimodal_vector_store.search_multimodal(
+            query_embedding=query_embedding,
+            top_k=5
+        )
+
+        # 空の結果が返されることを確認
+        assert isinstance(results, list)
+        assert len(results) == 0
 
 
 @pytest.mark.integration
@@ -372,7 +379,7 @@ class TestMultimodalSearchIntegration:
     def test_real_multimodal_search(
         self,
         multimodal_vector_store,
-        embedding_generator,
+        embed_query,
         sample_text_documents,
         sample_images,
         check_ollama_service
@@ -387,7 +394,7 @@ class TestMultimodalSearchIntegration:
 
         for query in queries:
             logger.info(f"Testing query: {query}")
-            query_embedding = embedding_generator.embed_query(query)
+            query_embedding = embed_query(query)
 
             results = multimodal_vector_store.search_multimodal(
                 query_embedding=query_embedding,
@@ -7,31 +7,46 @@
 Ollamaが起動していない場合、テストはスキップされます。
 """
 
+import copy
+import math
 import pytest
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
+from src.models.document import SearchResult, Chunk
 from src.rag.embeddings import EmbeddingGenerator, EmbeddingError
 from src.rag.engine import RAGEngine, RAGEngineError
+from src.rag.vector_store import create_vector_store
 from src.utils.config import Config
 
 
-# Ollamaの起動チェック用のfixture
 @pytest.fixture(scope="module")
-def check_ollama_service():
-    """Ollamaサービスが起動しているかチェックする
-
-    Yields:
-        bool: Ollamaが起動している場合True
+def rag_engine(
+    integration_session_config, embedding_generator, check_ollama_service, tmp_path_factory
+):
+    """モジュール共有のRAGエンジン
+
+    回答生成のテストはベクトルストアの内容に依存しないため、
+    ベクトルストアと埋め込み生成器を含めてモジュールで一度だけ作成します。
+
+    Args:
+        integration_session_config: セッション共有の統合テスト用設定
+        embedding_generator: セッション共有の埋め込み生成器
+        check_ollama_service: Ollama起動チェック
+        tmp_path_factory: pytestが提供する一時ディレクトリファクトリ
+
+    Returns:
+        RAGEngine: 統合テスト用のRAGエンジン
     """
-    try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
-        if response.status_code == 200:
-            yield True
-        else:
-            pytest.skip("Ollama service is not responding correctly")
-    except Exception as e:
-        pytest.skip(f"Ollama service is not available: {e}")
+    # 共有設定は変更せず、複製したものに永続化ディレクトリを設定
+    config = copy.copy(integration_session_config)
+    config.chroma_persist_directory = str(tmp_path_factory.mktemp("ollama_chroma_db"))
+
+    return RAGEngine(
+        config=config,
+        vector_store=create_vector_store(config),
+        embedding_generator=embedding_generator
+    )
 
 
 @pytest.mark.integration
@@ -40,21 +55,18 @@ class TestOllamaEmbeddings:
 
     def test_embedding_generation_single_text(
         self,
-        integration_config: Config,
+        embedding_generator: EmbeddingGenerator,
         check_ollama_service
     ):
         """埋め込み生成の実行（単一テキスト）
 
         Args:
-            integration_config: 統合テスト用の設定
+            embedding_generator: セッション共有の埋め込み生成器
             check_ollama_service: Ollama起動チェック
         """
-        # EmbeddingGeneratorの初期化
-        generator = EmbeddingGenerator(integration_config)
-
         # 単一テキストの埋め込み生成
         text = "これはテスト用のテキストです。"
-        embedding = generator.embed_query(text)
+        embedding = embedding_generator.embed_query(text)
 
         # 埋め込みベクトルの検証
         assert embedding is not None
@@ -63,31 +75,28 @@ class TestOllamaEmbeddings:
         assert all(isinstance(val, float) for val in embedding)
 
         # 埋め込みの次元数を確認
-        dimension = generator.get_embedding_dimension()
+        dimension = embedding_generator.get_embedding_dimension()
         assert len(embedding) == dimension
         print(f"Embedding dimension: {dimension}")
 
     def test_embedding_generation_multiple_texts(
         self,
-        integration_config: Config,
+        embedding_generator: EmbeddingGenerator,
         check_ollama_service
     ):
         """埋め込み生成の実行（複数テキスト）
 
         Args:
-            integration_config: 統合テスト用の設定
+            embedding_generator: セッション共有の埋め込み生成器
             check_ollama_service: Ollama起動チェック
         """
-        # EmbeddingGeneratorの初期化
-        generator = EmbeddingGenerator(integration_config)
-
         # 複数テキストの埋め込み生成
         texts = [
             "Pythonは人気のあるプログラミング言語です。",
             "機械学習とデータサイエンスに広く使用されています。",
             "シンプルで読みやすい構文が特徴です。"
         ]
-        embeddings = generator.embed_documents(texts)
+        embeddings = embedding_generator.embed_documents(texts)
 
         # 埋め込みベクトルのリストの検証
         assert embeddings is not None
@@ -107,39 +116,31 @@ class TestOllamaEmbeddings:
 
     def test_embedding_similarity(
         self,
-        integration_config: Config,
+        embedding_generator: EmbeddingGenerator,
         check_ollama_service
     ):
         """意味的に類似したテキストの埋め込みが近いことを確認
 
         Args:
-            integration_config: 統合テスト用の設定
+            embedding_generator: セッション共有の埋め込み生成器
             check_ollama_service: Ollama起動チェック
         """
-        # EmbeddingGeneratorの初期化
-        generator = EmbeddingGenerator(integration_config)
-
         # 類似したテキストと異なるテキスト
         similar_text1 = "犬は忠実なペットです。"
         similar_text2 = "犬は人間の良い友達です。"
         different_text = "Pythonはプログラミング言語です。"
 
-        # 埋め込み生成
-        emb1 = generator.embed_query(similar_text1)
-        emb2 = generator.embed_query(similar_text2)
-        emb3 = generator.embed_query(different_text)
+        # 埋め込み生成（互いに独立したリクエストのため並列に実行）
+        texts = [similar_text1, similar_text2, different_text]
+        with ThreadPoolExecutor(max_workers=len(texts)) as executor:
+            emb1, emb2, emb3 = executor.map(embedding_generator.embed_query, texts)
 
-        # コサイン類似度を計算
-        def cosine_similarity(vec1, vec2):
-            import math
-            dot_product = sum(a * b for a, b in zip(vec1, vec2))
-            magnitude1 = math.sqrt(sum(a * a for a in vec1))
-            magnitude2 = math.sqrt(sum(b * b for b in vec2))
-            return dot_product / (magnitude1 * magnitude2)
+        # 各ベクトルのノルムは一度だけ計算し、内積はmath.sumprodでC実装のまま計算する
+        norm1, norm2, norm3 = (math.hypot(*emb) for emb in (emb1, emb2, emb3))
 
-        similarity_similar = cosine_similarity(emb1, emb2)
-        similarity_different1 = cosine_similarity(emb1, emb3)
-        similarity_different2 = cosine_similarity(emb2, emb3)
+        similarity_similar = math.sumprod(emb1, emb2) / (norm1 * norm2)
+        similarity_different1 = math.sumprod(emb1, emb3) / (norm1 * norm3)
+        similarity_different2 = math.sumprod(emb2, emb3) / (norm2 * norm3)
 
         print(f"Similarity (similar texts): {similarity_similar:.4f}")
         print(f"Similarity (different texts 1): {similarity_different1:.4f}")
@@ -151,28 +152,26 @@ class TestOllamaEmbeddings:
 
     def test_embedding_error_on_empty_input(
         self,
-        integration_config: Config,
+        embedding_generator: EmbeddingGenerator,
         check_ollama_service
     ):
         """空の入力でエラーが発生することを確認
 
         Args:
-            integration_config: 統合テスト用の設定
+            embedding_generator: セッション共有の埋め込み生成器
             check_ollama_service: Ollama起動チェック
         """
-        generator = EmbeddingGenerator(integration_config)
-
         # 空文字列でエラーが発生することを確認
         with pytest.raises(ValueError, match="cannot be empty"):
-            generator.embed_query("")
+            embedding_generator.embed_query("")
 
         # 空リストでエラーが発生することを確認
         with pytest.raises(ValueError, match="cannot be empty"):
-            generator.embed_documents([])
+            embedding_generator.embed_documents([])
 
         # 空文字列を含むリストでエラーが発生することを確認
         with pytest.raises(ValueError, match="cannot contain empty"):
-            generator.embed_documents(["valid text", "", "another text"])
+            embedding_generator.embed_documents(["valid text", "", "another text"])
 
 
 @pytest.mark.integration
@@ -181,30 +180,15 @@ class TestOllamaLLM:
 
     def test_llm_answer_generation(
         self,
-        integration_config: Config,
+        rag_engine: RAGEngine,
         check_ollama_service
     ):
         """LLMによる回答生成の実行
 
         Args:
-            integration_config: 統合テスト用の設定
+            rag_engine: モジュール共有のRAGエンジン
             check_ollama_service: Ollama起動チェック
         """
-        from src.rag.vector_store import BaseVectorStore, create_vector_store
-        from src.rag.embeddings import EmbeddingGenerator
-        from src.models.document import SearchResult, Chunk
-
-        # コンポーネントの初期化
-        vector_store = create_vector_store(integration_config)
-        embedding_generator = EmbeddingGenerator(integration_config)
-
-        # RAGEngineの作成
-        rag_engine = RAGEngine(
-            config=integration_config,
-            vector_store=vector_store,
-            embedding_generator=embedding_generator
-        )
-
         # コンテキストと質問を用意
         # SearchResultオブジェクトのリストを作成
         context_results = [
@@ -265,29 +249,15 @@ class TestOllamaLLM:
 
     def test_llm_answer_with_empty_context(
         self,
-        integration_config: Config,
+        rag_engine: RAGEngine,
         check_ollama_service
     ):
         """空のコンテキストでも回答が生成されることを確認
 
         Args:
-            integration_config: 統合テスト用の設定
+            rag_engine: モジュール共有のRAGエンジン
             check_ollama_service: Ollama起動チェック
         """
-        from src.rag.vector_store import BaseVectorStore, create_vector_store
-        from src.rag.embeddings import EmbeddingGenerator
-
-        # コンポーネントの初期化
-        vector_store = create_vector_store(integration_config)
-        embedding_generator = EmbeddingGenerator(integration_config)
-
-        # RAGEngineの作成
-        rag_engine = RAGEngine(
-            config=integration_config,
-            vector_store=vector_store,
-            embedding_generator=embedding_generator
-        )
-
         # 空のコンテキストで回答生成
         question = "こんにちは、調子はどうですか？"
         answer = rag_engine.generate_answer(
@@ -308,30 +278,15 @@ class TestOllamaLLM:
 
     def test_llm_answer_with_custom_template(
         self,
-        integration_config: Config,
+        rag_engine: RAGEngine,
         check_ollama_service
     ):
         """カスタムプロンプトテンプレートの使用
 
         Args:
-            integration_config: 統合テスト用の設定
+            rag_engine: モジュール共有のRAGエンジン
             check_ollama_service: Ollama起動チェック
         """
-        from src.rag.vector_store import BaseVectorStore, create_vector_store
-        from src.rag.embeddings import EmbeddingGenerator
-        from src.models.document import SearchResult, Chunk
-
-        # コンポーネントの初期化
-        vector_store = create_vector_store(integration_config)
-        embedding_generator = EmbeddingGenerator(integration_config)
-
-        # RAGEngineの作成
-        rag_engine = RAGEngine(
-            config=integration_config,
-            vector_store=vector_store,
-            embedding_generator=embedding_generator
-        )
-
         # カスタムテンプレートを使用
         custom_template = """以下の情報に基づいて、質問に簡潔に答えてください。
 
@@ -3,246 +3,368 @@
 すべてのベクトルDB実装に対して共通のテストを実行します。
 """
 
+import copy
+import random
+import time
+
 import pytest
-from src.rag.vector_store import create_vector_store, get_supported_db_types
+from src.rag.vector_store import create_vector_store, get_supported_db_types, is_db_available
 from src.models.document import Chunk, SearchResult
-from src.utils.config import Config
 
 
-@pytest.fixture(scope="module")
+# 一括投入テストのチャンク数と許容時間（秒）
+_BULK_INGEST_SIZE = 256
+_BULK_INGEST_BUDGET_S = 30.0
+
+# ベクトルDB種別ごとのパラメータ
+# クライアントライブラリが未インストールの種別は収集時にスキップし、
+# pytest-xdistの --dist loadgroup で種別ごとに別のワーカーへ割り当てる
+_DB_TYPE_PARAMS = [
+    pytest.param(
+        db_type,
+        marks=[
+            pytest.mark.skipif(
+                not is_db_available(db_type),
+                reason=f"{db_type} のクライアントライブラリがインストールされていません",
+            ),
+            pytest.mark.xdist_group(name=f"vdb_{db_type}"),
+        ],
+    )
+    for db_type in ("chroma", "qdrant")
+]
+
+
+# サンプルチャンク共通のメタデータ
+_SAMPLE_METADATA = {
+    "document_name": "test.txt",
+    "source": "/tmp/test.txt",
+    "doc_type": "text",
+    "size": 50,
+}
+
+
+def _make_chunk(index, document_id="doc-001"):
+    """テスト用のチャンクを作成する
+
+    Chunk.__post_init__ はメタデータにチャンク固有の値を書き込むため、
+    共通メタデータはチャンクごとにコピーして渡します。
+
+    Args:
+        index: チャンクのインデックス（0始まり）
+        document_id: 親ドキュメントID
+
+    Returns:
+        Chunk: chunk_idが "chunk-{index + 1:03d}" のチャンク
+    """
+    return Chunk(
+        content=f"これはテストドキュメントの{index + 1}番目のチャンクです。",
+        chunk_id=f"chunk-{index + 1:03d}",
+        document_id=document_id,
+        chunk_index=index,
+        start_char=index * 50,
+        end_char=(index + 1) * 50,
+        metadata=dict(_SAMPLE_METADATA),
+    )
+
+
+@pytest.fixture(scope="session")
 def sample_chunks():
     """テスト用のサンプルチャンク"""
-    return [
-        Chunk(
-            content="これはテストドキュメントの最初のチャンクです。",
-            chunk_id="chunk-001",
-            document_id="doc-001",
-            chunk_index=0,
-            start_char=0,
-            end_char=50,
-            metadata={
-                "document_name": "test.txt",
-                "source": "/tmp/test.txt",
-                "doc_type": "text",
-                "size": 50,
-            }
-        ),
-        Chunk(
-            content="これはテストドキュメントの2番目のチャンクです。",
-            chunk_id="chunk-002",
-            document_id="doc-001",
-            chunk_index=1,
-            start_char=50,
-            end_char=100,
-            metadata={
-                "document_name": "test.txt",
-                "source": "/tmp/test.txt",
-                "doc_type": "text",
-                "size": 50,
-            }
-        ),
-    ]
+    return [_make_chunk(0), _make_chunk(1)]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def sample_embeddings():
-    """テスト用のサンプル埋め込みベクトル"""
-    import random
-    random.seed(42)
+    """テスト用のサンプル埋め込みベクトル（セッションで一度だけ生成）"""
+    # グローバルな乱数状態を変更しないよう専用の乱数生成器を使用
+    rng = random.Random(42)
 
     # 384次元のランダムベクトル（nomic-embed-textと同じ次元）
-    return [
-        [random.random() for _ in range(384)],
-        [random.random() for _ in range(384)],
-    ]
+    return [[rng.random() for _ in range(384)] for _ in range(2)]
 
 
-@pytest.mark.parametrize("db_type", ["chroma", "qdrant"])
-def test_vector_store_initialization(db_type):
-    """ベクトルストアの初期化テスト"""
-    config = Config()
+def _create_vector_store(base_config, db_type, collection_name):
+    """指定したベクトルDB種別のストアを作成する（未初期化）
+
+    Args:
+        base_config: 複製元の設定（変更されません）
+        db_type: ベクトルDB種別
+        collection_name: コレクション名
+
+    Returns:
+        BaseVectorStore: 未初期化のベクトルストア
+    """
+    # 共有設定は変更せず、複製したものにベクトルDB種別を設定
+    # （Chromaは永続化が不要なためメモリ上で動作させる）
+    config = copy.copy(base_config)
     config.vector_db_type = db_type
+    config.chroma_in_memory = True
+    return create_vector_store(config, collection_name=collection_name)
 
-    vector_store = create_vector_store(config)
 
-    try:
-        vector_store.initialize()
-        assert vector_store is not None
-    except Exception as e:
-        pytest.skip(f"{db_type} が利用できません: {str(e)}")
-    finally:
-        vector_store.close()
+@pytest.fixture(scope="session")
+def backend_available(integration_session_config):
+    """各ベクトルDBが利用可能かをセッションで一度だけ確認
 
+    クライアントライブラリの有無は収集時に判定済みのため、
+    ここではサーバーへの接続など初期化できるかを確認します。
 
-@pytest.mark.parametrize("db_type", ["chroma", "qdrant"])
-def test_add_and_search(db_type, sample_chunks, sample_embeddings):
-    """ドキュメント追加と検索のテスト"""
-    config = Config()
-    config.vector_db_type = db_type
+    Args:
+        integration_session_config: セッション共有の統合テスト用設定
 
-    vector_store = create_vector_store(config, collection_name=f"test_{db_type}")
+    Returns:
+        dict[str, Optional[str]]: ベクトルDB種別ごとの利用できない理由（利用可能な場合はNone）
+    """
+    availability = {}
+    for db_type in ("chroma", "qdrant"):
+        if not is_db_available(db_type):
+            availability[db_type] = "クライアントライブラリがインストールされていません"
+            continue
 
-    try:
-        # 初期化
-        vector_store.initialize()
+        vector_store = None
+        try:
+            vector_store = _create_vector_store(
+                integration_session_config, db_type, "test_probe"
+            )
+            vector_store.initialize()
+            availability[db_type] = None
+        except Exception as e:
+            availability[db_type] = str(e)
+        finally:
+            if vector_store is not None:
+                vector_store.close()
+    return availability
 
-        # ドキュメント追加
-        vector_store.add_documents(sample_chunks, sample_embeddings)
 
-        # ドキュメント数確認
-        count = vector_store.get_document_count()
-        assert count == 2
+def _open_vector_store(base_config, backend_available, db_type, collection_name):
+    """指定したベクトルDB種別のストアを作成して初期化する
 
-        # 検索実行
-        results = vector_store.search(
-            query_embedding=sample_embeddings[0],
-            n_results=2
-        )
+    利用できないベクトルDBの場合は初期化を試みずに呼び出し元をスキップします。
+    利用可能なベクトルDBでの初期化失敗はスキップせずエラーとして扱います。
 
-        # 結果検証
-        assert len(results) > 0
-        assert isinstance(results[0], SearchResult)
-        assert results[0].score > 0
+    Args:
+        base_config: 複製元の設定（変更されません）
+        backend_available: ベクトルDB種別ごとの利用可否
+        db_type: ベクトルDB種別
+        collection_name: コレクション名
 
-    except Exception as e:
-        pytest.skip(f"{db_type} が利用できません: {str(e)}")
-    finally:
-        # クリーンアップ
-        try:
-            vector_store.clear()
-        except:
-            pass
-        vector_store.close()
+    Returns:
+        BaseVectorStore: 初期化済みのベクトルストア
+    """
+    reason = backend_available[db_type]
+    if reason is not None:
+        pytest.skip(f"{db_type} が利用できません: {reason}")
 
+    vector_store = _create_vector_store(base_config, db_type, collection_name)
+    vector_store.initialize()
+    return vector_store
 
-@pytest.mark.parametrize("db_type", ["chroma", "qdrant"])
-def test_delete_operations(db_type, sample_chunks, sample_embeddings):
-    """削除操作のテスト"""
-    config = Config()
-    config.vector_db_type = db_type
 
-    vector_store = create_vector_store(config, collection_name=f"test_delete_{db_type}")
+@pytest.fixture(scope="session", params=_DB_TYPE_PARAMS)
+def shared_vector_store(request, integration_session_config, backend_available):
+    """ベクトルDB種別ごとにセッションで一度だけ初期化するベクトルストア
 
-    try:
-        # 初期化とデータ追加
-        vector_store.initialize()
-        vector_store.add_documents(sample_chunks, sample_embeddings)
+    利用できないベクトルDBは一度だけスキップされ、
+    依存するすべてのテストもスキップされます。
 
-        initial_count = vector_store.get_document_count()
-        assert initial_count == 2
+    Args:
+        request: pytestのFixtureRequest（paramにベクトルDB種別）
+        integration_session_config: セッション共有の統合テスト用設定
+        backend_available: ベクトルDB種別ごとの利用可否
 
-        # 1つ削除
-        deleted_count = vector_store.delete(chunk_ids=["chunk-001"])
-        assert deleted_count == 1
+    Yields:
+        BaseVectorStore: 初期化済みのベクトルストア
+    """
+    db_type = request.param
+    vector_store = _open_vector_store(
+        integration_session_config, backend_available, db_type, f"test_{db_type}"
+    )
 
-        # 残り確認
-        remaining_count = vector_store.get_document_count()
-        assert remaining_count == 1
+    yield vector_store
 
-    except Exception as e:
-        pytest.skip(f"{db_type} が利用できません: {str(e)}")
-    finally:
-        try:
-            vector_store.clear()
-        except:
-            pass
-        vector_store.close()
+    vector_store.clear()
+    vector_store.close()
 
 
-@pytest.mark.parametrize("db_type", ["chroma", "qdrant"])
-def test_list_documents(db_type, sample_chunks, sample_embeddings):
-    """ドキュメント一覧取得のテスト"""
-    config = Config()
-    config.vector_db_type = db_type
+@pytest.fixture
+def vector_store(shared_vector_store):
+    """テストごとに空の状態から使用するベクトルストア
 
-    vector_store = create_vector_store(config, collection_name=f"test_list_{db_type}")
+    ストアはセッションで共有し、テスト終了時にclear()でデータのみ削除します。
 
-    try:
-        # 初期化とデータ追加
-        vector_store.initialize()
-        vector_store.add_documents(sample_chunks, sample_embeddings)
+    Args:
+        shared_vector_store: セッション共有のベクトルストア
 
-        # ドキュメント一覧取得
-        documents = vector_store.list_documents()
+    Yields:
+        BaseVectorStore: 初期化済みのベクトルストア
+    """
+    yield shared_vector_store
+    shared_vector_store.clear()
 
-        assert len(documents) == 1  # 1つのドキュメントに2つのチャンク
-        assert documents[0]["document_id"] == "doc-001"
-        assert documents[0]["chunk_count"] == 2
 
-    except Exception as e:
-        pytest.skip(f"{db_type} が利用できません: {str(e)}")
-    finally:
-        try:
-            vector_store.clear()
-        except:
-            pass
-        vector_store.close()
+@pytest.fixture(scope="session", params=_DB_TYPE_PARAMS)
+def populated_store(
+    request, integration_session_config, backend_available, sample_chunks, sample_embeddings
+):
+    """サンプルデータを一度だけ投入した読み取り専用テスト用のベクトルストア
 
+    データを変更するテストは使用せず、vector_store フィクスチャを使用してください。
 
-@pytest.mark.parametrize("db_type", ["chroma", "qdrant"])
-def test_get_document_by_id(db_type, sample_chunks, sample_embeddings):
-    """ドキュメントID指定取得のテスト"""
-    config = Config()
-    config.vector_db_type = db_type
+    Args:
+        request: pytestのFixtureRequest（paramにベクトルDB種別）
+        integration_session_config: セッション共有の統合テスト用設定
+        backend_available: ベクトルDB種別ごとの利用可否
+        sample_chunks: テスト用のサンプルチャンク
+        sample_embeddings: テスト用のサンプル埋め込みベクトル
+
+    Yields:
+        BaseVectorStore: サンプルデータ投入済みのベクトルストア
+    """
+    db_type = request.param
+    vector_store = _open_vector_store(
+        integration_session_config, backend_available, db_type, f"test_ro_{db_type}"
+    )
+    vector_store.add_documents(sample_chunks, sample_embeddings)
+
+    yield vector_store
 
-    vector_store = create_vector_store(config, collection_name=f"test_get_{db_type}")
+    vector_store.clear()
+    vector_store.close()
 
+
+@pytest.mark.parametrize("db_type", _DB_TYPE_PARAMS)
+def test_vector_store_initialization(db_type, integration_session_config, backend_available):
+    """ベクトルストアの初期化テスト"""
+    vector_store = _open_vector_store(
+        integration_session_config, backend_available, db_type, "test_probe"
+    )
     try:
-        # 初期化とデータ追加
-        vector_store.initialize()
-        vector_store.add_documents(sample_chunks, sample_embeddings)
-
-        # ドキュメントをIDで取得
-        document = vector_store.get_document_by_id("doc-001")
-
-        assert document is not None
-        assert document["document_id"] == "doc-001"
-        assert document["chunk_count"] == 2
-        assert len(document["chunks"]) == 2
-        assert document["chunks"][0]["chunk_index"] == 0
-        assert document["chunks"][1]["chunk_index"] == 1
-
-    except Exception as e:
-        pytest.skip(f"{db_type} が利用できません: {str(e)}")
+        assert vector_store is not None
     finally:
-        try:
-            vector_store.clear()
-        except:
-            pass
         vector_store.close()
 
 
-@pytest.mark.parametrize("db_type", ["chroma", "qdrant"])
-def test_clear_all_documents(db_type, sample_chunks, sample_embeddings):
-    """全ドキュメント削除のテスト"""
-    config = Config()
-    config.vector_db_type = db_type
+def test_add_documents(vector_store, sample_chunks, sample_embeddings):
+    """ドキュメント追加のテスト"""
+    # ドキュメント追加
+    vector_store.add_documents(sample_chunks, sample_embeddings)
 
-    vector_store = create_vector_store(config, collection_name=f"test_clear_{db_type}")
+    # ドキュメント数確認
+    count = vector_store.get_document_count()
+    assert count == 2
 
-    try:
-        # 初期化とデータ追加
-        vector_store.initialize()
-        vector_store.add_documents(sample_chunks, sample_embeddings)
 
-        initial_count = vector_store.get_document_count()
-        assert initial_count == 2
+def test_search(populated_store, sample_embeddings):
+    """検索のテスト"""
+    # 検索実行
+    results = populated_store.search(
+        query_embedding=sample_embeddings[0],
+        n_results=2
+    )
+
+    # 結果検証
+    assert len(results) > 0
+    assert isinstance(results[0], SearchResult)
+    assert results[0].score > 0
 
-        # 全削除
-        vector_store.clear()
 
-        # 空になっていることを確認
-        count = vector_store.get_document_count()
-        assert count == 0
+def test_delete_operations(vector_store, sample_chunks, sample_embeddings):
+    """削除操作のテスト"""
+    # データ追加
+    vector_store.add_documents(sample_chunks, sample_embeddings)
+
+    initial_count = vector_store.get_document_count()
+    assert initial_count == 2
+
+    # 1つ削除
+    deleted_count = vector_store.delete(chunk_ids=["chunk-001"])
+    assert deleted_count == 1
+
+    # 残り確認
+    remaining_count = vector_store.get_document_count()
+    assert remaining_count == 1
+
+
+def test_list_documents(populated_store):
+    """ドキュメント一覧取得のテスト"""
+    # ドキュメント一覧取得
+    documents = populated_store.list_documents()
+
+    assert len(documents) == 1  # 1つのドキュメントに2つのチャンク
+    assert documents[0]["document_id"] == "doc-001"
+    assert documents[0]["chunk_count"] == 2
 
-    except Exception as e:
-        pytest.skip(f"{db_type} が利用できません: {str(e)}")
+
+def test_get_document_by_id(populated_store):
+    """ドキュメントID指定取得のテスト"""
+    # ドキュメントをIDで取得
+    document = populated_store.get_document_by_id("doc-001")
+
+    assert document is not None
+    assert document["document_id"] == "doc-001"
+    assert document["chunk_count"] == 2
+    assert len(document["chunks"]) == 2
+    assert document["chunks"][0]["chunk_index"] == 0
+    assert document["chunks"][1]["chunk_index"] == 1
+
+
+def test_clear_all_documents(vector_store, sample_chunks, sample_embeddings):
+    """全ドキュメント削除のテスト"""
+    # データ追加
+    vector_store.add_documents(sample_chunks, sample_embeddings)
+
+    initial_count = vector_store.get_document_count()
+    assert initial_count == 2
+
+    # 全削除
+    vector_store.clear()
+
+    # 空になっていることを確認
+    count = vector_store.get_document_count()
+    assert count == 0
+
+
+def test_bulk_ingest_speed(vector_store):
+    """多数のチャンクを一括投入できることと、投入時間が許容範囲内であることを確認"""
+    rng = random.Random(0)
+    chunks = [
+        _make_chunk(i, document_id=f"bulk-doc-{i // 16:03d}")
+        for i in range(_BULK_INGEST_SIZE)
+    ]
+    embeddings = [[rng.random() for _ in range(384)] for _ in range(_BULK_INGEST_SIZE)]
+
+    start = time.perf_counter()
+    vector_store.add_documents(chunks, embeddings)
+    elapsed = time.perf_counter() - start
+
+    assert vector_store.get_document_count() == _BULK_INGEST_SIZE
+    assert elapsed < _BULK_INGEST_BUDGET_S, (
+        f"{_BULK_INGEST_SIZE}件の一括投入に{elapsed:.2f}秒かかりました"
+    )
+
+
+def test_chroma_in_memory_stores_are_isolated(
+    integration_session_config, backend_available, sample_chunks, sample_embeddings
+):
+    """同名コレクションのメモリ上Chromaストア同士が互いに影響しないことを確認"""
+    store_a = _open_vector_store(
+        integration_session_config, backend_available, "chroma", "test_isolated"
+    )
+    store_b = _open_vector_store(
+        integration_session_config, backend_available, "chroma", "test_isolated"
+    )
+    try:
+        store_a.add_documents(sample_chunks, sample_embeddings)
+        assert store_a.get_document_count() == 2
+        assert store_b.get_document_count() == 0
+
+        # 一方をクローズしても他方はそのまま利用できる
+        store_a.close()
+        store_b.add_documents(sample_chunks, sample_embeddings)
+        assert store_b.get_document_count() == 2
     finally:
-        try:
-            vector_store.clear()
-        except:
-            pass
-        vector_store.close()
+        store_a.close()
+        store_b.close()
 
 
 def test_get_supported_db_types():
@@ -4,35 +4,77 @@ Config クラスの機能を検証します。
 """
 
 import os
+import re
 import tempfile
 from pathlib import Path
 import pytest
 
-from src.utils.config import Config, ConfigError, get_config
+from src.utils.config import Config, ConfigError, _build_config, get_config
+
+
+# テスト前に削除する設定関連の環境変数
+CONFIG_ENV_KEYS = (
+    "OLLAMA_BASE_URL",
+    "OLLAMA_LLM_MODEL",
+    "OLLAMA_EMBEDDING_MODEL",
+    "CHROMA_PERSIST_DIRECTORY",
+    "CHUNK_SIZE",
+    "CHUNK_OVERLAP",
+    "LOG_LEVEL",
+)
+
+# 複数の要素を含むエラーメッセージの検証用パターン
+_CHUNK_SIZE_RANGE_RE = re.compile(r"CHUNK_SIZE must be between 100 and 10000")
+_CHUNK_OVERLAP_LESS_THAN_RE = re.compile(r"must be less than CHUNK_SIZE")
+_TEXT_WEIGHT_RANGE_RE = re.compile(r"MULTIMODAL_SEARCH_TEXT_WEIGHT must be between 0\.0 and 1\.0")
+_IMAGE_WEIGHT_RANGE_RE = re.compile(r"MULTIMODAL_SEARCH_IMAGE_WEIGHT must be between 0\.0 and 1\.0")
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch, empty_env_file):
+    """設定関連の環境変数を削除し、空の.envファイルのパスを返す
+
+    空の.envファイルを渡すことで、プロジェクトの.envが読み込まれないようにします。
+
+    Args:
+        monkeypatch: pytestのMonkeyPatch
+        empty_env_file: セッション共有の空の.envファイルのパス
+
+    Returns:
+        str: 空の.envファイルのパス
+    """
+    for key in CONFIG_ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+
+    return empty_env_file
+
+
+@pytest.fixture(scope="session")
+def default_config(empty_env_file):
+    """セッションで一度だけ作成するデフォルト値のConfig
+
+    セッションスコープのフィクスチャはclean_envより先に作成されるため、
+    作成時のみ設定関連の環境変数を削除します。
+    変更を加えるテストでは使用せず、個別にConfigを作成してください。
+
+    Args:
+        empty_env_file: セッション共有の空の.envファイルのパス
+
+    Returns:
+        Config: デフォルト値の設定
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for key in CONFIG_ENV_KEYS:
+            mp.delenv(key, raising=False)
+        return Config(env_file=empty_env_file)
 
 
 class TestConfigNormalCases:
     """Config クラスの正常系テスト"""
 
-    def test_default_config_creation(self, monkeypatch, tmp_path):
+    def test_default_config_creation(self, default_config):
         """デフォルト値でのConfig作成"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # 空の.envファイルを作成して、プロジェクトの.envが読み込まれないようにする
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = default_config
 
         # デフォルト値の確認
         assert config.ollama_base_url == Config.DEFAULT_OLLAMA_BASE_URL
@@ -65,20 +107,28 @@ class TestConfigNormalCases:
         assert config.chunk_overlap == 100
         assert config.log_level == "DEBUG"
 
-    def test_config_from_custom_env_file(self, tmp_path, monkeypatch):
-        """カスタム.envファイルからの読み込み"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
+    @pytest.mark.parametrize("raw,expected", [
+        ("true", True),
+        ("True", True),
+        (" yes ", True),
+        ("1", True),
+        ("on", True),
+        ("false", False),
+        ("0", False),
+        ("", False),
+    ])
+    def test_bool_flags_from_environment_variables(self, monkeypatch, raw, expected):
+        """真偽値フラグが空白・大文字小文字を無視して解釈されることを確認"""
+        monkeypatch.setenv("IMAGE_CAPTION_AUTO_GENERATE", raw)
+        monkeypatch.setenv("IMAGE_RESIZE_ENABLED", raw)
+
+        config = Config(env_file=None)
+
+        assert config.image_caption_auto_generate is expected
+        assert config.image_resize_enabled is expected
 
+    def test_config_from_custom_env_file(self, tmp_path):
+        """カスタム.envファイルからの読み込み"""
         # テスト用の.envファイルを作成
         env_file = tmp_path / "test.env"
         env_file.write_text(
@@ -102,26 +152,9 @@ class TestConfigNormalCases:
         assert config.chunk_overlap == 150
         assert config.log_level == "WARNING"
 
-    def test_to_dict_method(self, monkeypatch, tmp_path):
+    def test_to_dict_method(self, default_config):
         """to_dict()メソッドが全設定を返すことを確認"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # 空の.envファイルを作成して、プロジェクトの.envが読み込まれないようにする
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
-        config_dict = config.to_dict()
+        config_dict = default_config.to_dict()
 
         # 辞書に全ての設定項目が含まれることを確認
         assert "ollama_base_url" in config_dict
@@ -141,6 +174,44 @@ class TestConfigNormalCases:
         assert config_dict["chunk_overlap"] == Config.DEFAULT_CHUNK_OVERLAP
         assert config_dict["log_level"] == Config.DEFAULT_LOG_LEVEL
 
+    def test_str_is_single_line(self, monkeypatch):
+        """str()は1行形式、repr()は複数行形式で設定を返すことを確認"""
+        monkeypatch.setenv("CHUNK_SIZE", "800")
+
+        config = Config(env_file=None)
+
+        assert "\n" not in str(config)
+        assert "chunk_size=800" in str(config)
+        assert "\n  chunk_size: 800\n" in repr(config)
+
+    def test_default_dotenv_path_is_reused(self, monkeypatch):
+        """env_file省略時はモジュール読み込み時に探索した.envのパスを渡すことを確認"""
+        import src.utils.config as config_module
+
+        loaded_paths = []
+        monkeypatch.setattr(config_module, "_DOTENV_PATH", "/path/to/.env")
+        monkeypatch.setattr(config_module, "load_dotenv", loaded_paths.append)
+
+        Config()
+        Config()
+
+        assert loaded_paths == ["/path/to/.env", "/path/to/.env"]
+
+    def test_overrides_take_precedence_without_loading_dotenv(self, monkeypatch):
+        """overrides指定時は環境変数より優先され、.envファイルを読み込まないことを確認"""
+        import src.utils.config as config_module
+
+        loaded_paths = []
+        monkeypatch.setattr(config_module, "load_dotenv", loaded_paths.append)
+        monkeypatch.setenv("CHUNK_SIZE", "800")
+        monkeypatch.setenv("LOG_LEVEL", "WARNING")
+
+        config = Config(overrides={"CHUNK_SIZE": "600"})
+
+        assert config.chunk_size == 600
+        assert config.log_level == "WARNING"
+        assert loaded_paths == []
+
     def test_get_chroma_path_returns_path_object(self, monkeypatch):
         """get_chroma_path()が正しいPathオブジェクトを返すことを確認"""
         monkeypatch.setenv("CHROMA_PERSIST_DIRECTORY", "./test_chroma_db")
@@ -155,6 +226,22 @@ class TestConfigNormalCases:
         # パスの末尾が正しいことを確認
         assert chroma_path.name == "test_chroma_db"
 
+    def test_get_chroma_path_follows_directory_change(self, tmp_path, monkeypatch):
+        """chroma_persist_directoryの変更後はget_chroma_path()が新しいパスを返すことを確認"""
+        monkeypatch.setenv("CHROMA_PERSIST_DIRECTORY", str(tmp_path / "first"))
+
+        config = Config(env_file=None)
+        first_path = config.get_chroma_path()
+
+        # 同じ値の間はキャッシュされたオブジェクトが返される
+        assert config.get_chroma_path() is first_path
+
+        config.chroma_persist_directory = str(tmp_path / "second")
+        config.ensure_chroma_directory()
+
+        assert config.get_chroma_path().name == "second"
+        assert (tmp_path / "second").is_dir()
+
     def test_ensure_chroma_directory_creates_directory(self, tmp_path, monkeypatch):
         """ensure_chroma_directory()でディレクトリが作成されることを確認"""
         # テスト用の一時ディレクトリパスを設定
@@ -193,381 +280,202 @@ class TestConfigNormalCases:
 class TestConfigValidationErrors:
     """Config クラスのバリデーション異常系テスト"""
 
-    def test_invalid_ollama_base_url_without_protocol(self, monkeypatch, tmp_path):
-        """http/https以外のOLLAMA_BASE_URLでConfigErrorが発生"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # 不正なURLを設定（プロトコルなし）
-        monkeypatch.setenv("OLLAMA_BASE_URL", "localhost:11434")
-
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        # ConfigErrorが発生することを確認
-        with pytest.raises(ConfigError) as exc_info:
-            Config(env_file=str(empty_env_file))
-
-        assert "must start with http:// or https://" in str(exc_info.value)
-
-    def test_invalid_ollama_base_url_with_invalid_protocol(self, monkeypatch, tmp_path):
-        """ftp://などの不正なプロトコルでConfigErrorが発生"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # 不正なプロトコルを設定
-        monkeypatch.setenv("OLLAMA_BASE_URL", "ftp://localhost:11434")
-
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        # ConfigErrorが発生することを確認
-        with pytest.raises(ConfigError) as exc_info:
-            Config(env_file=str(empty_env_file))
-
-        assert "must start with http:// or https://" in str(exc_info.value)
-
-    def test_empty_ollama_llm_model(self, monkeypatch, tmp_path):
-        """空のOLLAMA_LLM_MODELでConfigErrorが発生"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # 空のモデル名を設定
-        monkeypatch.setenv("OLLAMA_LLM_MODEL", "   ")
-
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        # ConfigErrorが発生することを確認
-        with pytest.raises(ConfigError) as exc_info:
-            Config(env_file=str(empty_env_file))
-
-        assert "OLLAMA_LLM_MODEL cannot be empty" in str(exc_info.value)
-
-    def test_empty_ollama_embedding_model(self, monkeypatch, tmp_path):
-        """空のOLLAMA_EMBEDDING_MODELでConfigErrorが発生"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # 空の埋め込みモデル名を設定
-        monkeypatch.setenv("OLLAMA_EMBEDDING_MODEL", "")
-
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        # ConfigErrorが発生することを確認
-        with pytest.raises(ConfigError) as exc_info:
-            Config(env_file=str(empty_env_file))
-
-        assert "OLLAMA_EMBEDDING_MODEL cannot be empty" in str(exc_info.value)
-
-    def test_chunk_size_too_small(self, monkeypatch, tmp_path):
-        """CHUNK_SIZEが最小値未満でConfigErrorが発生"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # 最小値未満のチャンクサイズを設定
-        monkeypatch.setenv("CHUNK_SIZE", "50")
-
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        # ConfigErrorが発生することを確認
-        with pytest.raises(ConfigError) as exc_info:
-            Config(env_file=str(empty_env_file))
-
-        assert "CHUNK_SIZE must be between" in str(exc_info.value)
-        assert "100" in str(exc_info.value)
-
-    def test_chunk_size_too_large(self, monkeypatch, tmp_path):
-        """CHUNK_SIZEが最大値超過でConfigErrorが発生"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # 最大値超過のチャンクサイズを設定
-        monkeypatch.setenv("CHUNK_SIZE", "20000")
-
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        # ConfigErrorが発生することを確認
-        with pytest.raises(ConfigError) as exc_info:
-            Config(env_file=str(empty_env_file))
-
-        assert "CHUNK_SIZE must be between" in str(exc_info.value)
-        assert "10000" in str(exc_info.value)
-
-    def test_chunk_overlap_negative(self, monkeypatch, tmp_path):
-        """CHUNK_OVERLAPが負数でConfigErrorが発生"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # 負数のオーバーラップを設定
-        monkeypatch.setenv("CHUNK_OVERLAP", "-10")
-
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        # ConfigErrorが発生することを確認
-        with pytest.raises(ConfigError) as exc_info:
-            Config(env_file=str(empty_env_file))
-
-        assert "CHUNK_OVERLAP must be >=" in str(exc_info.value)
-
-    def test_chunk_overlap_greater_than_or_equal_to_chunk_size(self, monkeypatch, tmp_path):
-        """CHUNK_OVERLAP >= CHUNK_SIZEでConfigErrorが発生"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # CHUNK_OVERLAP >= CHUNK_SIZEとなる値を設定
-        monkeypatch.setenv("CHUNK_SIZE", "500")
-        monkeypatch.setenv("CHUNK_OVERLAP", "500")
-
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        # ConfigErrorが発生することを確認
-        with pytest.raises(ConfigError) as exc_info:
-            Config(env_file=str(empty_env_file))
-
-        assert "must be less than" in str(exc_info.value)
-        assert "CHUNK_SIZE" in str(exc_info.value)
-
-    def test_chunk_overlap_greater_than_chunk_size(self, monkeypatch, tmp_path):
-        """CHUNK_OVERLAP > CHUNK_SIZEでConfigErrorが発生"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # CHUNK_OVERLAP > CHUNK_SIZEとなる値を設定
-        monkeypatch.setenv("CHUNK_SIZE", "500")
-        monkeypatch.setenv("CHUNK_OVERLAP", "600")
-
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        # ConfigErrorが発生することを確認
-        with pytest.raises(ConfigError) as exc_info:
-            Config(env_file=str(empty_env_file))
-
-        assert "must be less than" in str(exc_info.value)
-
-    def test_invalid_log_level(self, monkeypatch, tmp_path):
-        """不正なLOG_LEVELでConfigErrorが発生"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # 不正なログレベルを設定
-        monkeypatch.setenv("LOG_LEVEL", "INVALID")
-
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        # ConfigErrorが発生することを確認
-        with pytest.raises(ConfigError) as exc_info:
-            Config(env_file=str(empty_env_file))
-
-        assert "LOG_LEVEL must be one of" in str(exc_info.value)
-
-    def test_chunk_size_not_integer(self, monkeypatch, tmp_path):
-        """CHUNK_SIZEが整数でない場合にConfigErrorが発生"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # 整数でない値を設定
-        monkeypatch.setenv("CHUNK_SIZE", "not_a_number")
-
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        # ConfigErrorが発生することを確認
-        with pytest.raises(ConfigError) as exc_info:
-            Config(env_file=str(empty_env_file))
-
-        assert "CHUNK_SIZE must be an integer" in str(exc_info.value)
-
-    def test_chunk_overlap_not_integer(self, monkeypatch, tmp_path):
-        """CHUNK_OVERLAPが整数でない場合にConfigErrorが発生"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # 整数でない値を設定
-        monkeypatch.setenv("CHUNK_OVERLAP", "12.5")
-
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        # ConfigErrorが発生することを確認
-        with pytest.raises(ConfigError) as exc_info:
-            Config(env_file=str(empty_env_file))
-
-        assert "CHUNK_OVERLAP must be an integer" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        "name, value, match",
+        [
+            pytest.param(
+                "ollama_base_url", "localhost:11434",
+                r"must start with http:// or https://",
+                id="ollama_base_url_without_protocol",
+            ),
+            pytest.param(
+                "ollama_base_url", "ftp://localhost:11434",
+                r"must start with http:// or https://",
+                id="ollama_base_url_with_invalid_protocol",
+            ),
+            pytest.param(
+                "ollama_llm_model", "   ",
+                "OLLAMA_LLM_MODEL cannot be empty",
+                id="empty_ollama_llm_model",
+            ),
+            pytest.param(
+                "ollama_embedding_model", "",
+                "OLLAMA_EMBEDDING_MODEL cannot be empty",
+                id="empty_ollama_embedding_model",
+            ),
+            pytest.param(
+                "chunk_size", "50", _CHUNK_SIZE_RANGE_RE,
+                id="chunk_size_too_small",
+            ),
+            pytest.param(
+                "chunk_size", "20000", _CHUNK_SIZE_RANGE_RE,
+                id="chunk_size_too_large",
+            ),
+            pytest.param(
+                "chunk_overlap", "-10", "CHUNK_OVERLAP must be >=",
+                id="chunk_overlap_negative",
+            ),
+            pytest.param(
+                "log_level", "INVALID", "LOG_LEVEL must be one of",
+                id="invalid_log_level",
+            ),
+            pytest.param(
+                "chunk_size", "not_a_number", "CHUNK_SIZE must be an integer",
+                id="chunk_size_not_integer",
+            ),
+            pytest.param(
+                "chunk_overlap", "12.5", "CHUNK_OVERLAP must be an integer",
+                id="chunk_overlap_not_integer",
+            ),
+            pytest.param(
+                "multimodal_search_text_weight", "5.0", _TEXT_WEIGHT_RANGE_RE,
+                id="text_weight_too_large",
+            ),
+            pytest.param(
+                "multimodal_search_image_weight", "-3", _IMAGE_WEIGHT_RANGE_RE,
+                id="image_weight_negative",
+            ),
+        ],
+    )
+    def test_invalid_field(self, name, value, match):
+        """単一項目の不正な値でConfigErrorが発生し、メッセージに該当する設定名を含む"""
+        with pytest.raises(ConfigError, match=match):
+            Config.validate_field(name, value)
+
+    @pytest.mark.parametrize(
+        "key, value, match",
+        [
+            pytest.param(
+                "OLLAMA_BASE_URL", "localhost:11434",
+                r"must start with http:// or https://",
+                id="ollama_base_url_without_protocol",
+            ),
+            pytest.param(
+                "OLLAMA_LLM_MODEL", "   ", "OLLAMA_LLM_MODEL cannot be empty",
+                id="empty_ollama_llm_model",
+            ),
+            pytest.param(
+                "CHUNK_SIZE", "50", _CHUNK_SIZE_RANGE_RE,
+                id="chunk_size_too_small",
+            ),
+            pytest.param(
+                "CHUNK_OVERLAP", "-10", "CHUNK_OVERLAP must be >=",
+                id="chunk_overlap_negative",
+            ),
+            pytest.param(
+                "CHUNK_SIZE", "not_a_number", "CHUNK_SIZE must be an integer",
+                id="chunk_size_not_integer",
+            ),
+            pytest.param(
+                "LOG_LEVEL", "INVALID", "LOG_LEVEL must be one of",
+                id="invalid_log_level",
+            ),
+            pytest.param(
+                "MAX_IMAGE_SIZE_MB", "0", "MAX_IMAGE_SIZE_MB must be greater than 0",
+                id="max_image_size_not_positive",
+            ),
+            pytest.param(
+                "IMAGE_RESIZE_MAX_WIDTH", "0", "IMAGE_RESIZE_MAX_WIDTH must be greater than 0",
+                id="image_resize_width_not_positive",
+            ),
+            pytest.param(
+                "MULTIMODAL_SEARCH_TEXT_WEIGHT", "1.5", _TEXT_WEIGHT_RANGE_RE,
+                id="text_weight_too_large",
+            ),
+            pytest.param(
+                "VECTOR_DB_TYPE", "sqlite", "VECTOR_DB_TYPE must be one of",
+                id="invalid_vector_db_type",
+            ),
+        ],
+    )
+    def test_invalid_environment_value(self, clean_env, monkeypatch, key, value, match):
+        """環境変数の値が不正な場合、Configの作成時にConfigErrorが発生"""
+        monkeypatch.setenv(key, value)
+
+        with pytest.raises(ConfigError, match=match):
+            Config(env_file=clean_env)
+
+    @pytest.mark.parametrize(
+        "name, value",
+        [
+            ("chunk_size", 500),
+            # デフォルトのCHUNK_OVERLAP(200)より小さいが、単独では正しい値
+            ("chunk_size", 150),
+            ("chunk_overlap", 0),
+            # 合計はConfig作成時にのみ検証する
+            ("multimodal_search_text_weight", 0.7),
+            ("log_level", "debug"),
+            ("vector_db_type", "Qdrant"),
+        ],
+    )
+    def test_validate_field_accepts_valid_value(self, name, value):
+        """正しい値の場合は他の項目のデフォルト値に関係なくConfigErrorが発生しない"""
+        Config.validate_field(name, value)
+
+    def test_validate_field_unknown_field(self):
+        """存在しない設定項目はConfigErrorになる"""
+        with pytest.raises(ConfigError, match="Unknown config field: no_such_field"):
+            Config.validate_field("no_such_field", "1")
+
+    @pytest.mark.parametrize(
+        "env, match",
+        [
+            pytest.param(
+                {"CHUNK_SIZE": "500", "CHUNK_OVERLAP": "500"},
+                _CHUNK_OVERLAP_LESS_THAN_RE,
+                id="chunk_overlap_equal_to_chunk_size",
+            ),
+            pytest.param(
+                {"CHUNK_SIZE": "500", "CHUNK_OVERLAP": "600"},
+                _CHUNK_OVERLAP_LESS_THAN_RE,
+                id="chunk_overlap_greater_than_chunk_size",
+            ),
+            pytest.param(
+                # 合計は1.0だが各重みが範囲外
+                {"MULTIMODAL_SEARCH_TEXT_WEIGHT": "1.5", "MULTIMODAL_SEARCH_IMAGE_WEIGHT": "-0.5"},
+                _TEXT_WEIGHT_RANGE_RE,
+                id="multimodal_weight_out_of_range",
+            ),
+            pytest.param(
+                {"MULTIMODAL_SEARCH_TEXT_WEIGHT": "0.7", "MULTIMODAL_SEARCH_IMAGE_WEIGHT": "0.5"},
+                r"must equal 1\.0",
+                id="multimodal_weights_must_sum_to_one",
+            ),
+        ],
+    )
+    def test_invalid_field_combination(self, clean_env, monkeypatch, env, match):
+        """複数項目の組み合わせが不正な場合、環境変数から読み込むとConfigErrorが発生"""
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+        with pytest.raises(ConfigError, match=match):
+            Config(env_file=clean_env)
+
+
+@pytest.fixture
+def singleton_reset():
+    """get_configのキャッシュ済みインスタンスをテスト前後でリセット
+
+    テスト中に作成したインスタンスが後続のテストに残らないようにします。
+    """
+    _build_config.cache_clear()
+    yield
+    _build_config.cache_clear()
 
 
 class TestGetConfigFunction:
     """get_config 関数のテスト"""
 
-    def test_singleton_pattern(self, monkeypatch):
+    def test_singleton_pattern(self, singleton_reset):
         """シングルトンパターンが機能することを確認"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # グローバルインスタンスをリセット
-        import src.utils.config as config_module
-        config_module._config_instance = None
-
         # 2回取得して同じインスタンスが返されることを確認
         config1 = get_config()
         config2 = get_config()
 
         assert config1 is config2
 
-    def test_reload_flag_reloads_config(self, monkeypatch):
+    def test_reload_flag_reloads_config(self, singleton_reset, monkeypatch):
         """reload=Trueで設定が再読み込みされることを確認"""
-        # 環境変数をクリア
-        for key in [
-            "OLLAMA_BASE_URL",
-            "OLLAMA_LLM_MODEL",
-            "OLLAMA_EMBEDDING_MODEL",
-            "CHROMA_PERSIST_DIRECTORY",
-            "CHUNK_SIZE",
-            "CHUNK_OVERLAP",
-            "LOG_LEVEL",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        # グローバルインスタンスをリセット
-        import src.utils.config as config_module
-        config_module._config_instance = None
-
         # 最初の設定を取得
         config1 = get_config()
         original_url = config1.ollama_base_url
@@ -3,9 +3,10 @@
 このモジュールはsrc/rag/document_processor.pyで定義されたDocumentProcessorクラスのテストを提供します。
 """
 
+import copy
 import pytest
 from pathlib import Path
-from unittest.mock import MagicMock, patch, mock_open
+from unittest.mock import mock_open
 import io
 
 from src.rag.document_processor import (
@@ -17,66 +18,114 @@ from src.models.document import Document
 from src.utils.config import Config
 
 
-@pytest.fixture
-def config():
-    """テスト用のConfig fixture。"""
+# テキスト分割テスト用の入力テキスト
+# 長めのテキスト（デフォルトのchunk_size=1000より大きい、1800文字程度）
+_LONG_JP_TEXT = "これはテストです。" * 200
+# 同一文字の長いテキスト（500文字）
+_LONG_A_TEXT = "あ" * 500
+# 数字の繰り返しテキスト（300文字）
+_LONG_DIGITS = "0123456789" * 30
+# 句点で区切られた日本語の文章
+_JP_SENTENCES = (
+    "これは最初の文です。これは2番目の文です。これは3番目の文です。"
+    "これは4番目の文です。これは5番目の文です。これは6番目の文です。"
+    "これは7番目の文です。これは8番目の文です。これは9番目の文です。"
+    "これは10番目の文です。"
+)
+
+# エラーハンドリングテスト用のファイル内容
+_SJIS_CONTENT = "これはShift_JISエンコーディングのファイルです。"
+_BAD_FILES = {
+    # 空ファイル
+    "empty.txt": b"",
+    # スペースのみの空ファイル
+    "empty.md": "   \n\n   ".encode("utf-8"),
+    # テキスト抽出できないPDF（PyPDF2はモックする）
+    "empty.pdf": b"%PDF-1.4 fake pdf",
+    # Shift_JISでエンコードされたファイル
+    "sjis.txt": _SJIS_CONTENT.encode("shift_jis"),
+    # Latin-1でエンコードした特殊文字（UTF-8/Shift_JISで読めない）
+    "invalid.txt": b"\xff\xfe\x00Invalid encoding",
+}
+
+
+@pytest.fixture(scope="session")
+def base_config():
+    """セッションで共有する読み取り専用のConfig fixture。"""
     return Config(env_file=None)
 
 
 @pytest.fixture
-def processor(config):
-    """テスト用のDocumentProcessor fixture。"""
-    return DocumentProcessor(config)
+def config(base_config):
+    """テスト用のConfig fixture（テスト内で変更できるよう共有設定を複製）。"""
+    return copy.copy(base_config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def processor(base_config):
+    """セッションで共有するDocumentProcessor fixture。
+
+    設定を変更するテストはconfig fixtureから個別にDocumentProcessorを作成すること。
+    """
+    return DocumentProcessor(base_config)
+
+
+@pytest.fixture(scope="session")
 def fixtures_dir():
-    """テストフィクスチャディレクトリのパス。"""
-    return Path(__file__).parent.parent / "fixtures"
+    """テストフィクスチャディレクトリの絶対パス（セッションで一度だけ解決）。"""
+    return (Path(__file__).parent.parent / "fixtures").resolve()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_txt_file(fixtures_dir):
     """サンプルTXTファイルのパス。"""
     return fixtures_dir / "sample.txt"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_md_file(fixtures_dir):
     """サンプルMDファイルのパス。"""
     return fixtures_dir / "sample.md"
 
 
+@pytest.fixture(scope="session")
+def bad_files(tmp_path_factory):
+    """エラーハンドリングテスト用のファイル（セッションで一度だけ作成）。
+
+    テストからは読み取りのみ行うこと。
+    """
+    bad_dir = tmp_path_factory.mktemp("bad_files")
+    files = {}
+    for name, data in _BAD_FILES.items():
+        path = bad_dir / name
+        path.write_bytes(data)
+        files[name] = path
+    return files
+
+
 @pytest.mark.unit
 class TestDocumentProcessorFileSupport:
     """DocumentProcessor - ファイル形式サポートのテスト（3.1）。"""
 
-    def test_is_supported_file_txt(self, processor):
-        """is_supported_file()でTXTファイルが正しく判定される。"""
-        txt_path = Path("/path/to/file.txt")
-        assert processor.is_supported_file(txt_path) is True
-
-    def test_is_supported_file_md(self, processor):
-        """is_supported_file()でMDファイルが正しく判定される。"""
-        md_path = Path("/path/to/file.md")
-        assert processor.is_supported_file(md_path) is True
-
-    def test_is_supported_file_pdf(self, processor):
-        """is_supported_file()でPDFファイルが正しく判定される。"""
-        pdf_path = Path("/path/to/file.pdf")
-        assert processor.is_supported_file(pdf_path) is True
-
-    def test_is_supported_file_case_insensitive(self, processor):
-        """is_supported_file()で大文字拡張子も正しく判定される。"""
-        assert processor.is_supported_file(Path("/path/to/FILE.TXT")) is True
-        assert processor.is_supported_file(Path("/path/to/FILE.MD")) is True
-        assert processor.is_supported_file(Path("/path/to/FILE.PDF")) is True
-
-    def test_is_supported_file_unsupported(self, processor):
-        """is_supported_file()でサポート外の形式がFalseを返す。"""
-        assert processor.is_supported_file(Path("/path/to/file.docx")) is False
-        assert processor.is_supported_file(Path("/path/to/file.jpg")) is False
-        assert processor.is_supported_file(Path("/path/to/file.csv")) is False
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/path/to/file.txt", True),
+            ("/path/to/file.md", True),
+            ("/path/to/file.pdf", True),
+            # 大文字拡張子
+            ("/path/to/FILE.TXT", True),
+            ("/path/to/FILE.MD", True),
+            ("/path/to/FILE.PDF", True),
+            # サポート外の形式
+            ("/path/to/file.docx", False),
+            ("/path/to/file.jpg", False),
+            ("/path/to/file.csv", False),
+        ],
+    )
+    def test_is_supported_file(self, processor, path, expected):
+        """is_supported_file()で拡張子（大文字小文字を区別しない）が正しく判定される。"""
+        assert processor.is_supported_file(Path(path)) is expected
 
     def test_load_txt_file(self, processor, sample_txt_file):
         """TXTファイルの読み込みが正常に動作する。"""
@@ -86,7 +135,7 @@ class TestDocumentProcessorFileSupport:
         assert isinstance(document, Document)
         assert document.name == "sample.txt"
         assert document.doc_type == "txt"
-        assert document.file_path == sample_txt_file.resolve()
+        assert document.file_path == sample_txt_file
         assert "テスト用のサンプルテキストファイル" in document.content
         assert len(document.content) > 0
 
@@ -103,7 +152,7 @@ class TestDocumentProcessorFileSupport:
         assert isinstance(document, Document)
         assert document.name == "sample.md"
         assert document.doc_type == "md"
-        assert document.file_path == sample_md_file.resolve()
+        assert document.file_path == sample_md_file
         assert "# サンプルMarkdown" in document.content
         assert "## セクション1" in document.content
         assert len(document.content) > 0
@@ -112,22 +161,16 @@ class TestDocumentProcessorFileSupport:
         assert "file_size" in document.metadata
         assert document.metadata["encoding"] == "utf-8"
 
-    def test_load_pdf_file(self, processor, tmp_path):
+    def test_load_pdf_file(self, processor, tmp_path, mock_pdf_reader):
         """PDFファイルの読み込みが正常に動作する（PyPDF2を使用）。"""
         # 一時的なPDFファイルを作成
         pdf_path = tmp_path / "test.pdf"
         pdf_path.write_bytes(b"%PDF-1.4 fake pdf content")
 
-        # PyPDF2のモックを使用
-        mock_page = MagicMock()
-        mock_page.extract_text.return_value = "これはPDFのテキストです。"
-
-        mock_reader = MagicMock()
-        mock_reader.pages = [mock_page, mock_page]
-
         # PyPDF2.PdfReaderをモック
-        with patch("PyPDF2.PdfReader", return_value=mock_reader):
-            document = processor.load_document(pdf_path)
+        mock_pdf_reader("これはPDFのテキストです。", n_pages=2)
+
+        document = processor.load_document(pdf_path)
 
         # アサーション
         assert isinstance(document, Document)
@@ -182,69 +225,42 @@ class TestDocumentProcessorErrorHandling:
 
         assert "ディレクトリではなくファイルを指定してください" in str(exc_info.value)
 
-    def test_load_empty_txt_file_raises_error(self, processor, tmp_path):
+    def test_load_empty_txt_file_raises_error(self, processor, bad_files):
         """空のTXTファイルでDocumentProcessorErrorがraiseされる。"""
-        # 空ファイルを作成
-        empty_file = tmp_path / "empty.txt"
-        empty_file.write_text("")
-
         with pytest.raises(DocumentProcessorError) as exc_info:
-            processor.load_document(empty_file)
+            processor.load_document(bad_files["empty.txt"])
 
         assert "ファイルが空です" in str(exc_info.value)
 
-    def test_load_empty_md_file_raises_error(self, processor, tmp_path):
-        """空のMDファイルでDocumentProcessorErrorがraiseされる。"""
-        # 空ファイルを作成（スペースのみ）
-        empty_file = tmp_path / "empty.md"
-        empty_file.write_text("   \n\n   ")
-
+    def test_load_empty_md_file_raises_error(self, processor, bad_files):
+        """空のMDファイル（スペースのみ）でDocumentProcessorErrorがraiseされる。"""
         with pytest.raises(DocumentProcessorError) as exc_info:
-            processor.load_document(empty_file)
+            processor.load_document(bad_files["empty.md"])
 
         assert "ファイルが空です" in str(exc_info.value)
 
-    def test_load_empty_pdf_raises_error(self, processor, tmp_path):
+    def test_load_empty_pdf_raises_error(self, processor, bad_files, mock_pdf_reader):
         """空のPDFファイルでDocumentProcessorErrorがraiseされる。"""
-        # 空のPDFファイル（テキスト抽出できない）をモック
-        empty_pdf = tmp_path / "empty.pdf"
-        empty_pdf.write_bytes(b"%PDF-1.4 fake pdf")
-
         # PyPDF2のモック：空のテキストを返す
-        mock_page = MagicMock()
-        mock_page.extract_text.return_value = "   "
+        mock_pdf_reader("   ")
 
-        mock_reader = MagicMock()
-        mock_reader.pages = [mock_page]
-
-        with patch("PyPDF2.PdfReader", return_value=mock_reader):
-            with pytest.raises(DocumentProcessorError) as exc_info:
-                processor.load_document(empty_pdf)
+        with pytest.raises(DocumentProcessorError) as exc_info:
+            processor.load_document(bad_files["empty.pdf"])
 
         assert "PDFからテキストを抽出できませんでした" in str(exc_info.value)
 
-    def test_load_invalid_encoding_utf8_fallback_to_shift_jis(self, processor, tmp_path):
+    def test_load_invalid_encoding_utf8_fallback_to_shift_jis(self, processor, bad_files):
         """不正なエンコーディングのファイルでShift_JISフォールバックが動作する。"""
-        # Shift_JISでエンコードされたファイルを作成
-        sjis_file = tmp_path / "sjis.txt"
-        sjis_content = "これはShift_JISエンコーディングのファイルです。"
-        sjis_file.write_bytes(sjis_content.encode('shift_jis'))
-
         # ファイルの読み込み（UTF-8で失敗 → Shift_JISで成功）
-        document = processor.load_document(sjis_file)
+        document = processor.load_document(bad_files["sjis.txt"])
 
         assert isinstance(document, Document)
-        assert sjis_content in document.content
+        assert _SJIS_CONTENT in document.content
 
-    def test_load_invalid_encoding_both_fail_raises_error(self, processor, tmp_path):
+    def test_load_invalid_encoding_both_fail_raises_error(self, processor, bad_files):
         """UTF-8とShift_JIS両方で読めないファイルでDocumentProcessorErrorがraiseされる。"""
-        # 不正なエンコーディングのファイルを作成
-        invalid_file = tmp_path / "invalid.txt"
-        # Latin-1でエンコードした特殊文字（UTF-8/Shift_JISで読めない）
-        invalid_file.write_bytes(b'\xff\xfe\x00Invalid encoding')
-
         with pytest.raises(DocumentProcessorError) as exc_info:
-            processor.load_document(invalid_file)
+            processor.load_document(bad_files["invalid.txt"])
 
         assert "エンコーディングを認識できません" in str(exc_info.value)
 
@@ -255,10 +271,8 @@ class TestDocumentProcessorTextSplitting:
 
     def test_split_text_creates_chunks(self, processor):
         """split_text()で正しくチャンクに分割される。"""
-        # 長めのテキストを用意（デフォルトのchunk_size=1000より大きくする）
-        text = "これはテストです。" * 200  # 1800文字程度
-
-        chunks = processor.split_text(text)
+        # 長めのテキスト（デフォルトのchunk_size=1000より大きい）を分割
+        chunks = processor.split_text(_LONG_JP_TEXT)
 
         # チャンクが作成されることを確認
         assert isinstance(chunks, list)
@@ -273,10 +287,8 @@ class TestDocumentProcessorTextSplitting:
         config.chunk_overlap = 20
         processor = DocumentProcessor(config)
 
-        # 長いテキスト（500文字）
-        text = "あ" * 500
-
-        chunks = processor.split_text(text)
+        # 長いテキスト（500文字）を分割
+        chunks = processor.split_text(_LONG_A_TEXT)
 
         # 各チャンクのサイズを確認
         for chunk in chunks:
@@ -290,10 +302,8 @@ class TestDocumentProcessorTextSplitting:
         config.chunk_overlap = 20
         processor = DocumentProcessor(config)
 
-        # 長いテキスト（300文字）
-        text = "0123456789" * 30  # 300文字
-
-        chunks = processor.split_text(text)
+        # 長いテキスト（300文字）を分割
+        chunks = processor.split_text(_LONG_DIGITS)
 
         # 少なくとも2つのチャンクがあることを確認
         assert len(chunks) >= 2
@@ -311,20 +321,13 @@ class TestDocumentProcessorTextSplitting:
 
     def test_split_japanese_text_with_period_separator(self, config):
         """日本語テキストの分割（separators: "。"）が正しく動作する。"""
-        # 日本語の文章（句点で区切られている）
-        text = (
-            "これは最初の文です。これは2番目の文です。これは3番目の文です。"
-            "これは4番目の文です。これは5番目の文です。これは6番目の文です。"
-            "これは7番目の文です。これは8番目の文です。これは9番目の文です。"
-            "これは10番目の文です。"
-        )
-
         # 小さめのchunk_sizeで分割
         config.chunk_size = 100
         config.chunk_overlap = 20
         processor = DocumentProcessor(config)
 
-        chunks = processor.split_text(text)
+        # 句点で区切られた日本語の文章を分割
+        chunks = processor.split_text(_JP_SENTENCES)
 
         # チャンクが作成されることを確認
         assert len(chunks) > 0
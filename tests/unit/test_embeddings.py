@@ -18,7 +18,7 @@ from src.utils.config import Config
 class TestEmbeddingGeneratorInitialization:
     """EmbeddingGenerator - 初期化のテスト"""
 
-    def test_initialization_with_default_config(self, monkeypatch, tmp_path):
+    def test_initialization_with_default_config(self, monkeypatch, empty_env_file):
         """デフォルト設定での初期化"""
         # 環境変数をクリアしてデフォルト値を使用
         for key in [
@@ -32,17 +32,13 @@ class TestEmbeddingGeneratorInitialization:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
         # OllamaEmbeddingsのモック
         with patch("src.rag.embeddings.OllamaEmbeddings") as mock_ollama:
             mock_embeddings_instance = Mock()
             mock_ollama.return_value = mock_embeddings_instance
 
             # Config を明示的に作成
-            config = Config(env_file=str(empty_env_file))
+            config = Config(env_file=empty_env_file)
             generator = EmbeddingGenerator(config=config)
 
             # デフォルト設定値の確認
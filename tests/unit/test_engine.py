@@ -19,7 +19,7 @@ from src.models.document import SearchResult, Chunk
 class TestRAGEngineInitialization:
     """RAGEngine - 初期化のテスト"""
 
-    def test_initialization_with_default_config(self, monkeypatch, tmp_path):
+    def test_initialization_with_default_config(self, monkeypatch, empty_env_file):
         """デフォルト設定での初期化（モック）"""
         # 環境変数をクリアしてデフォルト値を使用
         for key in [
@@ -33,10 +33,6 @@ class TestRAGEngineInitialization:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
         # 各コンポーネントのモック
         with patch("src.rag.engine.create_vector_store") as mock_vector_store_cls, \
              patch("src.rag.engine.EmbeddingGenerator") as mock_embedding_cls, \
@@ -51,7 +47,7 @@ class TestRAGEngineInitialization:
             mock_llm_cls.return_value = mock_llm
 
             # Config を明示的に作成
-            config = Config(env_file=str(empty_env_file))
+            config = Config(env_file=empty_env_file)
             engine = RAGEngine(config=config)
 
             # 初期化の確認
@@ -107,7 +103,7 @@ class TestRAGEngineInitialization:
                 base_url="http://custom:11434"
             )
 
-    def test_initialization_with_custom_llm_model(self, monkeypatch, tmp_path):
+    def test_initialization_with_custom_llm_model(self, monkeypatch, empty_env_file):
         """カスタムLLMモデル名での初期化"""
         # 環境変数をクリア
         for key in [
@@ -121,9 +117,6 @@ class TestRAGEngineInitialization:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
         custom_llm_model = "llama3.3"
 
         # 各コンポーネントのモック
@@ -135,7 +128,7 @@ class TestRAGEngineInitialization:
             mock_embedding_cls.return_value = Mock()
             mock_llm_cls.return_value = Mock()
 
-            config = Config(env_file=str(empty_env_file))
+            config = Config(env_file=empty_env_file)
             engine = RAGEngine(config=config, llm_model=custom_llm_model)
 
             # カスタムLLMモデルが使用されていることを確認
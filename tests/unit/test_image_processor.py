@@ -181,6 +181,17 @@ class TestImageProcessor:
         assert all(isinstance(img, ImageDocument) for img in images)
         assert all(img.image_type in ["jpg", "png"] for img in images)
 
+    def test_load_images_from_directory_parallel(self, mock_vision_embeddings, multimodal_config):
+        """ディレクトリから画像を並列に一括読み込みするテスト"""
+        mock_vision_embeddings.generate_caption.return_value = "テスト画像"
+
+        processor = ImageProcessor(mock_vision_embeddings, multimodal_config)
+        serial = processor.load_images_from_directory("tests/fixtures/images")
+        parallel = processor.load_images_from_directory("tests/fixtures/images", max_workers=4)
+
+        assert [img.file_path for img in parallel] == [img.file_path for img in serial]
+        assert all(img.caption == "テスト画像" for img in parallel)
+
     def test_load_images_from_directory_not_found(self, mock_vision_embeddings, multimodal_config):
         """存在しないディレクトリのテスト"""
         processor = ImageProcessor(mock_vision_embeddings, multimodal_config)
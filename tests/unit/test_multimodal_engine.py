@@ -20,7 +20,7 @@ from src.models.document import SearchResult, Chunk, ChatMessage
 class TestMultimodalRAGEngineInitialization:
     """MultimodalRAGEngine - 初期化のテスト"""
 
-    def test_initialization_with_default_config(self, monkeypatch, tmp_path):
+    def test_initialization_with_default_config(self, monkeypatch, empty_env_file):
         """デフォルト設定での初期化（モック）"""
         # 環境変数をクリア
         for key in [
@@ -31,10 +31,6 @@ class TestMultimodalRAGEngineInitialization:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
         # 各コンポーネントのモック
         with patch("src.rag.multimodal_engine.create_vector_store") as mock_vector_store_cls, \
              patch("src.rag.multimodal_engine.EmbeddingGenerator") as mock_embedding_cls, \
@@ -57,7 +53,7 @@ class TestMultimodalRAGEngineInitialization:
             mock_ollama_client_cls.return_value = mock_ollama_client
 
             # Config を明示的に作成
-            config = Config(env_file=str(empty_env_file))
+            config = Config(env_file=empty_env_file)
             engine = MultimodalRAGEngine(config=config)
 
             # 初期化の確認
@@ -102,11 +98,9 @@ class TestMultimodalRAGEngineInitialization:
             assert engine.vision_embeddings == custom_vision_embeddings
             assert engine.llm_model == "gemma3"
 
-    def test_initialization_fails_when_model_not_available(self, tmp_path):
+    def test_initialization_fails_when_model_not_available(self, empty_env_file):
         """モデルが利用できない場合に初期化が失敗する"""
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         with patch("src.rag.multimodal_engine.create_vector_store"), \
              patch("src.rag.multimodal_engine.EmbeddingGenerator"), \
@@ -572,11 +566,9 @@ class TestMultimodalRAGEngineUtilities:
 class TestCreateMultimodalRAGEngine:
     """create_multimodal_rag_engine 関数のテスト"""
 
-    def test_create_multimodal_rag_engine_default(self, tmp_path):
+    def test_create_multimodal_rag_engine_default(self, empty_env_file):
         """デフォルト設定でエンジンを作成"""
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         with patch("src.rag.multimodal_engine.create_vector_store"), \
              patch("src.rag.multimodal_engine.EmbeddingGenerator"), \
@@ -594,11 +586,9 @@ class TestCreateMultimodalRAGEngine:
             assert isinstance(engine, MultimodalRAGEngine)
             assert engine.config == config
 
-    def test_create_multimodal_rag_engine_with_custom_model(self, tmp_path):
+    def test_create_multimodal_rag_engine_with_custom_model(self, empty_env_file):
         """カスタムモデルでエンジンを作成"""
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         with patch("src.rag.multimodal_engine.create_vector_store"), \
              patch("src.rag.multimodal_engine.EmbeddingGenerator"), \
@@ -16,7 +16,7 @@ from src.utils.config import Config
 class TestVectorStoreInitialization:
     """VectorStore - 初期化のテスト"""
 
-    def test_vector_store_instance_creation(self, monkeypatch, tmp_path):
+    def test_vector_store_instance_creation(self, monkeypatch, empty_env_file):
         """VectorStoreインスタンスの作成"""
         # 環境変数をクリア
         for key in [
@@ -30,12 +30,8 @@ class TestVectorStoreInitialization:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
         # Config を作成
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # VectorStoreインスタンスの作成
         vector_store = ChromaVectorStore(
@@ -49,7 +45,7 @@ class TestVectorStoreInitialization:
         assert vector_store.client is None  # 初期化前はNone
         assert vector_store.collection is None  # 初期化前はNone
 
-    def test_initialize_creates_client_and_collection(self, monkeypatch, tmp_path):
+    def test_initialize_creates_client_and_collection(self, monkeypatch, tmp_path, empty_env_file):
         """initialize()でChromaDBクライアントとコレクションが初期化される（モック）"""
         # 環境変数をクリア
         for key in [
@@ -67,11 +63,7 @@ class TestVectorStoreInitialization:
         chroma_dir = tmp_path / "chroma_db"
         monkeypatch.setenv("CHROMA_PERSIST_DIRECTORY", str(chroma_dir))
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -107,7 +99,51 @@ class TestVectorStoreInitialization:
             # ディレクトリが作成されたことを確認
             assert chroma_dir.exists()
 
-    def test_initialize_failure_raises_vector_store_error(self, monkeypatch, tmp_path):
+    def test_initialize_in_memory_uses_ephemeral_client(self, tmp_path):
+        """in_memory=Trueの場合はEphemeralClientを使用し、ディレクトリを作成しない（モック）"""
+        chroma_dir = tmp_path / "chroma_db"
+        config = Config(overrides={"CHROMA_PERSIST_DIRECTORY": str(chroma_dir)})
+
+        with patch("src.rag.vector_store.chroma_store.chromadb.EphemeralClient") as mock_ephemeral, \
+                patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_persistent, \
+                patch("src.rag.vector_store.chroma_store.chromadb.AdminClient") as mock_admin:
+            mock_client = Mock()
+            mock_collection = Mock()
+            mock_collection.count.return_value = 0
+            mock_client.get_or_create_collection.return_value = mock_collection
+            mock_ephemeral.return_value = mock_client
+
+            vector_store = ChromaVectorStore(config=config, in_memory=True)
+            vector_store.initialize()
+
+            assert vector_store.client == mock_client
+            assert vector_store.collection == mock_collection
+            mock_persistent.assert_not_called()
+            assert not chroma_dir.exists()
+
+            # インスタンス専用のデータベースを作成してクライアントに渡す
+            database = mock_admin.return_value.create_database.call_args.args[0]
+            assert mock_ephemeral.call_args.kwargs["database"] == database
+
+            # クローズ時は専用データベースのみ削除する
+            vector_store.close()
+            mock_admin.return_value.delete_database.assert_called_once_with(database)
+            mock_client.delete_collection.assert_not_called()
+            mock_client.reset.assert_not_called()
+            assert vector_store.client is None
+
+    def test_config_chroma_in_memory_enables_in_memory(self, tmp_path):
+        """設定のchroma_in_memoryが有効な場合はin_memoryとして動作する"""
+        config = Config(overrides={
+            "CHROMA_PERSIST_DIRECTORY": str(tmp_path / "chroma_db"),
+            "CHROMA_IN_MEMORY": "true",
+        })
+
+        vector_store = ChromaVectorStore(config=config)
+
+        assert vector_store.in_memory is True
+
+    def test_initialize_failure_raises_vector_store_error(self, monkeypatch, empty_env_file):
         """初期化失敗時にVectorStoreErrorがraise（モック）"""
         # 環境変数をクリア
         for key in [
@@ -121,11 +157,7 @@ class TestVectorStoreInitialization:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # PersistentClientの初期化時に例外を発生させる
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -146,7 +178,7 @@ class TestVectorStoreInitialization:
 class TestVectorStoreAddDocuments:
     """VectorStore - ドキュメント追加のテスト"""
 
-    def test_add_documents_successfully(self, monkeypatch, tmp_path):
+    def test_add_documents_successfully(self, monkeypatch, empty_env_file):
         """add_documents()で正しくChunkが追加される（モック）"""
         # 環境変数をクリア
         for key in [
@@ -160,11 +192,7 @@ class TestVectorStoreAddDocuments:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -233,7 +261,7 @@ class TestVectorStoreAddDocuments:
             assert len(call_kwargs["metadatas"]) == 2
             assert call_kwargs["metadatas"][0]["document_name"] == "test.txt"
 
-    def test_add_documents_mismatched_lengths_raises_error(self, monkeypatch, tmp_path):
+    def test_add_documents_mismatched_lengths_raises_error(self, monkeypatch, empty_env_file):
         """chunksとembeddingsの長さが不一致でVectorStoreErrorがraise"""
         # 環境変数をクリア
         for key in [
@@ -247,11 +275,7 @@ class TestVectorStoreAddDocuments:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -293,7 +317,7 @@ class TestVectorStoreAddDocuments:
             error_message = str(exc_info.value)
             assert "チャンク数(1)と埋め込み数(2)が一致しません" in error_message
 
-    def test_add_documents_empty_list_logs_warning(self, monkeypatch, tmp_path, caplog):
+    def test_add_documents_empty_list_logs_warning(self, monkeypatch, caplog, empty_env_file):
         """空リストの追加で警告ログが出力される"""
         import logging
 
@@ -309,11 +333,7 @@ class TestVectorStoreAddDocuments:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -338,7 +358,7 @@ class TestVectorStoreAddDocuments:
             # collection.add()が呼ばれていないことを確認
             mock_collection.add.assert_not_called()
 
-    def test_add_documents_without_initialization_raises_error(self, monkeypatch, tmp_path):
+    def test_add_documents_without_initialization_raises_error(self, monkeypatch, empty_env_file):
         """コレクション未初期化でVectorStoreErrorがraise"""
         # 環境変数をクリア
         for key in [
@@ -352,11 +372,7 @@ class TestVectorStoreAddDocuments:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # VectorStoreの作成（初期化なし）
         vector_store = ChromaVectorStore(config=config)
@@ -387,7 +403,7 @@ class TestVectorStoreAddDocuments:
 class TestVectorStoreSearch:
     """VectorStore - 検索のテスト"""
 
-    def test_search_returns_correct_results(self, monkeypatch, tmp_path):
+    def test_search_returns_correct_results(self, monkeypatch, empty_env_file):
         """search()で正しいSearchResultリストが返される（モック）"""
         # 環境変数をクリア
         for key in [
@@ -401,11 +417,7 @@ class TestVectorStoreSearch:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -485,7 +497,7 @@ class TestVectorStoreSearch:
             assert call_kwargs['n_results'] == 3
             assert call_kwargs['include'] == ["documents", "metadatas", "distances"]
 
-    def test_search_with_where_filter(self, monkeypatch, tmp_path):
+    def test_search_with_where_filter(self, monkeypatch, empty_env_file):
         """whereフィルタが正しく適用される（モック）"""
         # 環境変数をクリア
         for key in [
@@ -499,11 +511,7 @@ class TestVectorStoreSearch:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -554,7 +562,7 @@ class TestVectorStoreSearch:
             call_kwargs = mock_collection.query.call_args.kwargs
             assert call_kwargs['where'] == where_filter
 
-    def test_search_with_n_results_parameter(self, monkeypatch, tmp_path):
+    def test_search_with_n_results_parameter(self, monkeypatch, empty_env_file):
         """n_resultsパラメータが機能する（モック）"""
         # 環境変数をクリア
         for key in [
@@ -568,11 +576,7 @@ class TestVectorStoreSearch:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -620,7 +624,7 @@ class TestVectorStoreSearch:
             call_kwargs = mock_collection.query.call_args.kwargs
             assert call_kwargs['n_results'] == 10
 
-    def test_search_returns_empty_list_when_no_results(self, monkeypatch, tmp_path):
+    def test_search_returns_empty_list_when_no_results(self, monkeypatch, empty_env_file):
         """検索結果が空の場合に空リストが返される（モック）"""
         # 環境変数をクリア
         for key in [
@@ -634,11 +638,7 @@ class TestVectorStoreSearch:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -668,7 +668,7 @@ class TestVectorStoreSearch:
             # 空のリストが返されることを確認
             assert results == []
 
-    def test_search_score_calculation(self, monkeypatch, tmp_path):
+    def test_search_score_calculation(self, monkeypatch, empty_env_file):
         """スコア計算（距離から類似度への変換）が正しい"""
         # 環境変数をクリア
         for key in [
@@ -682,11 +682,7 @@ class TestVectorStoreSearch:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -760,7 +756,7 @@ class TestVectorStoreSearch:
 class TestVectorStoreDelete:
     """VectorStore - 削除のテスト"""
 
-    def test_delete_by_document_id(self, monkeypatch, tmp_path):
+    def test_delete_by_document_id(self, monkeypatch, empty_env_file):
         """delete()でdocument_id指定による削除（モック）"""
         # 環境変数をクリア
         for key in [
@@ -774,11 +770,7 @@ class TestVectorStoreDelete:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -807,7 +799,7 @@ class TestVectorStoreDelete:
             # 削除件数が正しく返されることを確認
             assert deleted_count == 3
 
-    def test_delete_by_chunk_ids(self, monkeypatch, tmp_path):
+    def test_delete_by_chunk_ids(self, monkeypatch, empty_env_file):
         """delete()でchunk_ids指定による削除（モック）"""
         # 環境変数をクリア
         for key in [
@@ -821,11 +813,7 @@ class TestVectorStoreDelete:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -853,7 +841,7 @@ class TestVectorStoreDelete:
             # 削除件数が正しく返されることを確認
             assert deleted_count == 2
 
-    def test_delete_by_where_filter(self, monkeypatch, tmp_path):
+    def test_delete_by_where_filter(self, monkeypatch, empty_env_file):
         """delete()でwhereフィルタによる削除（モック）"""
         # 環境変数をクリア
         for key in [
@@ -867,11 +855,7 @@ class TestVectorStoreDelete:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -899,7 +883,7 @@ class TestVectorStoreDelete:
             # 削除件数が正しく返されることを確認
             assert deleted_count == 5
 
-    def test_delete_without_conditions_raises_error(self, monkeypatch, tmp_path):
+    def test_delete_without_conditions_raises_error(self, monkeypatch, empty_env_file):
         """削除条件未指定でVectorStoreErrorがraise"""
         # 環境変数をクリア
         for key in [
@@ -913,11 +897,7 @@ class TestVectorStoreDelete:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -940,7 +920,7 @@ class TestVectorStoreDelete:
             error_message = str(exc_info.value)
             assert "削除条件が指定されていません" in error_message
 
-    def test_delete_returns_correct_count(self, monkeypatch, tmp_path):
+    def test_delete_returns_correct_count(self, monkeypatch, empty_env_file):
         """削除件数が正しく返される（モック）"""
         # 環境変数をクリア
         for key in [
@@ -954,11 +934,7 @@ class TestVectorStoreDelete:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -989,7 +965,7 @@ class TestVectorStoreDelete:
 class TestVectorStoreOtherOperations:
     """VectorStore - その他操作のテスト"""
 
-    def test_list_documents(self, monkeypatch, tmp_path):
+    def test_list_documents(self, monkeypatch, empty_env_file):
         """list_documents()でドキュメント一覧が取得できる（モック）"""
         # 環境変数をクリア
         for key in [
@@ -1003,11 +979,7 @@ class TestVectorStoreOtherOperations:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -1092,7 +1064,7 @@ class TestVectorStoreOtherOperations:
             call_kwargs = mock_collection.get.call_args.kwargs
             assert call_kwargs['include'] == ["metadatas", "documents"]
 
-    def test_clear(self, monkeypatch, tmp_path):
+    def test_clear(self, monkeypatch, empty_env_file):
         """clear()で全データが削除される（モック）"""
         # 環境変数をクリア
         for key in [
@@ -1106,11 +1078,7 @@ class TestVectorStoreOtherOperations:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -1147,7 +1115,7 @@ class TestVectorStoreOtherOperations:
             # コレクションが再作成されたことを確認
             assert vector_store.collection == new_collection
 
-    def test_get_document_count(self, monkeypatch, tmp_path):
+    def test_get_document_count(self, monkeypatch, empty_env_file):
         """get_document_count()で正しいカウントが返される（モック）"""
         # 環境変数をクリア
         for key in [
@@ -1161,11 +1129,7 @@ class TestVectorStoreOtherOperations:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -1191,7 +1155,7 @@ class TestVectorStoreOtherOperations:
             # collection.count()が呼ばれたことを確認
             assert mock_collection.count.call_count == 2
 
-    def test_get_collection_info(self, monkeypatch, tmp_path):
+    def test_get_collection_info(self, monkeypatch, tmp_path, empty_env_file):
         """get_collection_info()でコレクション情報が取得できる（モック）"""
         # 環境変数をクリア
         for key in [
@@ -1209,11 +1173,7 @@ class TestVectorStoreOtherOperations:
         chroma_dir = tmp_path / "chroma_db"
         monkeypatch.setenv("CHROMA_PERSIST_DIRECTORY", str(chroma_dir))
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class:
@@ -1275,7 +1235,7 @@ class TestVectorStoreOtherOperations:
             assert str(chroma_dir) in info['persist_directory']
             assert info['metadata'] == {"description": "RAG application document store"}
 
-    def test_context_manager(self, monkeypatch, tmp_path):
+    def test_context_manager(self, monkeypatch, empty_env_file):
         """`with`文で初期化・クローズが自動実行される"""
         # 環境変数をクリア
         for key in [
@@ -1289,11 +1249,7 @@ class TestVectorStoreOtherOperations:
         ]:
             monkeypatch.delenv(key, raising=False)
 
-        # 空の.envファイルを作成
-        empty_env_file = tmp_path / "empty.env"
-        empty_env_file.write_text("")
-
-        config = Config(env_file=str(empty_env_file))
+        config = Config(env_file=empty_env_file)
 
         # ChromaDBのモック
         with patch("src.rag.vector_store.chroma_store.chromadb.PersistentClient") as mock_client_class: